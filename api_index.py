@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Multi-package API index of the flutter_it packages.
+
+Walks the whole `lib/` tree of every documented package (get_it, watch_it,
+command_it, listen_it), including `part` files and `src/` implementations,
+and builds one symbol table keyed by (package, container, member). Methods,
+getters, setters, operators and extension members are all indexed.
+
+The index is built once per run and shared by validation and update, so
+checking all four packages costs one scan of each package's sources.
+
+Usage:
+    index = build_api_index()
+    symbol = index.lookup('registerSingleton', package='get_it')
+    print(symbol.file, symbol.declaration.return_type)
+"""
+
+from dataclasses import astuple, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import profiling
+from dart_scanner import SCANNER_VERSION, Declaration, scan_declarations, scan_typedefs
+from dart_types import TypeCanonicalizer
+from line_index import LineIndex, Span, map_lines
+from signature_cache import SignatureCache
+
+# Packages checked out next to the docs repository
+PACKAGES_DIR = Path("..")
+PACKAGES = ('get_it', 'watch_it', 'command_it', 'listen_it')
+
+# Namespace for cached per-file declarations (one field list per declaration)
+INDEX_CACHE_NAMESPACE = f"index/{SCANNER_VERSION}.2"
+
+# (package, container, member); container is None for top-level members
+SymbolKey = Tuple[str, Optional[str], str]
+
+# Indexes shared by every tool run in this process, by resolved packages
+# directory (see enable_sharing); None while sharing is off
+_shared_indexes: Optional[Dict[Path, 'ApiIndex']] = None
+
+
+@dataclass(frozen=True)
+class Symbol:
+    """A declaration together with where it was found."""
+    package: str
+    file: Path
+    declaration: Declaration
+
+    @property
+    def key(self) -> SymbolKey:
+        return (self.package, self.declaration.container, member_name(self.declaration))
+
+    @property
+    def is_public(self) -> bool:
+        """True if neither the member nor its container is library-private."""
+        container = self.declaration.container
+        return not self.declaration.name.startswith('_') and not (container and container.startswith('_'))
+
+
+def member_name(decl: Declaration) -> str:
+    """Return the symbol-table member name (setters are spelled `name=`)."""
+    return decl.name + '=' if decl.kind == 'setter' else decl.name
+
+
+class ApiIndex:
+    """Symbol table over the sources of one or more packages."""
+
+    def __init__(self):
+        self.symbols: Dict[SymbolKey, Symbol] = {}
+        self.by_name: Dict[str, List[Symbol]] = {}
+        self.files: Dict[str, List[Path]] = {}
+        self.missing_packages: List[str] = []
+        self._texts: Dict[Path, str] = {}
+        self._lines: Dict[Path, LineIndex] = {}
+        self._declarations: Dict[Path, Tuple[str, List[Declaration]]] = {}
+        self._canonicalizers: Dict[str, TypeCanonicalizer] = {}
+
+    def add_declarations(self, package: str, file: Path, declarations: Iterable[Declaration]):
+        """Add the declarations of one source file."""
+        declarations = list(declarations)
+        self._declarations[file] = (package, declarations)
+        self.files.setdefault(package, []).append(file)
+        self._add_symbols(package, file, declarations)
+
+    def _add_symbols(self, package: str, file: Path, declarations: List[Declaration]):
+        for decl in declarations:
+            symbol = Symbol(package=package, file=file, declaration=decl)
+            # The first declaration wins (an abstract API class is declared
+            # before the implementation that overrides it)
+            self.symbols.setdefault(symbol.key, symbol)
+            self.by_name.setdefault(decl.name, []).append(symbol)
+
+    def declarations_in(self, file: Path) -> List[Declaration]:
+        """Return the declarations indexed for one source file."""
+        entry = self._declarations.get(file)
+        return entry[1] if entry else []
+
+    def replace_file(self, package: str, file: Path, declarations: Optional[Iterable[Declaration]]):
+        """
+        Replace the declarations of one file (None removes the file).
+
+        The symbol tables are rebuilt in the original file order, so lookups
+        resolve exactly as they would after a full rebuild.
+        """
+        self._texts.pop(file, None)
+        self._lines.pop(file, None)
+        self._canonicalizers.pop(package, None)
+        if declarations is None:
+            self._declarations.pop(file, None)
+        else:
+            self._declarations[file] = (package, list(declarations))
+
+        self.symbols = {}
+        self.by_name = {}
+        self.files = {}
+        for indexed_file, (indexed_package, decls) in self._declarations.items():
+            self.files.setdefault(indexed_package, []).append(indexed_file)
+            self._add_symbols(indexed_package, indexed_file, decls)
+
+    def get(self, package: str, container: Optional[str], member: str) -> Optional[Symbol]:
+        """Exact lookup by (package, container, member)."""
+        return self.symbols.get((package, container, member))
+
+    def lookup(self, name: str, package: Optional[str] = None,
+               kinds: Tuple[str, ...] = ('method',)) -> Optional[Symbol]:
+        """
+        Find the public declaration of `name`, optionally within one package.
+
+        Members of private classes (such as `_GetItImplementation`) are only
+        implementations of the public API and are never returned.
+        """
+        for symbol in self.by_name.get(name, ()):
+            if package is not None and symbol.package != package:
+                continue
+            if symbol.declaration.kind in kinds and symbol.is_public:
+                return symbol
+        return None
+
+    def public_symbols(self, package: Optional[str] = None,
+                       kinds: Tuple[str, ...] = ('method',)) -> Iterator[Symbol]:
+        """Yield public symbols in indexing order, optionally for one package."""
+        for symbol in self.symbols.values():
+            if package is not None and symbol.package != package:
+                continue
+            if symbol.declaration.kind in kinds and symbol.is_public:
+                yield symbol
+
+    def type_canonicalizer(self, package: str) -> TypeCanonicalizer:
+        """Return a type canonicalizer that expands the package's typedefs (built once)."""
+        canonicalizer = self._canonicalizers.get(package)
+        if canonicalizer is None:
+            typedefs = [
+                typedef
+                for file in self.files.get(package, [])
+                for typedef in scan_typedefs(self.source_text(file))
+            ]
+            canonicalizer = self._canonicalizers[package] = TypeCanonicalizer(typedefs)
+        return canonicalizer
+
+    def source_text(self, file: Path) -> str:
+        """Return the text of an indexed file (read once, then memoized)."""
+        text = self._texts.get(file)
+        if text is None:
+            with open(file, 'r', encoding='utf-8') as f:
+                text = f.read()
+            self._texts[file] = text
+        return text
+
+    def source_span(self, symbol: Symbol) -> Span:
+        """Return where a symbol is declared (the file's line index is built once)."""
+        lines = self._lines.get(symbol.file)
+        if lines is None:
+            lines = self._lines[symbol.file] = map_lines(symbol.file)
+        decl = symbol.declaration
+        return lines.span(str(symbol.file), decl.start, decl.end)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+
+def package_lib_dir(package: str, packages_dir: Path = PACKAGES_DIR) -> Path:
+    """Return the `lib/` directory of a package checkout."""
+    return packages_dir / package / "lib"
+
+
+def scan_source_file(file: Path, cache: Optional[SignatureCache]) -> List[Declaration]:
+    """Scan one source file, using the cache when possible."""
+    with profiling.phase('read', file):
+        with open(file, 'rb') as f:
+            raw = f.read()
+        profiling.add_bytes(len(raw))
+
+    if cache is not None:
+        cached = cache.get(raw)
+        if cached is not None:
+            return [Declaration(*fields) for fields in cached]
+
+    with profiling.phase('scan', file):
+        declarations = list(scan_declarations(raw.decode('utf-8')))
+
+    if cache is not None:
+        cache.put(raw, [astuple(decl) for decl in declarations])
+
+    return declarations
+
+
+def build_api_index(
+    packages: Iterable[str] = PACKAGES,
+    packages_dir: Path = PACKAGES_DIR,
+    cache: Optional[SignatureCache] = None,
+) -> ApiIndex:
+    """
+    Index the `lib/` tree of every package that is checked out.
+
+    Files are visited in sorted order, so the package's main library file
+    (e.g. `lib/get_it.dart`) is indexed before `part` files and `src/`.
+    Packages that are not checked out are skipped and listed in
+    `index.missing_packages`. Pass a cache created with
+    INDEX_CACHE_NAMESPACE to skip re-scanning unchanged files.
+
+    After `enable_sharing()`, the first call indexes all of PACKAGES and
+    later calls for the same packages directory return that index.
+    """
+    if _shared_indexes is not None:
+        key = Path(packages_dir).resolve()
+        if key not in _shared_indexes:
+            _shared_indexes[key] = _build(tuple(dict.fromkeys((*PACKAGES, *packages))), packages_dir, cache)
+        return _shared_indexes[key]
+    return _build(packages, packages_dir, cache)
+
+
+def enable_sharing():
+    """
+    Share one index per packages directory between all callers in this process.
+
+    For running several tools in one process (see maintain.py); the shared
+    index must not be modified, e.g. by watch mode.
+    """
+    global _shared_indexes
+    if _shared_indexes is None:
+        _shared_indexes = {}
+
+
+def _build(packages: Iterable[str], packages_dir: Path, cache: Optional[SignatureCache]) -> ApiIndex:
+    index = ApiIndex()
+
+    for package in packages:
+        lib_dir = package_lib_dir(package, packages_dir)
+        if not lib_dir.exists():
+            index.missing_packages.append(package)
+            continue
+        index_package(index, package, lib_dir, cache)
+
+    return index
+
+
+def index_package(index: ApiIndex, package: str, lib_dir: Path, cache: Optional[SignatureCache] = None):
+    """
+    Add every file of one package's `lib/` tree to `index`.
+
+    `lib_dir` may be any copy of the package, e.g. an unpacked release in
+    the pub cache.
+    """
+    main_library = lib_dir / f"{package}.dart"
+    files = sorted(lib_dir.rglob("*.dart"), key=lambda f: (f != main_library, f))
+
+    for file in files:
+        index.add_declarations(package, file, scan_source_file(file, cache))
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+SQLite store of code sample baselines, with snapshot history.
+
+Every `update_baseline.py` run that changes anything adds a snapshot. A
+snapshot maps each (file, region) to the hash of its body; bodies are stored
+once per distinct content (zlib-compressed, keyed by SHA-256), so an
+unchanged region costs one small row per snapshot no matter how often it is
+recorded. File and region names are interned in their own table, which keeps
+snapshot rows at three integers.
+
+    snapshots  id, created_at, label, git_commit
+    paths      id, file, region               (unique file, region)
+    bodies     id, hash, body                 (unique hash)
+    regions    snapshot, path, body           (primary key snapshot, path;
+                                               indexed by path, snapshot)
+    files      file, size, mtime_ns, sha256   (fingerprints of the latest run)
+
+The `region_hashes` view spells out (snapshot, file, region, hash) for
+ad-hoc queries with the sqlite3 shell.
+
+Usage:
+    with BaselineStore(Path("baseline.db")) as store:
+        store.add_snapshot(code_samples, manifest, label="before refactor")
+        for snapshot, body in store.region_history("async_objects.dart", "example", last=5):
+            print(snapshot.id, snapshot.created_at, body is not None)
+"""
+
+import hashlib
+import sqlite3
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Bump when the schema changes; stores of another version are refused
+STORE_VERSION = 1
+
+# Output files with these suffixes are SQLite stores, anything else is JSON
+STORE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    label TEXT,
+    git_commit TEXT
+);
+CREATE TABLE IF NOT EXISTS paths (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL,
+    region TEXT NOT NULL,
+    UNIQUE (file, region)
+);
+CREATE TABLE IF NOT EXISTS bodies (
+    id INTEGER PRIMARY KEY,
+    hash BLOB NOT NULL UNIQUE,
+    body BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS regions (
+    snapshot INTEGER NOT NULL REFERENCES snapshots (id),
+    path INTEGER NOT NULL REFERENCES paths (id),
+    body INTEGER NOT NULL REFERENCES bodies (id),
+    PRIMARY KEY (snapshot, path)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS regions_by_path ON regions (path, snapshot);
+CREATE TABLE IF NOT EXISTS files (
+    file TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE VIEW IF NOT EXISTS region_hashes AS
+    SELECT regions.snapshot, paths.file, paths.region, lower(hex(bodies.hash)) AS hash
+    FROM regions
+    JOIN paths ON paths.id = regions.path
+    JOIN bodies ON bodies.id = regions.body;
+"""
+
+
+class StoreError(RuntimeError):
+    """The store cannot be opened (not a database, newer schema, ...)."""
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One recorded baseline."""
+    id: int
+    created_at: str
+    label: Optional[str] = None
+    git_commit: Optional[str] = None
+
+
+def is_store_path(path: Path) -> bool:
+    """True if `path` names a SQLite store rather than a JSON baseline."""
+    return path.suffix in STORE_SUFFIXES
+
+
+def body_hash(body: str) -> bytes:
+    """Content address of a region body."""
+    return hashlib.sha256(body.encode('utf-8')).digest()
+
+
+class BaselineStore:
+    """Snapshot history of code sample regions in one SQLite file."""
+
+    def __init__(self, path: Path, read_only: bool = False):
+        """
+        Open the store, creating it unless `read_only`.
+
+        A read-only store must already exist; it is never written to.
+        """
+        self.path = path
+        try:
+            if read_only:
+                self.conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+            else:
+                self.conn = sqlite3.connect(path)
+            version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+            if version not in ((STORE_VERSION,) if read_only else (0, STORE_VERSION)):
+                raise StoreError(f"{path} has store version {version}, expected {STORE_VERSION}")
+            if not read_only:
+                with self.conn:
+                    self.conn.executescript(_SCHEMA)
+                    self.conn.execute(f'PRAGMA user_version = {STORE_VERSION}')
+        except sqlite3.DatabaseError as e:
+            raise StoreError(f"Cannot open baseline store {path}: {e}") from None
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> 'BaselineStore':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def snapshots(self, last: Optional[int] = None) -> List[Snapshot]:
+        """Return snapshots, newest first."""
+        rows = self.conn.execute(
+            'SELECT id, created_at, label, git_commit FROM snapshots ORDER BY id DESC LIMIT ?',
+            (-1 if last is None else last,),
+        )
+        return [Snapshot(*row) for row in rows]
+
+    def latest(self) -> Optional[Snapshot]:
+        """Return the newest snapshot, or None if the store is empty."""
+        snapshots = self.snapshots(last=1)
+        return snapshots[0] if snapshots else None
+
+    def load(self, snapshot: Optional[int] = None) -> Dict[str, Dict[str, str]]:
+        """Return {file: {region: body}} of a snapshot (default: the latest)."""
+        if snapshot is None:
+            latest = self.latest()
+            if latest is None:
+                return {}
+            snapshot = latest.id
+
+        code_samples: Dict[str, Dict[str, str]] = {}
+        rows = self.conn.execute(
+            'SELECT paths.file, paths.region, bodies.body FROM regions '
+            'JOIN paths ON paths.id = regions.path JOIN bodies ON bodies.id = regions.body '
+            'WHERE regions.snapshot = ? ORDER BY paths.file, paths.region',
+            (snapshot,),
+        )
+        for file, region, body in rows:
+            code_samples.setdefault(file, {})[region] = zlib.decompress(body).decode('utf-8')
+        return code_samples
+
+    def _hashes(self, snapshot: int) -> Dict[Tuple[str, str], bytes]:
+        rows = self.conn.execute(
+            'SELECT paths.file, paths.region, bodies.hash FROM regions '
+            'JOIN paths ON paths.id = regions.path JOIN bodies ON bodies.id = regions.body '
+            'WHERE regions.snapshot = ?',
+            (snapshot,),
+        )
+        return {(file, region): digest for file, region, digest in rows}
+
+    def manifest(self) -> Dict[str, Dict[str, object]]:
+        """Return the per-file fingerprints saved by the latest run."""
+        rows = self.conn.execute('SELECT file, size, mtime_ns, sha256 FROM files')
+        return {file: {'size': size, 'mtime_ns': mtime_ns, 'sha256': sha256}
+                for file, size, mtime_ns, sha256 in rows}
+
+    def _path_id(self, file: str, region: str) -> int:
+        self.conn.execute('INSERT OR IGNORE INTO paths (file, region) VALUES (?, ?)', (file, region))
+        return self.conn.execute('SELECT id FROM paths WHERE file = ? AND region = ?', (file, region)).fetchone()[0]
+
+    def _body_id(self, digest: bytes, body: str) -> int:
+        row = self.conn.execute('SELECT id FROM bodies WHERE hash = ?', (digest,)).fetchone()
+        if row is not None:
+            return row[0]
+        return self.conn.execute('INSERT INTO bodies (hash, body) VALUES (?, ?)',
+                                 (digest, zlib.compress(body.encode('utf-8'), 9))).lastrowid
+
+    def add_snapshot(self, code_samples: Dict[str, Dict[str, str]],
+                     manifest: Optional[Dict[str, Dict[str, object]]] = None,
+                     label: Optional[str] = None, git_commit: Optional[str] = None) -> Optional[Snapshot]:
+        """
+        Record `code_samples` as a new snapshot and replace the file manifest.
+
+        The manifest always describes the files of the latest snapshot, so
+        recording a snapshot without one (e.g. an imported JSON baseline)
+        clears it and the next run re-extracts every file. Returns None
+        without adding a snapshot when the regions are identical to the
+        latest snapshot and no `label` is given. Runs in one transaction.
+        """
+        hashes = {
+            (file, region): body_hash(body)
+            for file, regions in code_samples.items()
+            for region, body in regions.items()
+        }
+
+        with self.conn:
+            self.conn.execute('DELETE FROM files')
+            if manifest is not None:
+                self.conn.executemany(
+                    'INSERT INTO files (file, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)',
+                    [(file, entry['size'], entry['mtime_ns'], entry['sha256'])
+                     for file, entry in sorted(manifest.items())],
+                )
+
+            latest = self.latest()
+            if label is None and latest is not None and self._hashes(latest.id) == hashes:
+                return None
+
+            created_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+            snapshot_id = self.conn.execute(
+                'INSERT INTO snapshots (created_at, label, git_commit) VALUES (?, ?, ?)',
+                (created_at, label, git_commit),
+            ).lastrowid
+            self.conn.executemany(
+                'INSERT INTO regions (snapshot, path, body) VALUES (?, ?, ?)',
+                [
+                    (snapshot_id, self._path_id(file, region), self._body_id(digest, code_samples[file][region]))
+                    for (file, region), digest in sorted(hashes.items())
+                ],
+            )
+
+        return Snapshot(snapshot_id, created_at, label, git_commit)
+
+    def region_history(self, file: str, region: str, last: int = 10) -> List[Tuple[Snapshot, Optional[str]]]:
+        """
+        Return (snapshot, body) for the last `last` snapshots, newest first.
+
+        `body` is None in snapshots where the region did not exist. One
+        indexed lookup per snapshot via the (snapshot, path) primary key.
+        """
+        row = self.conn.execute('SELECT id FROM paths WHERE file = ? AND region = ?', (file, region)).fetchone()
+        path_id = row[0] if row is not None else -1
+        rows = self.conn.execute(
+            'SELECT s.id, s.created_at, s.label, s.git_commit, bodies.body FROM '
+            '(SELECT * FROM snapshots ORDER BY id DESC LIMIT ?) AS s '
+            'LEFT JOIN regions ON regions.snapshot = s.id AND regions.path = ? '
+            'LEFT JOIN bodies ON bodies.id = regions.body '
+            'ORDER BY s.id DESC',
+            (last, path_id),
+        )
+        return [
+            (Snapshot(*row[:4]), zlib.decompress(row[4]).decode('utf-8') if row[4] is not None else None)
+            for row in rows
+        ]
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Benchmark the maintenance tools on synthetic large inputs.
+
+The real get_it sources and code samples are small enough to hide quadratic
+behavior, so this script generates a synthetic Dart API (thousands of
+methods with long multi-line generic parameter lists) and a sample tree with
+thousands of region files, then times and memory-profiles each stage:
+
+    extract     dart_scanner.scan_declarations over the synthetic API
+    index       api_index.build_api_index over a synthetic package tree
+    parse       validate_signatures.parse_parameters for every method
+    compare     validate_signatures.compare_signatures of doc-style signatures
+                (simplified generics, renamed parameters, other type spacing)
+                against the source signatures, as validation compares them
+    baseline    update_baseline extraction + a snapshot in a new SQLite store
+
+Results are appended to a JSON history file. Each stage runs --repeat times;
+a stage whose fastest run is slower than the fastest run of the previous
+comparable run by more than the threshold fails the benchmark. Single runs
+are too noisy to gate on, so the gate needs at least 3 repeats.
+
+Usage:
+    python3 benchmark_tools.py [--methods N] [--files N] [--repeat N]
+                               [--history FILE] [--threshold FRACTION] [--quick]
+
+Options:
+    --methods N          Methods in the synthetic API (default: 10000)
+    --files N            Files in the synthetic sample tree (default: 2000)
+    --repeat N           Timed runs per stage (default: 3, at least 3 to gate)
+    --history FILE       JSON history file (default: benchmark_history.json)
+    --threshold FRACTION Allowed slowdown vs. the previous run (default: 0.25)
+    --quick              Small inputs for a fast smoke run
+"""
+
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from api_index import build_api_index
+from baseline_store import BaselineStore
+from dart_scanner import scan_declarations
+from update_baseline import extract_all_code_samples
+from validate_signatures import (
+    compare_signatures, make_signature, parse_parameters, signature_from_declaration,
+)
+
+DEFAULT_HISTORY = Path("benchmark_history.json")
+
+# Bump when a stage measures something else; runs of other versions are not compared
+BENCHMARK_VERSION = 2
+
+# Fewer timed runs than this are recorded but not gated
+MIN_GATE_REPEAT = 3
+
+_TYPES = [
+    'String', 'int', 'bool', 'double', 'Object', 'Type',
+    'Map<String, List<int>>', 'FutureOr<void> Function(T instance)',
+    'DisposingFunc<T>', 'Iterable<Type>', 'Future<Map<String, Object?>>',
+]
+
+
+def generate_dart_api(method_count: int, params_per_method: int = 12) -> str:
+    """Generate a Dart library with long multi-line generic signatures."""
+    lines = ["library synthetic_api;", "", "import 'dart:async';", ""]
+    methods_per_class = 500
+
+    for i in range(method_count):
+        if i % methods_per_class == 0:
+            if i:
+                lines.append("}")
+                lines.append("")
+            lines.append(f"abstract class SyntheticApi{i // methods_per_class} {{")
+
+        lines.append(f"  /// Synthetic method number {i}.")
+        lines.append(f"  Future<Map<String, List<T>>> method{i}<T extends Object, P{i} extends Comparable<P{i}>>(")
+        lines.append(f"    FactoryFuncParamAsync<T, P{i}, Object?> factoryFunc, {{")
+        for p in range(params_per_method):
+            param_type = _TYPES[(i + p) % len(_TYPES)]
+            lines.append(f"    {param_type}? param{p},")
+        lines.append("    bool ignoreReferenceCount = false,")
+        lines.append("  }) {")
+        lines.append(f"    final label = 'method{i} ( {{ ;';")
+        lines.append("    return Future.value({});")
+        lines.append("  }")
+        lines.append("")
+
+    if method_count:
+        lines.append("}")
+    return '\n'.join(lines) + '\n'
+
+
+def generate_sample_tree(base_dir: Path, file_count: int, regions_per_file: int = 2):
+    """Generate code_samples/lib/get_it with `file_count` region files."""
+    sample_dir = base_dir / "code_samples" / "lib" / "get_it"
+    sample_dir.mkdir(parents=True, exist_ok=True)
+
+    for i in range(file_count):
+        parts = ["import 'package:get_it/get_it.dart';", "", "final getIt = GetIt.instance;", ""]
+        for r in range(regions_per_file):
+            name = 'example' if r == 0 else f'region{r}'
+            parts.append(f"// #region {name}")
+            parts.append(f"void sample{i}_{r}() {{")
+            for line in range(10):
+                parts.append(f"  getIt.registerSingleton<Service{line}>(Service{line}(), instanceName: 'n{i}_{r}_{line}');")
+            parts.append("}")
+            parts.append(f"// #endregion {name}")
+            parts.append("")
+        (sample_dir / f"sample_{i:05d}.dart").write_text('\n'.join(parts), encoding='utf-8')
+
+
+def doc_signature(decl, i: int):
+    """
+    Build the signature a signature file would document for a declaration.
+
+    Every fourth method is copied verbatim; the others simplify the generic
+    bounds, rename a parameter or space a type differently, so comparisons
+    go through type canonicalization like real documentation does.
+    """
+    generic_params = decl.generic_params
+    params_text = decl.params_text
+    variant = i % 4
+    if variant == 1:
+        generic_params = generic_params.replace(' extends Object', '')
+    elif variant == 2:
+        params_text = params_text.replace('param0', 'value0')
+    elif variant == 3:
+        params_text = params_text.replace('Map<String, List<int>>', 'Map<String,List<int>>')
+    return make_signature(
+        name=decl.name,
+        return_type=decl.return_type,
+        generic_params=generic_params,
+        parameters=parse_parameters(params_text),
+    )
+
+
+def write_store(base_dir: Path, store_path: Path):
+    """Extract all samples and record them as the first snapshot of a new store."""
+    if store_path.exists():
+        store_path.unlink()
+    code_samples = _quiet(extract_all_code_samples, base_dir)
+    with BaselineStore(store_path) as store:
+        store.add_snapshot(code_samples)
+
+
+def measure(func: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Time `func` `repeat` times, then measure its peak memory once."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'median_s': round(statistics.median(timings), 6),
+        'min_s': round(min(timings), 6),
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+def run_benchmarks(method_count: int, file_count: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    """Generate the synthetic inputs and measure every stage."""
+    results = {}
+
+    with tempfile.TemporaryDirectory(prefix="bench_tools_") as tmp:
+        tmp_dir = Path(tmp)
+
+        print(f"Generating synthetic API with {method_count} methods...")
+        source = generate_dart_api(method_count)
+        package_lib = tmp_dir / "packages" / "get_it" / "lib"
+        package_lib.mkdir(parents=True)
+        (package_lib / "get_it.dart").write_text(source, encoding='utf-8')
+
+        print(f"Generating sample tree with {file_count} files...")
+        generate_sample_tree(tmp_dir, file_count)
+
+        declarations = list(scan_declarations(source))
+        index = build_api_index(('get_it',), tmp_dir / "packages")
+        types = index.type_canonicalizer('get_it')
+        pairs = [
+            (doc_signature(decl, i), signature_from_declaration(decl))
+            for i, decl in enumerate(declarations)
+        ]
+
+        stages = {
+            'extract': lambda: list(scan_declarations(source)),
+            'index': lambda: build_api_index(('get_it',), tmp_dir / "packages"),
+            'parse': lambda: [parse_parameters(decl.params_text) for decl in declarations],
+            'compare': lambda: [compare_signatures(doc, src, types) for doc, src in pairs],
+            'baseline': lambda: write_store(tmp_dir, tmp_dir / "baseline.db"),
+        }
+
+        for name, func in stages.items():
+            results[name] = measure(func, repeat)
+            print(f"  {name:<10} {results[name]['median_s'] * 1000:10.1f} ms   "
+                  f"peak {results[name]['peak_kb']:10.1f} KB")
+
+    return results
+
+
+def _quiet(func: Callable, *args):
+    """Call `func` with stdout suppressed (the baseline tool prints per file)."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        return func(*args)
+
+
+def git_revision() -> str:
+    """Return the current commit hash, or '' outside a git checkout."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def load_history(path: Path) -> List[dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def find_regressions(previous: dict, current: dict, threshold: float) -> List[str]:
+    """
+    Compare the fastest run of each stage against a previous run with the same parameters.
+
+    The minimum is the least noisy estimate: interference only ever makes a
+    run slower.
+    """
+    regressions = []
+    for stage, result in current['results'].items():
+        before = previous['results'].get(stage)
+        if not before or before['min_s'] <= 0:
+            continue
+        ratio = result['min_s'] / before['min_s']
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{stage}: {before['min_s'] * 1000:.1f} ms -> {result['min_s'] * 1000:.1f} ms "
+                f"({(ratio - 1) * 100:+.0f}%, allowed +{threshold * 100:.0f}%)"
+            )
+    return regressions
+
+
+def main():
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the maintenance tools on synthetic inputs")
+    parser.add_argument('--methods', type=int, default=10000, help='Methods in the synthetic API')
+    parser.add_argument('--files', type=int, default=2000, help='Files in the synthetic sample tree')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per stage')
+    parser.add_argument('--history', type=Path, default=DEFAULT_HISTORY, help='JSON history file')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Allowed slowdown (0.25 = 25%%)')
+    parser.add_argument('--quick', action='store_true', help='Small inputs for a fast smoke run')
+    args = parser.parse_args()
+
+    if args.quick:
+        args.methods, args.files, args.repeat = 500, 100, MIN_GATE_REPEAT
+
+    params = {'version': BENCHMARK_VERSION, 'methods': args.methods, 'files': args.files, 'repeat': args.repeat}
+    results = run_benchmarks(args.methods, args.files, args.repeat)
+
+    record = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'params': params,
+        'results': results,
+    }
+
+    history = load_history(args.history)
+    previous = next((r for r in reversed(history) if r.get('params') == params), None)
+
+    history.append(record)
+    with open(args.history, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2)
+    print(f"\nRecorded results in {args.history} ({len(history)} runs)")
+
+    if previous is None:
+        print("No previous run with the same parameters; nothing to compare")
+        sys.exit(0)
+
+    if args.repeat < MIN_GATE_REPEAT:
+        print(f"Only {args.repeat} runs per stage; not gating (needs --repeat {MIN_GATE_REPEAT} or more)")
+        sys.exit(0)
+
+    regressions = find_regressions(previous, record, args.threshold)
+    if regressions:
+        print(f"\n❌ Slower than run {previous.get('revision') or previous['timestamp']}:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        sys.exit(1)
+
+    print(f"✓ No stage slower than +{args.threshold * 100:.0f}% vs. run "
+          f"{previous.get('revision') or previous['timestamp']}")
+
+
+if __name__ == '__main__':
+    main()
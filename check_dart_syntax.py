@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Fast syntactic prefilter for the Dart files in code_samples/lib.
+
+`flutter analyze` catches everything but is slow and needs the Flutter SDK.
+Most breakage from sample extraction is much cheaper to find: a bracket
+that never closes, a string cut in half, a `#region` without its
+`#endregion`, or a signature file that lost its `// ignore_for_file:`
+header. This script checks exactly those, in pure Python, across a worker
+pool, and reports each problem with its line and column, so the analyzer
+only has to run once the prefilter passes.
+
+Checks:
+    - `(`, `[` and `{` are balanced and closed in the right order
+      (brackets inside strings, `${...}` interpolations and comments are
+      ignored; the text is tokenized by dart_scanner.py)
+    - string literals and block comments are terminated
+    - `#region` / `#endregion` markers pair up (see region_parser.py)
+    - analyzed `*_signature.dart` files start with an `// ignore_for_file:` header
+
+The bracket, string, comment and header checks stand in for the analyzer,
+so they skip files the nearest `analysis_options.yaml` excludes from
+analysis (the intentionally incomplete signature files). Region markers
+are checked in every file.
+
+Usage:
+    python3 check_dart_syntax.py [PATH ...] [--json] [--jobs N]
+
+Options:
+    PATH      Dart files or directories to check (default: code_samples/lib)
+    --json    Output results in JSON format
+    --jobs N  Check files in N worker processes (0 = one per CPU, default)
+"""
+
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from dart_scanner import OP, tokenize
+from line_index import LineIndex
+from region_parser import parse_regions
+
+# Paths
+SAMPLES_DIR = Path("code_samples/lib")
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 200
+
+_OPENERS = {'(': ')', '[': ']', '{': '}'}
+_CLOSERS = {')': '(', ']': '[', '}': '{'}
+
+IGNORE_HEADER_RE = re.compile(r'^\s*//\s*ignore_for_file:')
+
+ANALYSIS_OPTIONS = "analysis_options.yaml"
+
+# `analyzer:` / `  exclude:` / `    - "glob"` in analysis_options.yaml
+_YAML_KEY_RE = re.compile(r'^(?P<indent> *)(?P<key>[\w-]+):\s*(?:#.*)?$')
+_YAML_ITEM_RE = re.compile(r'^ *- *(?P<quote>["\']?)(?P<value>[^"\'#]*?)(?P=quote) *(?:#.*)?$')
+
+
+@dataclass
+class SyntaxIssue:
+    """One problem found in a Dart file."""
+    file: str
+    line: int
+    column: int
+    problem: str  # 'unclosed', 'unmatched', 'mismatched', 'unterminated_string',
+                  # 'unterminated_comment', 'region_unclosed', 'region_unmatched_end',
+                  # 'missing_ignore_header'
+    message: str
+
+
+def _opening_quote(text: str, offset: int) -> str:
+    """Return the quote that opens the string literal at `offset` (after any `r` prefix)."""
+    start = offset + (text[offset] == 'r')
+    triple = text[start:start + 3]
+    return triple if triple in ("'''", '"""') else text[start]
+
+
+def check_brackets(text: str, file: str = '') -> List[SyntaxIssue]:
+    """Check bracket balance, strings and block comments in one pass."""
+    lines = LineIndex(text)
+    issues: List[SyntaxIssue] = []
+
+    def report(offset: int, problem: str, message: str):
+        line, column = lines.at(offset)
+        issues.append(SyntaxIssue(file, line, column, problem, message))
+
+    def where(offset: int) -> str:
+        return '%d:%d' % lines.at(offset)
+
+    errors = []
+    tokens = tokenize(text, errors)
+    for offset, problem in errors:
+        if problem == 'unterminated_string':
+            report(offset, problem, f"string starting with {_opening_quote(text, offset)} is never closed")
+        else:
+            report(offset, problem, "block comment is never closed")
+
+    # Open brackets: (char, offset)
+    stack: List[Tuple[str, int]] = []
+    for kind, token, start, _ in tokens:
+        if kind != OP:
+            continue
+        if token in _OPENERS:
+            stack.append((token, start))
+        elif token in _CLOSERS:
+            opener = _CLOSERS[token]
+            depth = next((i for i in range(len(stack) - 1, -1, -1) if stack[i][0] == opener), None)
+            if depth is None:
+                report(start, 'unmatched', f"'{token}' has no matching '{opener}'")
+                continue
+            if depth != len(stack) - 1:
+                inner, inner_offset = stack[-1]
+                report(start, 'mismatched',
+                       f"'{token}' closes '{opener}' from {where(stack[depth][1])}, "
+                       f"but '{inner}' from {where(inner_offset)} is still open")
+                del stack[depth + 1:]
+            stack.pop()
+
+    for char, offset in stack:
+        report(offset, 'unclosed', f"'{char}' is never closed")
+
+    return issues
+
+
+def check_regions(text: str, file: str = '') -> List[SyntaxIssue]:
+    """Check that `#region` and `#endregion` markers pair up."""
+    issues = []
+    for issue in parse_regions(text, bodies=False).issues:
+        marker = f"{issue.name} " if issue.name else ''
+        if issue.problem == 'unclosed':
+            message = f"#region {marker}has no #endregion"
+        else:
+            message = f"#endregion {marker}has no open #region"
+        issues.append(SyntaxIssue(file, issue.line, 1, f"region_{issue.problem}", message))
+    return issues
+
+
+def check_ignore_header(text: str, file: str = '') -> List[SyntaxIssue]:
+    """Check that the leading comment block has an `// ignore_for_file:` line."""
+    for line in text.splitlines():
+        if IGNORE_HEADER_RE.match(line):
+            return []
+        stripped = line.strip()
+        if stripped and not stripped.startswith('//'):
+            break
+    return [SyntaxIssue(file, 1, 1, 'missing_ignore_header',
+                        "signature file has no '// ignore_for_file:' header")]
+
+
+def analyzer_excludes(options_file: Path) -> List[re.Pattern]:
+    """Return the `analyzer: exclude:` globs of an analysis_options.yaml as regexes."""
+    patterns = []
+    section = []  # keys of the enclosing mappings
+    with open(options_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            key = _YAML_KEY_RE.match(line)
+            if key:
+                depth = len(key.group('indent')) // 2
+                section = section[:depth] + [key.group('key')]
+                continue
+            item = _YAML_ITEM_RE.match(line)
+            if item and section == ['analyzer', 'exclude']:
+                patterns.append(_glob_regex(item.group('value')))
+    return patterns
+
+
+def _glob_regex(glob: str) -> re.Pattern:
+    """Translate an analyzer glob (`*` within a directory, `**` across) to a regex."""
+    parts = re.split(r'(\*\*/?|\*|\?)', glob)
+    translated = {'**/': '(?:.*/)?', '**': '.*', '*': '[^/]*', '?': '[^/]'}
+    return re.compile(''.join(translated.get(part, re.escape(part)) for part in parts) + '$')
+
+
+class _AnalyzerScope:
+    """Decides which files `dart analyze` checks, by their nearest analysis_options.yaml."""
+
+    def __init__(self):
+        self._excludes: Dict[Path, Optional[Tuple[Path, List[re.Pattern]]]] = {}
+
+    def _options_for(self, directory: Path) -> Optional[Tuple[Path, List[re.Pattern]]]:
+        if directory not in self._excludes:
+            options_file = directory / ANALYSIS_OPTIONS
+            if options_file.is_file():
+                self._excludes[directory] = (directory, analyzer_excludes(options_file))
+            elif directory.parent != directory:
+                self._excludes[directory] = self._options_for(directory.parent)
+            else:
+                self._excludes[directory] = None
+        return self._excludes[directory]
+
+    def analyzed(self, path: Path) -> bool:
+        path = path.resolve()
+        options = self._options_for(path.parent)
+        if options is None:
+            return True
+        root, patterns = options
+        relative = path.relative_to(root).as_posix()
+        return not any(pattern.match(relative) for pattern in patterns)
+
+
+def check_file(path: Path, analyzed: bool = True) -> List[SyntaxIssue]:
+    """
+    Run the checks on one file; issues are sorted by position.
+
+    Files the analyzer does not check (`analyzed` False) only get the
+    region check: the analyzer never sees their brackets or their missing
+    `ignore_for_file` header.
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+    file = str(path)
+
+    issues = check_regions(text, file)
+    if analyzed:
+        issues += check_brackets(text, file)
+        if path.name.endswith('_signature.dart'):
+            issues += check_ignore_header(text, file)
+    return sorted(issues, key=lambda issue: (issue.line, issue.column))
+
+
+def find_dart_files(paths: List[Path]) -> List[Path]:
+    """Expand directories to the .dart files below them, in a stable order."""
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(path.rglob("*.dart")))
+        else:
+            files.append(path)
+    return files
+
+
+def check_files(files: List[Path], analyzed: List[bool], jobs: int) -> List[List[SyntaxIssue]]:
+    """Check files, in worker processes when there are enough of them."""
+    if jobs > 1 and len(files) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunksize = max(1, len(files) // (jobs * 4))
+            return list(pool.map(check_file, files, analyzed, chunksize=chunksize))
+    return [check_file(file, flag) for file, flag in zip(files, analyzed)]
+
+
+def print_report(files: List[Path], issues: List[SyntaxIssue], excluded: int = 0):
+    """Print issues in compiler style (file:line:column), then a summary."""
+    for issue in issues:
+        print(f"{issue.file}:{issue.line}:{issue.column}: {issue.problem}: {issue.message}")
+
+    broken = len({issue.file for issue in issues})
+    if issues:
+        print()
+    print(f"✅ {len(files) - broken} files passed")
+    print(f"❌ {broken} files with {len(issues)} issues")
+    if excluded:
+        print(f"ℹ️  {excluded} files excluded from analysis: only regions checked")
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None):
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog=prog, description="Fast syntax prefilter for code_samples Dart files")
+    parser.add_argument('paths', nargs='*', type=Path, metavar='PATH',
+                        help=f'Dart files or directories (default: {SAMPLES_DIR})')
+    parser.add_argument('--json', action='store_true', help='Output JSON format')
+    parser.add_argument('--jobs', type=int, default=0, metavar='N',
+                        help='Number of worker processes (0 = one per CPU, default)')
+    args = parser.parse_args(argv)
+
+    paths = args.paths or [SAMPLES_DIR]
+    missing = [path for path in paths if not path.exists()]
+    if missing:
+        print(f"Error: Not found: {', '.join(map(str, missing))}")
+        sys.exit(1)
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    files = find_dart_files(paths)
+    scope = _AnalyzerScope()
+    analyzed = [scope.analyzed(file) for file in files]
+    issues = [issue for file_issues in check_files(files, analyzed, jobs) for issue in file_issues]
+    excluded = analyzed.count(False)
+
+    if args.json:
+        output = {
+            'files': len(files),
+            'analyzer_excluded': excluded,
+            'failed': len({issue.file for issue in issues}),
+            'issues': [asdict(issue) for issue in issues],
+        }
+        print(json.dumps(output, indent=2))
+    else:
+        print_report(files, issues, excluded)
+
+    sys.exit(1 if issues else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Check that translated documentation pages stay in sync with the English pages.
+
+Translations live in locale directories such as docs/es/ and mirror the
+English tree page by page. Prose is translated, but the structure is not:
+every page embeds the same `<<< @/../code_samples/...#region` snippets in the
+same order and has the same heading skeleton (the sequence of heading
+levels). This script parses all pages once, in parallel, reduces each page to
+hashed structural fingerprints, and reports pages whose translation gained,
+lost or reordered snippets or headings.
+
+Usage:
+    python3 check_translations.py [--lang CODE ...] [--json] [--verbose] [--jobs N]
+
+Options:
+    --lang CODE  Locale directory to check (repeatable, default: every locale under docs/)
+    --json       Output results in JSON format
+    --verbose    List pages without a translation and translations without an English page
+    --jobs N     Parse pages in N worker processes (0 = one per CPU, default)
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from validate_includes import DOCS_DIR, FENCE_RE, INCLUDE_RE, include_target
+
+# Locale directories under docs/ (e.g. es, pt-BR)
+LOCALE_DIR_RE = re.compile(r'^[a-z]{2}(?:-[A-Z]{2})?$')
+HEADING_RE = re.compile(r'^(#{1,6})\s')
+
+# Below this many pages a process pool costs more than it saves
+PARALLEL_MIN_PAGES = 200
+
+
+@dataclass
+class PageStructure:
+    """The language-independent structure of one markdown page."""
+    path: str  # relative to its language root
+    includes: List[str]  # 'target#region' in page order
+    headings: List[int]  # heading levels in page order
+    titles: List[str]  # heading texts (translated, so only shown, never compared)
+    include_hash: str = ''
+    heading_hash: str = ''
+
+
+@dataclass
+class TranslationDrift:
+    """Structural differences between a page and its translation."""
+    lang: str
+    page: str
+    include_changes: List[str] = field(default_factory=list)
+    heading_changes: List[str] = field(default_factory=list)
+
+
+def fingerprint(items: List) -> str:
+    """Hash a sequence so two pages can be compared without keeping it."""
+    return hashlib.sha1('\n'.join(map(str, items)).encode('utf-8')).hexdigest()
+
+
+def parse_page_structure(page: Path, root: Path, docs_dir: Path) -> PageStructure:
+    """Read one page and extract its snippet includes and heading levels."""
+    includes = []
+    headings = []
+    titles = []
+    in_fence = False
+    in_frontmatter = False
+
+    with open(page, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            if line_no == 1 and line.strip() == '---':
+                in_frontmatter = True
+                continue
+            if in_frontmatter:
+                in_frontmatter = line.strip() != '---'
+                continue
+            if FENCE_RE.match(line):
+                in_fence = not in_fence
+                continue
+            if in_fence:
+                continue
+
+            heading = HEADING_RE.match(line)
+            if heading:
+                headings.append(len(heading.group(1)))
+                titles.append(line[heading.end():].strip())
+                continue
+
+            if '<<<' in line:
+                match = INCLUDE_RE.match(line)
+                if match:
+                    target = include_target(match.group('path'), page, docs_dir)
+                    region = match.group('region')
+                    includes.append(f"{target}#{region}" if region else target)
+
+    return PageStructure(
+        path=str(page.relative_to(root)),
+        includes=includes,
+        headings=headings,
+        titles=titles,
+        include_hash=fingerprint(includes),
+        heading_hash=fingerprint(headings),
+    )
+
+
+def _parse_task(task: Tuple[Path, Path, Path]) -> PageStructure:
+    return parse_page_structure(*task)
+
+
+def find_locales(docs_dir: Path = DOCS_DIR) -> List[str]:
+    """Return the locale directories under docs/."""
+    return sorted(
+        entry.name for entry in docs_dir.iterdir()
+        if entry.is_dir() and LOCALE_DIR_RE.match(entry.name)
+    )
+
+
+def list_pages(root: Path, exclude: Tuple[str, ...] = ()) -> List[Path]:
+    """Return the markdown pages under `root`, skipping excluded top-level dirs."""
+    return sorted(
+        page for page in root.rglob("*.md")
+        if 'node_modules' not in page.parts
+        and page.relative_to(root).parts[0] not in exclude
+    )
+
+
+def parse_trees(docs_dir: Path, locales: List[str], jobs: int) -> Dict[str, Dict[str, PageStructure]]:
+    """
+    Parse the English tree and every locale tree.
+
+    Returns language -> relative page path -> structure; English is 'en'.
+    """
+    roots = {'en': docs_dir}
+    roots.update({lang: docs_dir / lang for lang in locales})
+    all_locales = tuple(find_locales(docs_dir))
+
+    tasks = []
+    for lang, root in roots.items():
+        exclude = all_locales if lang == 'en' else ()
+        tasks.extend((lang, (page, root, docs_dir)) for page in list_pages(root, exclude))
+
+    if jobs > 1 and len(tasks) >= PARALLEL_MIN_PAGES:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunksize = max(1, len(tasks) // (jobs * 4))
+            structures = list(pool.map(_parse_task, [task for _, task in tasks], chunksize=chunksize))
+    else:
+        structures = [_parse_task(task) for _, task in tasks]
+
+    trees: Dict[str, Dict[str, PageStructure]] = {lang: {} for lang in roots}
+    for (lang, _), structure in zip(tasks, structures):
+        trees[lang][structure.path] = structure
+    return trees
+
+
+def describe_changes(original: List, translated: List,
+                     original_labels: List[str], translated_labels: List[str]) -> List[str]:
+    """Describe how the translated sequence differs from the original."""
+    if sorted(map(str, original)) == sorted(map(str, translated)):
+        return ["same entries in a different order"]
+
+    changes = []
+    matcher = difflib.SequenceMatcher(a=original, b=translated, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag in ('delete', 'replace'):
+            changes.extend(f"missing {original_labels[i]} (#{i + 1} in original)" for i in range(i1, i2))
+        if tag in ('insert', 'replace'):
+            changes.extend(f"extra {translated_labels[j]} (#{j + 1} in translation)" for j in range(j1, j2))
+    return changes
+
+
+def compare_trees(trees: Dict[str, Dict[str, PageStructure]]) -> Tuple[List[TranslationDrift], Dict[str, Dict[str, List[str]]]]:
+    """
+    Compare every locale against English.
+
+    Returns (drift, coverage) where coverage maps language to its
+    'untranslated' and 'orphaned' page lists.
+    """
+    english = trees['en']
+    drift = []
+    coverage = {}
+
+    for lang, pages in trees.items():
+        if lang == 'en':
+            continue
+        coverage[lang] = {
+            'untranslated': sorted(set(english) - set(pages)),
+            'orphaned': sorted(set(pages) - set(english)),
+        }
+
+        for path in sorted(set(english) & set(pages)):
+            original, translated = english[path], pages[path]
+            # Fingerprints match for in-sync pages; only drifted pages are diffed
+            if (original.include_hash, original.heading_hash) == (translated.include_hash, translated.heading_hash):
+                continue
+
+            entry = TranslationDrift(lang=lang, page=path)
+            if original.include_hash != translated.include_hash:
+                entry.include_changes = describe_changes(
+                    original.includes, translated.includes, original.includes, translated.includes)
+            if original.heading_hash != translated.heading_hash:
+                entry.heading_changes = describe_changes(
+                    original.headings, translated.headings,
+                    [f"h{level} '{title}'" for level, title in zip(original.headings, original.titles)],
+                    [f"h{level} '{title}'" for level, title in zip(translated.headings, translated.titles)])
+            drift.append(entry)
+
+    return drift, coverage
+
+
+def print_report(trees: Dict[str, Dict[str, PageStructure]], drift: List[TranslationDrift],
+                 coverage: Dict[str, Dict[str, List[str]]], verbose: bool):
+    """Print human-readable translation sync report."""
+    print("\n" + "="*80)
+    print("TRANSLATION SYNC REPORT")
+    print("="*80 + "\n")
+
+    print("SUMMARY:")
+    for lang, info in coverage.items():
+        translated = len(trees[lang]) - len(info['orphaned'])
+        drifted = sum(1 for entry in drift if entry.lang == lang)
+        print(f"  [{lang}] ✅ {translated - drifted} pages in sync")
+        print(f"  [{lang}] ❌ {drifted} pages with structural drift")
+        print(f"  [{lang}] 📝 {len(info['untranslated'])} English pages without translation")
+        print(f"  [{lang}] ⚠️  {len(info['orphaned'])} translated pages without English page")
+    print(f"  Total: {len(trees['en'])} English pages\n")
+
+    if drift:
+        print("="*80)
+        print("❌ STRUCTURAL DRIFT:")
+        print("="*80)
+        for entry in drift:
+            print(f"\n[{entry.lang}] {entry.page}")
+            for change in entry.include_changes:
+                print(f"  - snippets: {change}")
+            for change in entry.heading_changes:
+                print(f"  - headings: {change}")
+
+    if verbose:
+        for lang, info in coverage.items():
+            for kind in ('untranslated', 'orphaned'):
+                if info[kind]:
+                    print(f"\n[{lang}] {kind}:")
+                    for path in info[kind]:
+                        print(f"  {path}")
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None):
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog=prog, description="Check translated docs pages against the English pages")
+    parser.add_argument('--lang', action='append', metavar='CODE', help='Locale to check (repeatable)')
+    parser.add_argument('--json', action='store_true', help='Output JSON format')
+    parser.add_argument('--verbose', action='store_true', help='List untranslated and orphaned pages')
+    parser.add_argument('--jobs', type=int, default=0, metavar='N',
+                        help='Number of worker processes (0 = one per CPU, default)')
+    args = parser.parse_args(argv)
+
+    locales = args.lang or find_locales(DOCS_DIR)
+    missing = [lang for lang in locales if not (DOCS_DIR / lang).is_dir()]
+    if missing:
+        print(f"Error: Locale directory not found: {', '.join(str(DOCS_DIR / lang) for lang in missing)}")
+        sys.exit(1)
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    trees = parse_trees(DOCS_DIR, locales, jobs)
+    drift, coverage = compare_trees(trees)
+
+    if args.json:
+        output = {
+            'pages': len(trees['en']),
+            'locales': {
+                lang: {
+                    'pages': len(trees[lang]),
+                    'drifted': sum(1 for entry in drift if entry.lang == lang),
+                    **info,
+                }
+                for lang, info in coverage.items()
+            },
+            'drift': [asdict(entry) for entry in drift],
+        }
+        print(json.dumps(output, indent=2))
+    else:
+        print_report(trees, drift, coverage, args.verbose)
+
+    sys.exit(1 if drift else 0)
+
+
+if __name__ == '__main__':
+    main()
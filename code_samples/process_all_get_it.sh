@@ -32,6 +32,16 @@ done
 
 echo "============================================================"
 echo "All get_it files processed!"
+echo "Running syntax prefilter..."
+echo "============================================================"
+echo
+
+# Cheap checks first (brackets, strings, regions, headers); stops here on failure.
+# Files excluded in analysis_options.yaml only get the region check.
+python3 ../check_dart_syntax.py lib
+
+echo
+echo "============================================================"
 echo "Running flutter analyze to check for errors..."
 echo "============================================================"
 echo
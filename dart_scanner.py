@@ -0,0 +1,642 @@
+#!/usr/bin/env python3
+"""
+Single-pass Dart declaration scanner shared by the maintenance tools.
+
+The scanner tokenizes a Dart file once (skipping comments and string
+literals, keeping doc comments; a `${...}` interpolation ends at the brace
+that balances it, not at the first `}`) and then walks the token stream tracking
+bracket/brace depth, so member declarations are found in linear time no
+matter how long their parameter lists are. Method bodies are skipped as a
+whole, which keeps local calls such as `return _get<T>(...)` from being
+mistaken for declarations.
+
+Usage:
+    from dart_scanner import scan_declarations
+
+    for decl in scan_declarations(source_text):
+        print(decl.name, decl.return_type, decl.params_text)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+# Bump when the scanner output changes so cached parse results are invalidated
+SCANNER_VERSION = 3
+
+# Token kinds
+IDENT = 'id'
+OP = 'op'
+STRING = 'str'
+NUMBER = 'num'
+DOC = 'doc'
+
+# (kind, text, start offset, end offset)
+Token = Tuple[str, str, int, int]
+
+# (start offset, 'unterminated_string' or 'unterminated_comment')
+LexError = Tuple[int, str]
+
+_TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<doc>///[^\n]*)
+  | (?P<line_comment>//[^\n]*)
+  | (?P<block_comment>/\*)
+  | (?P<string>
+        r'''[\s\S]*?(?:'''|\Z)
+      | r\"\"\"[\s\S]*?(?:\"\"\"|\Z)
+      | '''(?:\\[\s\S]|[^\\])*?(?:'''|\Z)
+      | \"\"\"(?:\\[\s\S]|[^\\])*?(?:\"\"\"|\Z)
+      | r'[^'\n]*'?
+      | r"[^"\n]*"?
+      | '(?:\\.|[^'\\\n])*'?
+      | "(?:\\.|[^"\\\n])*"?
+    )
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<number>\d\w*(?:\.\d\w*)?)
+  | (?P<op>=>|\S)
+""", re.VERBOSE)
+
+_BLOCK_COMMENT_RE = re.compile(r'/\*|\*/')
+
+# Escapes, interpolations and the end of a non-raw string, by opening quote
+_STRING_PART_RES = {
+    "'": re.compile(r"\\[^\n]|\$\{|'|\n"),
+    '"': re.compile(r'\\[^\n]|\$\{|"|\n'),
+    "'''": re.compile(r"\\[\s\S]|\$\{|'''"),
+    '"""': re.compile(r'\\[\s\S]|\$\{|"""'),
+}
+
+_OPENERS = {'(': ')', '[': ']', '{': '}'}
+_CLOSERS = {')', ']', '}'}
+
+# Keywords that open a container body (class-level members live inside)
+CONTAINER_KEYWORDS = {'class', 'mixin', 'extension', 'enum'}
+
+# Top-level directives and other statements that never declare a method
+_NON_DECLARATION_KEYWORDS = {
+    'import', 'export', 'part', 'library', 'typedef',
+}
+
+# Member modifiers that may precede the return type
+_MODIFIERS = {'static', 'external', 'covariant', 'abstract'}
+
+# Modifiers that mark a constructor or field rather than a method
+_NON_METHOD_MODIFIERS = {'factory', 'const', 'final', 'var', 'late'}
+
+# Reserved words that can never be a method name
+_RESERVED = {
+    'if', 'for', 'while', 'switch', 'catch', 'return', 'assert', 'super',
+    'this', 'new', 'throw', 'await', 'yield', 'else', 'do', 'try',
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Declaration:
+    """A member declaration found by the scanner.
+
+    Offsets are character offsets into the scanned text. `return_type`,
+    `generic_params` and `params_text` are normalized: comments are dropped
+    and every run of whitespace is collapsed to a single space. Getters have
+    no parameter list; their `params_start`/`params_end` are -1.
+    """
+    name: str
+    kind: str                       # 'method', 'getter', 'setter' or 'operator'
+    return_type: str
+    generic_params: str
+    params_text: str
+    container: Optional[str]        # enclosing class/mixin/extension/enum name
+    container_kind: Optional[str]   # 'class', 'mixin', 'extension' or 'enum'
+    doc_comment: Optional[str]
+    start: int          # first modifier or return type token
+    end: int            # just past the terminating ';' or closing '}'
+    params_start: int   # the opening '(' of the parameter list
+    params_end: int     # just past the closing ')'
+
+
+@dataclass(frozen=True, slots=True)
+class Typedef:
+    """A top-level type alias found by the scanner.
+
+    `aliased` is normalized like declaration types. Old-style function
+    typedefs (`typedef void Cb(int x);`) are rewritten to the equivalent
+    `void Function(int x)`.
+    """
+    name: str
+    generic_params: str             # e.g. '<T, P1, P2>' or ''
+    aliased: str
+    start: int
+    end: int
+
+
+def _skip_block_comment(text: str, pos: int) -> int:
+    """Return the offset just past a (possibly nested) block comment, or -1 if it is never closed."""
+    depth = 0
+    for match in _BLOCK_COMMENT_RE.finditer(text, pos):
+        if match.group() == '/*':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return -1
+
+
+def _skip_string(text: str, pos: int) -> int:
+    """
+    Return the offset just past the non-raw string literal starting at `pos`.
+
+    Returns -1 if an interpolation in it is never closed.
+    """
+    quote = text[pos:pos + 3] if text.startswith(("'''", '"""'), pos) else text[pos]
+    parts = _STRING_PART_RES[quote]
+    i = pos + len(quote)
+    while True:
+        match = parts.search(text, i)
+        if match is None:
+            return len(text)
+        token = match.group()
+        if token == '${':
+            i = _skip_interpolation(text, match.end())
+            if i == -1:
+                return -1
+        elif token == quote:
+            return match.end()
+        elif token == '\n':
+            return match.start()  # unterminated single-line string
+        else:
+            i = match.end()
+
+
+def _skip_interpolation(text: str, pos: int) -> int:
+    """
+    Return the offset just past the `}` closing the `${` that ends at `pos`.
+
+    Braces of map literals, closures and blocks inside the expression are
+    balanced first; strings and comments in it are skipped. Returns -1 if
+    the interpolation is never closed.
+    """
+    depth = 1
+    length = len(text)
+    while pos < length:
+        match = _TOKEN_RE.match(text, pos)
+        kind = match.lastgroup
+        end = match.end()
+        if kind == 'string':
+            end = _string_end(text, pos, match)
+        elif kind == 'block_comment':
+            end = _skip_block_comment(text, pos)
+            if end == -1:
+                return -1
+        elif kind == 'op':
+            if match.group() == '{':
+                depth += 1
+            elif match.group() == '}':
+                depth -= 1
+                if depth == 0:
+                    return end
+        pos = end
+    return -1
+
+
+def _string_end(text: str, pos: int, match: re.Match) -> int:
+    """End of the string literal `match` found at `pos`, following interpolations."""
+    literal = match.group()
+    if literal[0] == 'r' or '${' not in literal:
+        # The regex match is exact unless an interpolation may hide a quote
+        return match.end()
+    end = _skip_string(text, pos)
+    # Broken source: keep the regex match rather than swallow the rest of the file
+    return end if end != -1 else match.end()
+
+
+def _string_closed(literal: str) -> bool:
+    """True if a string literal token ends with its (unescaped) closing quote."""
+    raw = literal[0] == 'r'
+    body = literal[1:] if raw else literal
+    quote = body[:3] if body[:3] in ("'''", '"""') else body[0]
+    if len(body) < 2 * len(quote) or not body.endswith(quote):
+        return False
+    if raw:
+        return True
+    closing = len(literal) - len(quote)
+    backslashes = closing - len(literal[:closing].rstrip('\\'))
+    return backslashes % 2 == 0
+
+
+def tokenize(text: str, errors: Optional[List[LexError]] = None) -> List[Token]:
+    """
+    Tokenize Dart source, dropping whitespace and non-doc comments.
+
+    Unterminated strings and block comments extend to the end of their line
+    (strings) or of the text (comments). If `errors` is given, each of them
+    is appended to it.
+    """
+    tokens: List[Token] = []
+    append = tokens.append
+    match_at = _TOKEN_RE.match
+    pos = 0
+    length = len(text)
+
+    while pos < length:
+        match = match_at(text, pos)
+        kind = match.lastgroup
+        end = match.end()
+
+        if kind == 'ident':
+            append((IDENT, match.group(), pos, end))
+        elif kind == 'op':
+            append((OP, match.group(), pos, end))
+        elif kind == 'string':
+            end = _string_end(text, pos, match)
+            append((STRING, text[pos:end], pos, end))
+            if errors is not None and not _string_closed(text[pos:end]):
+                errors.append((pos, 'unterminated_string'))
+        elif kind == 'number':
+            append((NUMBER, match.group(), pos, end))
+        elif kind == 'doc':
+            append((DOC, match.group(), pos, end))
+        elif kind == 'block_comment':
+            end = _skip_block_comment(text, pos)
+            if end == -1:
+                if errors is not None:
+                    errors.append((pos, 'unterminated_comment'))
+                end = length
+
+        pos = end
+
+    return tokens
+
+
+def _join(tokens: List[Token], start: int, stop: int) -> str:
+    """Rebuild source text for tokens[start:stop] with normalized spacing."""
+    parts = []
+    prev_end = None
+    for kind, tok, tok_start, tok_end in tokens[start:stop]:
+        if kind == DOC:
+            continue
+        if prev_end is not None and tok_start > prev_end:
+            parts.append(' ')
+        parts.append(tok)
+        prev_end = tok_end
+    return ''.join(parts)
+
+
+def _skip_angles(tokens: List[Token], i: int, stop: int) -> int:
+    """Given tokens[i] is '<', return the index of its matching '>'."""
+    depth = 0
+    for j in range(i, stop):
+        tok = tokens[j][1]
+        if tok == '<':
+            depth += 1
+        elif tok == '>':
+            depth -= 1
+            if depth == 0:
+                return j
+    return stop - 1
+
+
+def _find_member_end(tokens: List[Token], i: int, n: int) -> Tuple[int, int]:
+    """
+    Find where the member starting at token i ends.
+
+    Returns:
+        (end_index, brace_index) where end_index is the index of the last
+        token belonging to the member and brace_index is the index of the
+        first '{' at depth 0 (or -1 if the member ended with ';').
+    """
+    depth = 0
+    j = i
+    while j < n:
+        kind, tok, _, _ = tokens[j]
+        if kind == OP:
+            if tok in _OPENERS:
+                if tok == '{' and depth == 0:
+                    return j, j
+                depth += 1
+            elif tok in _CLOSERS:
+                if depth == 0:
+                    # Unbalanced closer: the member ends right before it
+                    return j - 1, -1
+                depth -= 1
+            elif tok == ';' and depth == 0:
+                return j, -1
+        j += 1
+    return n - 1, -1
+
+
+def _skip_balanced(tokens: List[Token], i: int, n: int) -> int:
+    """Given tokens[i] is an opener, return the index of its matching closer."""
+    depth = 0
+    j = i
+    while j < n:
+        kind, tok, _, _ = tokens[j]
+        if kind == OP:
+            if tok in _OPENERS:
+                depth += 1
+            elif tok in _CLOSERS:
+                depth -= 1
+                if depth == 0:
+                    return j
+        j += 1
+    return n - 1
+
+
+def _skip_annotations(tokens: List[Token], i: int, stop: int) -> int:
+    """Skip `@name`, `@prefix.name` and `@name(...)` annotations."""
+    while i < stop and tokens[i][1] == '@':
+        i += 1
+        if i < stop and tokens[i][0] == IDENT:
+            i += 1
+        while i + 1 < stop and tokens[i][1] == '.' and tokens[i + 1][0] == IDENT:
+            i += 2
+        if i < stop and tokens[i][1] == '(':
+            i = _skip_balanced(tokens, i, stop + 1) + 1
+    return i
+
+
+def _container_header(tokens: List[Token], i: int, stop: int) -> Optional[Tuple[str, str]]:
+    """
+    Return (kind, name) if tokens[i:stop] is a class/mixin/extension/enum
+    header, or None otherwise. Unnamed extensions have the name ''.
+    """
+    for j in range(i, stop):
+        kind, tok, _, _ = tokens[j]
+        if kind == IDENT and tok in CONTAINER_KEYWORDS:
+            if j + 1 < stop and tokens[j + 1][0] == IDENT and tokens[j + 1][1] != 'on':
+                return tok, tokens[j + 1][1]
+            return tok, ''
+        if kind == OP and tok in ('(', '=', '=>'):
+            return None
+    return None
+
+
+def _getter_at(tokens: List[Token], type_start: int, k: int) -> Optional[int]:
+    """Return the index of the getter name if tokens[type_start:k] ends in `get name`."""
+    if (k - 2 >= type_start
+            and tokens[k - 1][0] == IDENT
+            and tokens[k - 2][0] == IDENT and tokens[k - 2][1] == 'get'):
+        return k - 1
+    return None
+
+
+def _parse_member_header(
+    tokens: List[Token],
+    i: int,
+    stop: int,
+    container: Optional[Tuple[str, str]],
+    doc_comment: Optional[str],
+    end_offset: int,
+) -> Optional[Declaration]:
+    """Parse tokens[i:stop] as a method, getter, setter or operator header."""
+    i = _skip_annotations(tokens, i, stop)
+    if i >= stop:
+        return None
+
+    first = tokens[i]
+    if first[0] != IDENT or first[1] in _NON_DECLARATION_KEYWORDS:
+        return None
+
+    decl_start = first[2]
+    while i < stop and tokens[i][1] in _MODIFIERS:
+        i += 1
+    if i >= stop or tokens[i][1] in _NON_METHOD_MODIFIERS:
+        return None
+
+    container_kind, container_name = container if container else (None, None)
+
+    def declaration(kind, name, type_stop, generic_params, open_idx, close_idx):
+        if open_idx is None:
+            params_text, params_start, params_end = "", -1, -1
+        else:
+            params_text = _join(tokens, open_idx + 1, close_idx)
+            params_start, params_end = tokens[open_idx][2], tokens[close_idx][3]
+        return Declaration(
+            name=name,
+            kind=kind,
+            return_type=_join(tokens, type_start, type_stop),
+            generic_params=generic_params,
+            params_text=params_text,
+            container=container_name,
+            container_kind=container_kind,
+            doc_comment=doc_comment,
+            start=decl_start,
+            end=end_offset,
+            params_start=params_start,
+            params_end=params_end,
+        )
+
+    type_start = i
+    angle = 0
+    generic_open = -1
+    j = i
+
+    while j < stop:
+        kind, tok, _, _ = tokens[j]
+
+        if kind == IDENT and tok == 'operator' and angle == 0 and j + 1 < stop \
+                and tokens[j + 1][0] == OP and tokens[j + 1][1] != '(':
+            # `bool operator ==(Object other)`, `T operator [](int i)`
+            k = j + 1
+            while k < stop and tokens[k][1] != '(':
+                k += 1
+            if k >= stop:
+                return None
+            name = 'operator ' + ''.join(t[1] for t in tokens[j + 1:k])
+            close = _skip_balanced(tokens, k, stop + 1)
+            return declaration('operator', name, j, "", k, close)
+
+        if kind == OP:
+            if tok == '<':
+                if angle == 0:
+                    generic_open = j
+                angle += 1
+            elif tok == '>':
+                angle -= 1
+            elif angle == 0 and tok in ('=', '=>', ';', '{'):
+                name_idx = _getter_at(tokens, type_start, j) if tok != '=' else None
+                if name_idx is None:
+                    # Field or initializer - not a member we report
+                    return None
+                return declaration('getter', tokens[name_idx][1], name_idx - 1, "", None, None)
+            elif tok == '(' and angle == 0:
+                if j == type_start:
+                    return None
+                prev_kind, prev_tok, _, _ = tokens[j - 1]
+
+                if prev_tok == '>' and generic_open > type_start:
+                    name_idx = generic_open - 1
+                    generic_params = _join(tokens, generic_open, j)
+                elif prev_kind == IDENT:
+                    name_idx = j - 1
+                    generic_params = ""
+                else:
+                    return None
+
+                name_kind, name, _, _ = tokens[name_idx]
+                if name_kind != IDENT or name in _RESERVED:
+                    return None
+
+                if name == 'Function':
+                    # Part of a function type such as `void Function(T)`
+                    j = _skip_balanced(tokens, j, stop + 1) + 1
+                    continue
+
+                close = _skip_balanced(tokens, j, stop + 1)
+
+                # `set name(value)` - the return type is optional
+                if name_idx - 1 >= type_start and tokens[name_idx - 1][1] == 'set':
+                    return declaration('setter', name, name_idx - 1, "", j, close)
+
+                # A method needs a return type; constructors have none
+                if name_idx == type_start or tokens[name_idx - 1][1] == '.':
+                    return None
+                if tokens[type_start][0] != IDENT:
+                    return None
+
+                return declaration('method', name, name_idx, generic_params, j, close)
+            elif tok in _OPENERS:
+                j = _skip_balanced(tokens, j, stop + 1) + 1
+                continue
+        j += 1
+
+    # Getter with a block body: the header stops right before the '{'
+    name_idx = _getter_at(tokens, type_start, stop)
+    if name_idx is not None:
+        return declaration('getter', tokens[name_idx][1], name_idx - 1, "", None, None)
+
+    return None
+
+
+def _doc_comment_text(text: str, doc_tokens: List[Token]) -> Optional[str]:
+    """Join doc comment tokens into lines that keep their indentation."""
+    if not doc_tokens:
+        return None
+    lines = []
+    for _, _, tok_start, tok_end in doc_tokens:
+        line_start = text.rfind('\n', 0, tok_start) + 1
+        lines.append(text[line_start:tok_end])
+    return '\n'.join(lines)
+
+
+def scan_declarations(text: str) -> Iterator[Declaration]:
+    """
+    Yield every top-level and class-level member declaration in `text`.
+
+    Methods, getters, setters and operators are yielded in source order,
+    including members of extensions and mixins. Private members are
+    included; constructors, fields and typedefs are not.
+    """
+    tokens = tokenize(text)
+    n = len(tokens)
+    containers: List[Tuple[str, str]] = []
+    doc_tokens: List[Token] = []
+    i = 0
+
+    while i < n:
+        kind, tok, _, _ = tokens[i]
+
+        if kind == DOC:
+            doc_tokens.append(tokens[i])
+            i += 1
+            continue
+
+        if kind == OP and tok in ('}', ';'):
+            if tok == '}' and containers:
+                containers.pop()
+            doc_tokens = []
+            i += 1
+            continue
+
+        end_idx, brace_idx = _find_member_end(tokens, i, n)
+        container = containers[-1] if containers else None
+
+        if brace_idx != -1:
+            header = _container_header(tokens, i, brace_idx)
+            if header is not None:
+                containers.append(header)
+                doc_tokens = []
+                i = brace_idx + 1
+                continue
+            # Member with a block body: skip the body as a whole
+            end_idx = _skip_balanced(tokens, brace_idx, n)
+            header_stop = brace_idx
+        else:
+            header_stop = end_idx + 1
+
+        decl = _parse_member_header(
+            tokens,
+            i,
+            header_stop,
+            container,
+            _doc_comment_text(text, doc_tokens),
+            tokens[end_idx][3] if end_idx >= i else tokens[i][3],
+        )
+        if decl is not None:
+            yield decl
+
+        doc_tokens = []
+        i = max(end_idx, i) + 1
+
+
+def _parse_typedef(tokens: List[Token], i: int, end: int) -> Optional[Typedef]:
+    """Parse `typedef ... ;` spanning tokens[i:end + 1]."""
+    stop = end if tokens[end][1] == ';' else end + 1
+    eq = next((j for j in range(i + 1, stop) if tokens[j][1] == '='), -1)
+
+    if eq != -1:
+        # typedef Name<T> = Type;
+        if tokens[i + 1][0] != IDENT:
+            return None
+        generic_params = _join(tokens, i + 2, eq) if tokens[i + 2][1] == '<' else ''
+        return Typedef(tokens[i + 1][1], generic_params, _join(tokens, eq + 1, stop),
+                       tokens[i][2], tokens[end][3])
+
+    # typedef ReturnType Name<T>(params);
+    j = i + 1
+    while j < stop and tokens[j][1] != '(':
+        j = _skip_angles(tokens, j, stop) + 1 if tokens[j][1] == '<' else j + 1
+    if j >= stop:
+        return None
+    params_close = _skip_balanced(tokens, j, stop)
+
+    name_idx = j - 1
+    generic_params = ''
+    if tokens[name_idx][1] == '>':
+        depth = 0
+        for k in range(name_idx, i, -1):
+            depth += {'>': 1, '<': -1}.get(tokens[k][1], 0)
+            if depth == 0:
+                generic_params = _join(tokens, k, j)
+                name_idx = k - 1
+                break
+    if name_idx <= i or tokens[name_idx][0] != IDENT:
+        return None
+
+    return_type = _join(tokens, i + 1, name_idx) or 'dynamic'
+    aliased = f"{return_type} Function({_join(tokens, j + 1, params_close)})"
+    return Typedef(tokens[name_idx][1], generic_params, aliased, tokens[i][2], tokens[end][3])
+
+
+def scan_typedefs(text: str) -> Iterator[Typedef]:
+    """Yield the top-level typedefs in `text` in source order."""
+    tokens = tokenize(text)
+    n = len(tokens)
+    depth = 0
+    i = 0
+
+    while i < n:
+        kind, tok, _, _ = tokens[i]
+        if kind == OP:
+            if tok in _OPENERS:
+                depth += 1
+            elif tok in _CLOSERS:
+                depth -= 1
+        elif kind == IDENT and tok == 'typedef' and depth == 0 and i + 1 < n:
+            end_idx, _ = _find_member_end(tokens, i, n)
+            typedef = _parse_typedef(tokens, i, end_idx)
+            if typedef is not None:
+                yield typedef
+            i = end_idx + 1
+            continue
+        i += 1
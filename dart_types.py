@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Canonical forms of Dart types for signature comparison.
+
+A type string is parsed into a small AST (named types with type arguments,
+function types, records, nullability) and printed back in one canonical
+spelling, so differences that do not change the type are ignored:
+
+    Map<String,int>                     -> Map<String, int>
+    void Function(String name)?         -> void Function(String)?
+    Function(int)                       -> dynamic Function(int)
+    void Function({int b, String a})    -> void Function({String a, int b})
+    dynamic?                            -> dynamic
+
+A `TypeCanonicalizer` can additionally expand typedefs of the indexed
+sources, so `FactoryFunc<Foo>` and `Foo Function()` compare equal. Parsing
+and canonical forms are memoized per distinct type string.
+
+Usage:
+    types = TypeCanonicalizer(scan_typedefs(source_text))
+    types.same('FactoryFunc<T>', 'T Function()')   # True
+"""
+
+import functools
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from dart_scanner import IDENT, Typedef, tokenize
+
+# Types for which a trailing '?' is redundant
+_ALWAYS_NULLABLE = {'dynamic', 'void', 'Null'}
+
+# Parameter modifiers that do not affect the type
+_PARAM_MODIFIERS = {'covariant', 'final', 'required'}
+
+# Typedefs referring to each other are expanded at most this deep
+_MAX_EXPANSION_DEPTH = 16
+
+# Bound on memoized canonical forms per canonicalizer
+_MEMO_SIZE = 8192
+
+
+class TypeSyntaxError(ValueError):
+    """Raised when a string is not a Dart type this parser understands."""
+
+
+@dataclass(frozen=True)
+class NamedType:
+    name: str  # possibly prefixed, e.g. 'async.Future'
+    args: Tuple['TypeNode', ...] = ()
+    nullable: bool = False
+
+
+@dataclass(frozen=True)
+class FunctionType:
+    return_type: 'TypeNode'
+    type_params: Tuple[Tuple[str, Optional['TypeNode']], ...] = ()
+    positional: Tuple['TypeNode', ...] = ()
+    optional: Tuple['TypeNode', ...] = ()
+    named: Tuple[Tuple[str, 'TypeNode', bool], ...] = ()  # (name, type, required)
+    nullable: bool = False
+
+
+@dataclass(frozen=True)
+class RecordType:
+    positional: Tuple['TypeNode', ...] = ()
+    named: Tuple[Tuple[str, 'TypeNode'], ...] = ()
+    nullable: bool = False
+
+
+TypeNode = Union[NamedType, FunctionType, RecordType]
+
+_DYNAMIC = NamedType('dynamic')
+
+
+class _Parser:
+    """Recursive-descent parser over dart_scanner tokens."""
+
+    def __init__(self, text: str):
+        self.tokens = [(kind, tok) for kind, tok, _, _ in tokenize(text)]
+        self.pos = 0
+
+    def peek(self, offset: int = 0) -> str:
+        index = self.pos + offset
+        return self.tokens[index][1] if index < len(self.tokens) else ''
+
+    def is_ident(self, offset: int = 0) -> bool:
+        index = self.pos + offset
+        return index < len(self.tokens) and self.tokens[index][0] == IDENT
+
+    def take(self) -> str:
+        if self.pos >= len(self.tokens):
+            raise TypeSyntaxError("unexpected end of type")
+        tok = self.tokens[self.pos][1]
+        self.pos += 1
+        return tok
+
+    def expect(self, tok: str):
+        if self.take() != tok:
+            raise TypeSyntaxError(f"expected {tok!r}")
+
+    def accept(self, tok: str) -> bool:
+        if self.peek() == tok:
+            self.pos += 1
+            return True
+        return False
+
+    def parse(self) -> TypeNode:
+        node = self.type()
+        if self.pos != len(self.tokens):
+            raise TypeSyntaxError(f"unexpected {self.peek()!r}")
+        return node
+
+    def type(self) -> TypeNode:
+        if self.peek() == '(':
+            node = self.record()
+        elif self.peek() == 'Function' and self.peek(1) in ('(', '<'):
+            # `Function(int)` has an implicit dynamic return type
+            node = _DYNAMIC
+        else:
+            node = self.named()
+
+        while self.peek() == 'Function' and self.peek(1) in ('(', '<'):
+            self.take()
+            node = self.function_suffix(node)
+        return node
+
+    def named(self) -> NamedType:
+        if not self.is_ident():
+            raise TypeSyntaxError(f"expected a type name, got {self.peek()!r}")
+        name = self.take()
+        while self.peek() == '.' and self.is_ident(1):
+            self.take()
+            name += '.' + self.take()
+
+        args = ()
+        if self.accept('<'):
+            args = [self.type()]
+            while self.accept(','):
+                args.append(self.type())
+            self.expect('>')
+            args = tuple(args)
+
+        return NamedType(name, args, self.accept('?'))
+
+    def function_suffix(self, return_type: TypeNode) -> FunctionType:
+        type_params = ()
+        if self.accept('<'):
+            type_params = [self.type_param()]
+            while self.accept(','):
+                type_params.append(self.type_param())
+            self.expect('>')
+            type_params = tuple(type_params)
+
+        self.expect('(')
+        positional, optional, named = self.parameters(')')
+        return FunctionType(return_type, type_params, positional, optional, named, self.accept('?'))
+
+    def type_param(self) -> Tuple[str, Optional[TypeNode]]:
+        name = self.take()
+        bound = self.type() if self.accept('extends') else None
+        return (name, bound)
+
+    def parameters(self, closer: str):
+        positional: List[TypeNode] = []
+        optional: List[TypeNode] = []
+        named: List[Tuple[str, TypeNode, bool]] = []
+
+        while not self.accept(closer):
+            if self.accept('['):
+                optional.extend(param for param, _, _ in self.parameter_list(']'))
+            elif self.accept('{'):
+                named.extend((name, param, required) for param, name, required in self.parameter_list('}'))
+            else:
+                param, _, _ = self.parameter()
+                positional.append(param)
+                if not self.accept(','):
+                    self.expect(closer)
+                    break
+
+        return tuple(positional), tuple(optional), tuple(sorted(named, key=lambda p: p[0]))
+
+    def parameter_list(self, closer: str):
+        params = []
+        while not self.accept(closer):
+            params.append(self.parameter())
+            if not self.accept(','):
+                self.expect(closer)
+                break
+        return params
+
+    def parameter(self) -> Tuple[TypeNode, str, bool]:
+        """Parse `[@meta] [required] Type [name]`; returns (type, name, required)."""
+        while self.accept('@'):
+            self.named()
+            if self.peek() == '(':
+                self.skip_balanced()
+
+        required = False
+        while self.peek() in _PARAM_MODIFIERS and self.is_ident(1):
+            required |= self.take() == 'required'
+
+        param = self.type()
+        name = ''
+        if self.is_ident():
+            name = self.take()
+            if self.peek() == '(':
+                # Old-style function-typed parameter: `void callback(int x)`
+                self.take()
+                positional, optional, named = self.parameters(')')
+                param = FunctionType(param, (), positional, optional, named, self.accept('?'))
+        return param, name, required
+
+    def record(self) -> RecordType:
+        self.expect('(')
+        positional: List[TypeNode] = []
+        named: List[Tuple[str, TypeNode]] = []
+
+        while not self.accept(')'):
+            if self.accept('{'):
+                for param, name, _ in self.parameter_list('}'):
+                    named.append((name, param))
+                continue
+            param, _, _ = self.parameter()
+            positional.append(param)
+            if not self.accept(','):
+                self.expect(')')
+                break
+
+        return RecordType(tuple(positional), tuple(sorted(named, key=lambda p: p[0])), self.accept('?'))
+
+    def skip_balanced(self):
+        depth = 0
+        while True:
+            tok = self.take()
+            if tok in ('(', '[', '{'):
+                depth += 1
+            elif tok in (')', ']', '}'):
+                depth -= 1
+                if depth == 0:
+                    return
+
+
+@functools.lru_cache(maxsize=_MEMO_SIZE)
+def parse_type(text: str) -> TypeNode:
+    """Parse a Dart type (memoized per distinct string)."""
+    return _Parser(text).parse()
+
+
+def render(node: TypeNode) -> str:
+    """Print a type AST in canonical spelling."""
+    if isinstance(node, NamedType):
+        text = node.name
+        if node.args:
+            text += '<' + ', '.join(render(arg) for arg in node.args) + '>'
+        if node.nullable and node.name not in _ALWAYS_NULLABLE:
+            text += '?'
+        return text
+
+    if isinstance(node, FunctionType):
+        params = [render(param) for param in node.positional]
+        if node.optional:
+            params.append('[' + ', '.join(render(param) for param in node.optional) + ']')
+        if node.named:
+            params.append('{' + ', '.join(
+                ('required ' if required else '') + f"{render(param)} {name}"
+                for name, param, required in node.named
+            ) + '}')
+        type_params = ''
+        if node.type_params:
+            type_params = '<' + ', '.join(
+                name + (f" extends {render(bound)}" if bound is not None else '')
+                for name, bound in node.type_params
+            ) + '>'
+        text = f"{render(node.return_type)} Function{type_params}({', '.join(params)})"
+        return text + ('?' if node.nullable else '')
+
+    fields = [render(field) for field in node.positional]
+    if len(fields) == 1 and not node.named:
+        fields[0] += ','
+    if node.named:
+        fields.append('{' + ', '.join(f"{render(field)} {name}" for name, field in node.named) + '}')
+    return '(' + ', '.join(fields) + ')' + ('?' if node.nullable else '')
+
+
+@functools.lru_cache(maxsize=_MEMO_SIZE)
+def canonical_type(text: str) -> str:
+    """
+    Return the canonical spelling of a type, without typedef expansion.
+
+    Strings that do not parse are returned with whitespace collapsed.
+    """
+    try:
+        return render(parse_type(text))
+    except TypeSyntaxError:
+        return ' '.join(text.split())
+
+
+@functools.lru_cache(maxsize=_MEMO_SIZE)
+def canonical_generic_params(text: str) -> str:
+    """
+    Canonical spelling of a type parameter list such as `<T extends Object, P>`.
+
+    An `extends Object` bound is dropped, since docs may show the simplified `<T>`.
+    """
+    if not text.strip():
+        return ''
+    parser = _Parser(text)
+    try:
+        parser.expect('<')
+        params = [parser.type_param()]
+        while parser.accept(','):
+            params.append(parser.type_param())
+        parser.expect('>')
+    except TypeSyntaxError:
+        return ' '.join(text.split())
+
+    return '<' + ', '.join(
+        name + (f" extends {render(bound)}" if bound is not None and bound != NamedType('Object') else '')
+        for name, bound in params
+    ) + '>'
+
+
+def _substitute(node: TypeNode, bindings: Dict[str, TypeNode]) -> TypeNode:
+    """Replace type parameter names in `node` by their bound types."""
+    if isinstance(node, NamedType):
+        if not node.args and node.name in bindings:
+            bound = bindings[node.name]
+            return replace(bound, nullable=True) if node.nullable else bound
+        return replace(node, args=tuple(_substitute(arg, bindings) for arg in node.args))
+
+    if isinstance(node, FunctionType):
+        # The function's own type parameters shadow outer bindings
+        inner = {k: v for k, v in bindings.items() if k not in {name for name, _ in node.type_params}}
+        return replace(
+            node,
+            return_type=_substitute(node.return_type, inner),
+            positional=tuple(_substitute(p, inner) for p in node.positional),
+            optional=tuple(_substitute(p, inner) for p in node.optional),
+            named=tuple((name, _substitute(p, inner), required) for name, p, required in node.named),
+        )
+
+    return replace(
+        node,
+        positional=tuple(_substitute(p, bindings) for p in node.positional),
+        named=tuple((name, _substitute(p, bindings)) for name, p in node.named),
+    )
+
+
+class TypeCanonicalizer:
+    """Canonical types with the typedefs of one package expanded."""
+
+    def __init__(self, typedefs: Iterable[Typedef] = ()):
+        # name -> (type parameter names, aliased type)
+        self._aliases: Dict[str, Tuple[Tuple[str, ...], TypeNode]] = {}
+        self._memo: Dict[str, str] = {}
+
+        for typedef in typedefs:
+            try:
+                aliased = parse_type(typedef.aliased)
+            except TypeSyntaxError:
+                continue
+            params = ()
+            if typedef.generic_params:
+                parser = _Parser(typedef.generic_params)
+                try:
+                    parser.expect('<')
+                    names = [parser.type_param()[0]]
+                    while parser.accept(','):
+                        names.append(parser.type_param()[0])
+                    params = tuple(names)
+                except TypeSyntaxError:
+                    continue
+            self._aliases.setdefault(typedef.name, (params, aliased))
+
+    def expand(self, node: TypeNode, depth: int = 0) -> TypeNode:
+        """Expand every typedef reference in `node`."""
+        if isinstance(node, NamedType):
+            args = tuple(self.expand(arg, depth) for arg in node.args)
+            alias = self._aliases.get(node.name)
+            if alias is None or depth >= _MAX_EXPANSION_DEPTH:
+                return replace(node, args=args)
+            params, aliased = alias
+            if args and len(args) != len(params):
+                return replace(node, args=args)
+            # A generic typedef used without arguments is instantiated with dynamic
+            bindings = dict(zip(params, args or (_DYNAMIC,) * len(params)))
+            expanded = self.expand(_substitute(aliased, bindings), depth + 1)
+            return replace(expanded, nullable=True) if node.nullable else expanded
+
+        if isinstance(node, FunctionType):
+            return replace(
+                node,
+                return_type=self.expand(node.return_type, depth),
+                type_params=tuple(
+                    (name, self.expand(bound, depth) if bound is not None else None)
+                    for name, bound in node.type_params
+                ),
+                positional=tuple(self.expand(p, depth) for p in node.positional),
+                optional=tuple(self.expand(p, depth) for p in node.optional),
+                named=tuple((name, self.expand(p, depth), required) for name, p, required in node.named),
+            )
+
+        return replace(
+            node,
+            positional=tuple(self.expand(p, depth) for p in node.positional),
+            named=tuple((name, self.expand(p, depth)) for name, p in node.named),
+        )
+
+    def canonical(self, text: str) -> str:
+        """Canonical spelling of `text` with typedefs expanded (memoized)."""
+        result = self._memo.get(text)
+        if result is None:
+            if not self._aliases:
+                result = canonical_type(text)
+            else:
+                try:
+                    result = render(self.expand(parse_type(text)))
+                except TypeSyntaxError:
+                    result = ' '.join(text.split())
+            if len(self._memo) >= _MEMO_SIZE:
+                self._memo.clear()
+            self._memo[text] = result
+        return result
+
+    def same(self, a: str, b: str) -> bool:
+        """True if two type strings denote the same type."""
+        return a == b or canonical_type(a) == canonical_type(b) or self.canonical(a) == self.canonical(b)
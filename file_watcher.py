@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Minimal file watcher for the maintenance tools' watch modes.
+
+Uses Linux inotify (through ctypes, no extra dependencies) where available
+and falls back to polling file mtimes elsewhere. Changes are debounced, so
+an editor's save (often several writes and renames) is reported once.
+
+Usage:
+    for changed in watch_changes([Path("../get_it/lib")], suffix=".dart"):
+        print(changed)   # set of Paths that were modified, created or deleted
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+# inotify event masks (from <sys/inotify.h>)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT_HEADER = struct.Struct('iIII')
+
+# Quiet period that ends a burst of events
+DEBOUNCE_SECONDS = 0.05
+POLL_INTERVAL_SECONDS = 0.5
+
+
+class InotifyWatcher:
+    """Recursive inotify watch over a set of directory trees."""
+
+    def __init__(self, roots: Iterable[Path]):
+        libc_name = ctypes.util.find_library('c')
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, Path] = {}
+        for root in roots:
+            self._add_tree(Path(root))
+
+    def _add_tree(self, root: Path):
+        for dir_path, _, _ in os.walk(root):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dir_path), _WATCH_MASK)
+            if wd >= 0:
+                self._dirs[wd] = Path(dir_path)
+
+    def read(self, timeout: float) -> Set[Path]:
+        """Wait up to `timeout` seconds and return the paths that changed."""
+        changed: Set[Path] = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return changed
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add_tree(path)
+                continue
+            changed.add(path)
+
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Portable fallback that compares (mtime, size) snapshots."""
+
+    def __init__(self, roots: Iterable[Path], suffix: str):
+        self._roots = [Path(root) for root in roots]
+        self._suffix = suffix
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for root in self._roots:
+            for path in root.rglob(f"*{self._suffix}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def read(self, timeout: float) -> Set[Path]:
+        time.sleep(min(timeout, POLL_INTERVAL_SECONDS))
+        snapshot = self._scan()
+        changed = {
+            path for path in set(snapshot) | set(self._snapshot)
+            if snapshot.get(path) != self._snapshot.get(path)
+        }
+        self._snapshot = snapshot
+        return changed
+
+    def close(self):
+        pass
+
+
+def create_watcher(roots: List[Path], suffix: str):
+    """Return an inotify watcher on Linux, or a polling watcher elsewhere."""
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(roots, suffix)
+
+
+def watch_changes(roots: Iterable[Path], suffix: str = ".dart") -> Iterator[Set[Path]]:
+    """
+    Yield sets of changed files under `roots`, one set per burst of changes.
+
+    Only files ending in `suffix` are reported. Runs until interrupted.
+    """
+    roots = [Path(root) for root in roots if Path(root).exists()]
+    watcher = create_watcher(roots, suffix)
+    try:
+        while True:
+            changed = watcher.read(POLL_INTERVAL_SECONDS)
+            if not changed:
+                continue
+            # Collect the rest of the burst
+            while True:
+                more = watcher.read(DEBOUNCE_SECONDS)
+                if not more:
+                    break
+                changed |= more
+            changed = {path for path in changed if path.name.endswith(suffix)}
+            if changed:
+                yield changed
+    finally:
+        watcher.close()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Atomic file writes shared by the maintenance tools.
+
+Baselines, signature files and saved indexes are written to a temporary
+file in the same directory and renamed over the target, so readers and
+interrupted runs never see a half-written file.
+
+Usage:
+    write_atomic(Path("phase1_original_code.json"), content)
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_atomic(path: Path, content: bytes):
+    """Write `content` to `path` via a temporary file and rename."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
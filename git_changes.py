@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Git helpers for the `--since <ref>` modes of the maintenance tools.
+
+Lists the files that differ from a ref (committed, staged, unstaged and
+untracked changes alike) and reads a file's content at a ref, so a tool can
+re-check only what a branch or PR actually touched.
+
+Usage:
+    for path in changed_files("origin/main", Path("."), ["code_samples/lib"]):
+        print(path)
+"""
+
+import subprocess
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+
+class GitError(RuntimeError):
+    """A git command failed (not a repository, unknown ref, ...)."""
+
+
+def _git(repo: Path, *args: str) -> str:
+    try:
+        result = subprocess.run(
+            ['git', '-C', str(repo), *args],
+            capture_output=True, text=True, check=True,
+        )
+    except FileNotFoundError:
+        raise GitError("git is not installed") from None
+    except subprocess.CalledProcessError as e:
+        raise GitError(e.stderr.strip() or f"git {' '.join(args)} failed") from None
+    return result.stdout
+
+
+def changed_files(ref: str, repo: Path = Path("."), paths: Iterable = ()) -> List[Path]:
+    """
+    Return files under `paths` that differ between `ref` and the working tree.
+
+    Includes deleted files (which no longer exist) and untracked files.
+    Returned paths are `repo`-relative paths joined onto `repo`.
+    """
+    pathspec = ['--', *(str(path) for path in paths)] if paths else []
+    diff = _git(repo, 'diff', '--name-only', '--relative', '--no-renames', ref, *pathspec)
+    untracked = _git(repo, 'ls-files', '--others', '--exclude-standard', *pathspec)
+    names = {line for line in (diff + untracked).splitlines() if line}
+    return [repo / name for name in sorted(names)]
+
+
+def file_at_ref(ref: str, repo: Path, path: Path) -> Optional[str]:
+    """Return the text of `path` (relative to `repo`) at `ref`, or None if it did not exist."""
+    try:
+        return _git(repo, 'show', f"{ref}:./{path.as_posix()}")
+    except GitError:
+        return None
+
+
+def head_commit(repo: Path = Path(".")) -> Optional[str]:
+    """Return the commit checked out in `repo`, or None outside a git repository."""
+    try:
+        return _git(repo, 'rev-parse', 'HEAD').strip()
+    except GitError:
+        return None
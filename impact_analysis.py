@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Find the documentation pages affected by changed API members.
+
+Builds a reverse-dependency index in one pass over the package sources, the
+code samples and the markdown pages (English and translations):
+
+    (package, API member) -> sample regions whose code references it
+    sample region -> pages that include it with `<<<`
+
+A sample counts for a package only if it imports that package or lives
+under `lib/<package>/`, so common names such as `get` or `dispose` do not
+link one package's changes to another package's pages.
+
+The index is saved in .signature_cache/ together with a fingerprint (path,
+size, mtime) of every input file and is rebuilt only when an input changed,
+so a query takes a few milliseconds instead of a full validation and build.
+
+Usage:
+    python3 impact_analysis.py MEMBER [MEMBER ...] [--package PACKAGE] [--json]
+    python3 impact_analysis.py --since REF [--json]
+    python3 impact_analysis.py --diff FILE [--base REF] [--json]
+
+Options:
+    MEMBER       API member name, e.g. registerSingletonAsync, GetIt.pushNewScope
+                 or get_it:pushNewScope (plain names match every package)
+    --package P  Only look up the MEMBER names in package P
+    --since REF  Use the members added, removed or changed in the package
+                 checkouts since the git ref REF (a ref in their own history)
+    --diff FILE  Use the members touched by a unified diff of package sources
+                 (FILE may be - for stdin)
+    --base REF   Ref of the diff's old side in the package checkouts (default: HEAD)
+    --rebuild    Rebuild the index even if it is up to date
+    --json       Output results in JSON format
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from api_index import INDEX_CACHE_NAMESPACE, PACKAGES, PACKAGES_DIR, build_api_index, package_lib_dir
+from dart_scanner import IDENT, scan_declarations, tokenize
+from file_loader import iter_files
+from file_writer import write_atomic
+from git_changes import file_at_ref
+from line_index import LineIndex
+from region_parser import scan_file
+from signature_cache import SignatureCache
+from validate_includes import DOCS_DIR, SAMPLE_SUBDIRS, SAMPLES_DIR, build_include_graph
+
+# Paths
+CACHE_DIR = Path(".signature_cache")
+INDEX_PATH = CACHE_DIR / "impact_index.json"
+
+# Bump when the index format or what counts as a reference changes
+INDEX_VERSION = 2
+
+# Unified diff headers: `--- a/lib/get_it.dart`, `+++ b/lib/get_it.dart`
+# (either may be /dev/null) and `@@ -10,7 +10,8 @@`
+DIFF_OLD_FILE_RE = re.compile(r'^--- (?:a/)?(?P<path>\S+)')
+DIFF_FILE_RE = re.compile(r'^\+\+\+ (?:b/)?(?P<path>\S+)')
+HUNK_RE = re.compile(r'^@@ -(?P<old_start>\d+)(?:,\d+)? \+(?P<start>\d+)(?:,\d+)? @@')
+DEV_NULL = '/dev/null'
+
+# `import 'package:get_it/get_it.dart';` (exports count too)
+PACKAGE_IMPORT_RE = re.compile(r"""^\s*(?:import|export)\s+['"]package:(\w+)/""", re.MULTILINE)
+
+# (package, member); package None means every package
+MemberRef = Tuple[Optional[str], str]
+
+
+@dataclass
+class ImpactIndex:
+    """Reverse dependencies from API members to documentation pages."""
+    inputs: str  # fingerprint of every input file
+    # package -> member -> references: 'file#region' for regions, 'file' for the whole file
+    members: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+    # 'file#region' or 'file' -> [page, line] of every `<<<` include
+    includes: Dict[str, List[list]] = field(default_factory=dict)
+
+
+@dataclass
+class MemberImpact:
+    """The included samples and pages that reference one member."""
+    package: Optional[str]  # None if no sample of any package references the member
+    member: str
+    known: bool  # False if no sample of the package references it
+    samples: Dict[str, List[str]] = field(default_factory=dict)  # reference -> ['page:line', ...]
+
+
+def input_files() -> List[Path]:
+    """Return every file the index depends on, in a stable order."""
+    files = []
+    for subdir in SAMPLE_SUBDIRS:
+        files.extend(sorted((SAMPLES_DIR / subdir).rglob("*.dart")))
+    files.extend(sorted(page for page in DOCS_DIR.rglob("*.md") if 'node_modules' not in page.parts))
+    for package in PACKAGES:
+        lib_dir = package_lib_dir(package, PACKAGES_DIR)
+        if lib_dir.exists():
+            files.extend(sorted(lib_dir.rglob("*.dart")))
+    return files
+
+
+def inputs_fingerprint(files: List[Path]) -> str:
+    """Hash path, size and mtime of every input; any edit changes it."""
+    digest = hashlib.sha1(f"{INDEX_VERSION}\n".encode('utf-8'))
+    for path in files:
+        stat = path.stat()
+        digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def identifiers(text: str) -> Set[str]:
+    """Return the identifiers used in Dart code (comments and strings excluded)."""
+    return {token[1] for token in tokenize(text) if token[0] == IDENT}
+
+
+def sample_packages(path: Path, text: str) -> Set[str]:
+    """Return the indexed packages a sample uses: those it imports and the one it is filed under."""
+    packages = set(PACKAGE_IMPORT_RE.findall(text))
+    for subdir in SAMPLE_SUBDIRS:
+        try:
+            packages.add(path.relative_to(SAMPLES_DIR / subdir).parts[0])
+        except ValueError:
+            continue
+    return packages & set(PACKAGES)
+
+
+def build_impact_index(fingerprint: str) -> ImpactIndex:
+    """Scan sources, samples and pages once and build the reverse index."""
+    cache = SignatureCache(CACHE_DIR, namespace=INDEX_CACHE_NAMESPACE)
+    api = build_api_index(PACKAGES, PACKAGES_DIR, cache=cache)
+    api_names: Dict[str, Set[str]] = {
+        package: {
+            symbol.declaration.name
+            for symbol in api.public_symbols(package, kinds=('method', 'getter', 'setter'))
+        }
+        for package in PACKAGES
+    }
+
+    index = ImpactIndex(inputs=fingerprint)
+    sample_files = [path for subdir in SAMPLE_SUBDIRS for path in sorted((SAMPLES_DIR / subdir).rglob("*.dart"))]
+
+    for loaded in iter_files(sample_files):
+        raw = loaded.read()
+        text = raw.decode('utf-8')
+        packages = sorted(sample_packages(loaded.path, text))
+        if not packages:
+            continue
+        file_key = os.path.normpath(loaded.path)
+        references = [(file_key, identifiers(text))]
+        for region in scan_file(loaded.path, data=raw).regions:
+            references.append((f"{file_key}#{region.name}", identifiers(region.body)))
+        for package in packages:
+            members = index.members.setdefault(package, {})
+            for reference, names in references:
+                for name in sorted(names & api_names[package]):
+                    members.setdefault(name, []).append(reference)
+
+    for includes in build_include_graph(DOCS_DIR).values():
+        for include in includes:
+            key = f"{include.target}#{include.region}" if include.region else include.target
+            index.includes.setdefault(key, []).append([include.page, include.line])
+
+    return index
+
+
+def load_impact_index(rebuild: bool = False) -> Tuple[ImpactIndex, bool]:
+    """
+    Return the index, rebuilding and saving it if any input changed.
+
+    Returns (index, reused) where `reused` is True if the saved index was
+    up to date.
+    """
+    fingerprint = inputs_fingerprint(input_files())
+
+    if not rebuild:
+        try:
+            with open(INDEX_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('inputs') == fingerprint:
+                return ImpactIndex(**data), True
+        except (OSError, ValueError, TypeError):
+            pass
+
+    index = build_impact_index(fingerprint)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_atomic(INDEX_PATH, json.dumps(asdict(index), separators=(',', ':')).encode('utf-8'))
+    except OSError:
+        # An index that cannot be saved is just rebuilt next time
+        pass
+    return index, False
+
+
+def impact_of(index: ImpactIndex, members: List[MemberRef]) -> List[MemberImpact]:
+    """
+    Look up the included samples and pages of each member.
+
+    A member without a package is looked up in every package whose
+    samples reference it.
+    """
+    impacts = []
+    for package, member in members:
+        if package is not None:
+            packages = [package]
+        else:
+            packages = [name for name in PACKAGES if member in index.members.get(name, {})] or [None]
+        for package in packages:
+            references = index.members.get(package, {}).get(member)
+            impact = MemberImpact(package=package, member=member, known=references is not None)
+            for reference in references or []:
+                pages = index.includes.get(reference)
+                if pages:
+                    impact.samples[reference] = [f"{page}:{line}" for page, line in pages]
+            impacts.append(impact)
+    return impacts
+
+
+def parse_member(spec: str, package: Optional[str] = None) -> MemberRef:
+    """Parse `member`, `Class.member` or `package:member` (the class does not matter)."""
+    prefix, sep, member = spec.rpartition(':')
+    if sep:
+        package = prefix
+    return package, member.rsplit('.', 1)[-1]
+
+
+def members_on_lines(text: str, lines: Set[int]) -> Set[str]:
+    """Return the names of the declarations in `text` that span any of `lines` (1-based)."""
+    line_index = LineIndex(text)
+    names = set()
+    for decl in scan_declarations(text):
+        span = line_index.span('', decl.start, decl.end)
+        if any(span.line <= line <= span.end_line for line in lines):
+            names.add(decl.name)
+    return names
+
+
+def members_in_diff(diff_text: str, base: str = 'HEAD') -> Set[MemberRef]:
+    """
+    Return the members a unified diff of package sources touches.
+
+    Added lines are mapped onto the declarations of the current source
+    file, removed lines onto the declarations of the file at `base` (the
+    diff's old side), so a removed body statement counts for the member
+    containing it and a removed member counts by itself. If the old file
+    cannot be read from git, a removal touches the position in the current
+    file where the lines used to be.
+    """
+    lib_roots = [(package, package_lib_dir(package, PACKAGES_DIR).parent) for package in PACKAGES]
+    added: Dict[Tuple[str, Path], Set[int]] = {}
+    removed: Dict[Tuple[str, Path, str], Set[int]] = {}
+    old_texts: Dict[str, Optional[Tuple[str, Path, str]]] = {}
+
+    def old_source(path: str) -> Optional[Tuple[str, Path, str]]:
+        """(package, root, text) of a package file at `base`, or None."""
+        if path not in old_texts:
+            old_texts[path] = None
+            for package, root in lib_roots:
+                text = file_at_ref(base, root, Path(path))
+                if text is not None:
+                    old_texts[path] = (package, root, text)
+                    break
+        return old_texts[path]
+
+    old_path = new_source = old = None
+    old_no = new_no = 0
+
+    for line in diff_text.splitlines():
+        old_match = DIFF_OLD_FILE_RE.match(line)
+        if old_match:
+            old_path = old_match.group('path')
+            continue
+        file_match = DIFF_FILE_RE.match(line)
+        if file_match:
+            new_path = file_match.group('path')
+            new_source = None
+            if new_path != DEV_NULL:  # `+++ /dev/null`: the file was deleted
+                candidates = [(package, root / new_path) for package, root in lib_roots]
+                new_source = next((candidate for candidate in candidates if candidate[1].is_file()), None)
+            old = old_source(old_path) if old_path and old_path != DEV_NULL else None
+            continue
+        hunk = HUNK_RE.match(line)
+        if hunk:
+            old_no, new_no = int(hunk.group('old_start')), int(hunk.group('start'))
+            continue
+        if line.startswith(('diff ', 'index ')):
+            continue
+        if line.startswith('+'):
+            if new_source is not None:
+                added.setdefault(new_source, set()).add(new_no)
+            new_no += 1
+        elif line.startswith('-'):
+            if old is not None:
+                removed.setdefault(old, set()).add(old_no)
+            elif new_source is not None:
+                added.setdefault(new_source, set()).add(new_no)
+            old_no += 1
+        elif line.startswith(' '):
+            old_no += 1
+            new_no += 1
+
+    members: Set[MemberRef] = set()
+    for (package, path), lines in added.items():
+        members.update((package, name) for name in members_on_lines(path.read_text(encoding='utf-8'), lines))
+    for (package, _root, text), lines in removed.items():
+        members.update((package, name) for name in members_on_lines(text, lines))
+    return members
+
+
+def print_report(impacts: List[MemberImpact], elapsed_ms: float, reused: bool):
+    """Print the affected samples and pages of each member."""
+    print("\n" + "="*80)
+    print("DOCUMENTATION IMPACT")
+    print("="*80)
+
+    pages = set()
+    for impact in impacts:
+        print(f"\n{impact.package}: {impact.member}" if impact.package else f"\n{impact.member}")
+        if not impact.known:
+            print("  (not referenced by any sample of the package, or not a member of it)")
+        elif not impact.samples:
+            print("  (referenced only by samples no page includes)")
+        for reference, includes in impact.samples.items():
+            print(f"  {reference}")
+            for include in includes:
+                print(f"    {include}")
+                pages.add(include.rsplit(':', 1)[0])
+
+    print(f"\n📝 PAGES TO REVIEW ({len(pages)}):")
+    for page in sorted(pages):
+        print(f"  {page}")
+
+    print(f"\nAnswered in {elapsed_ms:.0f} ms ({'index up to date' if reused else 'index rebuilt'})")
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None):
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog=prog, description="List doc pages affected by changed API members")
+    parser.add_argument('members', nargs='*', metavar='MEMBER',
+                        help='Changed API member (e.g. pushNewScope or get_it:pushNewScope)')
+    parser.add_argument('--package', choices=PACKAGES, help='Package of the MEMBER names (default: any)')
+    changes = parser.add_mutually_exclusive_group()
+    changes.add_argument('--since', metavar='REF',
+                         help='Use the members changed in the package checkouts since REF')
+    changes.add_argument('--diff', metavar='FILE', help='Use the members touched by a unified diff (- for stdin)')
+    parser.add_argument('--base', metavar='REF', default='HEAD',
+                        help="Ref of the diff's old side in the package checkouts (default: HEAD)")
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild the index even if it is up to date')
+    parser.add_argument('--json', action='store_true', help='Output JSON format')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    log = (lambda *a, **k: print(*a, file=sys.stderr, **k)) if args.json else print
+
+    members = [parse_member(member, args.package) for member in args.members]
+    if args.since:
+        from git_changes import GitError
+        from validate_signatures import changed_members
+        try:
+            changed = changed_members(args.since, log=log)
+            members += sorted((package, name) for package, names in changed.items() for name in names)
+        except GitError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+    elif args.diff:
+        try:
+            diff_text = sys.stdin.read() if args.diff == '-' else Path(args.diff).read_text(encoding='utf-8')
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        members += sorted(members_in_diff(diff_text, args.base))
+
+    if not members and not (args.since or args.diff):
+        parser.error('give changed members, --since REF or --diff FILE')
+
+    index, reused = load_impact_index(args.rebuild)
+    impacts = impact_of(index, list(dict.fromkeys(members)))
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if args.json:
+        pages = sorted({include.rsplit(':', 1)[0]
+                        for impact in impacts for includes in impact.samples.values() for include in includes})
+        print(json.dumps({'members': [asdict(impact) for impact in impacts], 'pages': pages}, indent=2))
+    else:
+        print_report(impacts, elapsed_ms, reused)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Newline-offset tables for turning offsets into line and column positions.
+
+The scanners report positions as offsets into the scanned text. A
+LineIndex records where each line starts (one compact array of integers)
+and maps any offset to a 1-based (line, column) with a binary search, so
+reporting a position never copies or re-splits the text.
+
+`map_lines` builds the table of a file through a read-only memory map, so
+the file is not read into memory at all. Columns count characters, like
+the scanner offsets: for files that are not pure ASCII the table is built
+from the decoded text instead.
+
+Usage:
+    lines = map_lines(Path("../get_it/lib/get_it.dart"))
+    span = lines.span("../get_it/lib/get_it.dart", decl.start, decl.end)
+    print(span)  # ../get_it/lib/get_it.dart:107:3
+"""
+
+import bisect
+import mmap
+import re
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple, Union
+
+_NON_ASCII_RE = re.compile(rb'[^\x00-\x7f]')
+
+
+@dataclass(frozen=True)
+class Span:
+    """A range of a file; `end_line`/`end_column` point at its last character."""
+    file: str
+    line: int
+    column: int
+    end_line: int
+    end_column: int
+
+    def __str__(self) -> str:
+        return f"{self.file}:{self.line}:{self.column}"
+
+
+class LineIndex:
+    """Maps offsets into a text (or bytes, or memory map) to 1-based (line, column)."""
+
+    def __init__(self, data: Union[str, bytes, mmap.mmap]):
+        newline = '\n' if isinstance(data, str) else b'\n'
+        starts = array('q', [0])
+        position = data.find(newline)
+        while position != -1:
+            starts.append(position + 1)
+            position = data.find(newline, position + 1)
+        self.starts = starts
+
+    def __len__(self) -> int:
+        """Number of lines."""
+        return len(self.starts)
+
+    def at(self, offset: int) -> Tuple[int, int]:
+        """Return the (line, column) of `offset`."""
+        line = bisect.bisect_right(self.starts, offset)
+        return line, offset - self.starts[line - 1] + 1
+
+    def span(self, file: str, start: int, end: int, first_line: int = 1) -> Span:
+        """
+        Return the Span of the offsets [start, end).
+
+        `first_line` is the line number of offset 0, for texts that start
+        inside a file (such as a region body).
+        """
+        line, column = self.at(start)
+        end_line, end_column = self.at(max(start, end - 1))
+        shift = first_line - 1
+        return Span(file, line + shift, column, end_line + shift, end_column)
+
+
+def map_lines(path: Path) -> LineIndex:
+    """Build the line index of a file through a memory map; offsets are in characters."""
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            return LineIndex(b'')  # empty files cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if _NON_ASCII_RE.search(data) is None:
+                # Byte and character offsets agree
+                return LineIndex(data)
+            return LineIndex(str(data, 'utf-8'))
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the documentation maintenance tools.
+
+Each subcommand runs one tool with that tool's own options; the tool module
+is imported only when its subcommand runs, so `--help` and single commands
+start fast. All tools run in one process share their inputs: the source
+index of the packages is built once (api_index.enable_sharing) and every
+sample file's regions are scanned once (region_parser.enable_sharing), so
+`all` parses each Dart file a single time however many stages read it.
+
+Usage:
+    python3 maintain.py COMMAND [OPTIONS...]
+    python3 maintain.py all [--check] [--profile FILE [--profile-format json|chrome] [--profile-memory]]
+
+Commands:
+    validate      validate_signatures.py
+    update        update_signatures.py
+    baseline      update_baseline.py
+    includes      validate_includes.py
+    translations  check_translations.py
+    syntax        check_dart_syntax.py
+    impact        impact_analysis.py
+    all           syntax, update, validate, includes and baseline in one process;
+                  with --check nothing is written (update --dry-run, baseline --check)
+
+Run `python3 maintain.py COMMAND --help` for the options of one tool.
+"""
+
+import importlib
+import sys
+import time
+from typing import List, Optional, Tuple
+
+import api_index
+import profiling
+import region_parser
+
+# Subcommand -> (module, description); modules are imported on first use
+COMMANDS = {
+    'validate': ('validate_signatures', 'Validate signature files against the package sources'),
+    'update': ('update_signatures', 'Regenerate signature files from the package sources'),
+    'baseline': ('update_baseline', 'Record or check the code sample baseline'),
+    'includes': ('validate_includes', 'Validate snippet includes in the docs'),
+    'translations': ('check_translations', 'Check translated pages against the English pages'),
+    'syntax': ('check_dart_syntax', 'Syntax prefilter for code_samples'),
+    'impact': ('impact_analysis', 'List doc pages affected by changed API members'),
+}
+
+
+def pipeline(check: bool) -> List[Tuple[str, List[str]]]:
+    """Stages of `all`, in order, with their arguments."""
+    return [
+        ('syntax', []),
+        ('update', ['--dry-run'] if check else []),
+        ('validate', []),
+        ('includes', []),
+        ('baseline', ['--check'] if check else []),
+    ]
+
+
+def run_command(command: str, argv: List[str]) -> int:
+    """Run one tool's main() in this process and return its exit code."""
+    module_name, _ = COMMANDS[command]
+    module = importlib.import_module(module_name)
+    try:
+        module.main(argv, prog=f"maintain.py {command}")
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_all(check: bool) -> int:
+    """Run every stage, even after a failure, and print a summary."""
+    results = []
+    for command, argv in pipeline(check):
+        print("\n" + "#"*80)
+        print(f"# maintain.py {' '.join([command, *argv])}")
+        print("#"*80)
+        started = time.perf_counter()
+        with profiling.phase(command):
+            code = run_command(command, argv)
+        results.append((command, code, time.perf_counter() - started))
+
+    print("\n" + "="*80)
+    print("MAINTENANCE SUMMARY")
+    print("="*80 + "\n")
+    for command, code, elapsed in results:
+        icon = '✅' if code == 0 else '❌'
+        print(f"  {icon} {command:<10} exit {code}  {elapsed * 1000:.0f} ms")
+
+    return 1 if any(code for _, code, _ in results) else 0
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point."""
+    import argparse
+
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        api_index.enable_sharing()
+        region_parser.enable_sharing()
+        sys.exit(run_command(argv[0], argv[1:]))
+
+    parser = argparse.ArgumentParser(
+        description="Run the documentation maintenance tools",
+        epilog="Commands: " + "; ".join(f"{name}: {info[1]}" for name, info in COMMANDS.items())
+               + "; all: run the whole sequence. Use 'COMMAND --help' for a tool's options.",
+    )
+    parser.add_argument('command', choices=[*COMMANDS, 'all'], help='Tool to run')
+    parser.add_argument('--check', action='store_true',
+                        help='With all: only report, never write (update --dry-run, baseline --check)')
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    profiling.enable_from_args(args, tool='maintain')
+    api_index.enable_sharing()
+    region_parser.enable_sharing()
+    sys.exit(run_all(args.check))
+
+
+if __name__ == '__main__':
+    main()
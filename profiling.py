@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Opt-in per-phase instrumentation for the maintenance tools.
+
+Phases (file I/O, extraction, parameter parsing, comparison, reporting...)
+are marked in the tools with `phase()` context managers or the `profiled()`
+decorator. Until `enable()` is called these are a shared no-op context
+manager and a single flag check, so the overhead of disabled profiling is
+negligible.
+
+When enabled, every phase records wall time, call count and bytes read,
+both in total and per file, plus peak memory (process high-water mark, or
+traced Python allocations with `trace_memory`). The report is written on
+exit as JSON or in Chrome trace format (open in chrome://tracing or
+https://ui.perfetto.dev).
+
+Usage:
+    import profiling
+
+    profiling.enable(Path("profile.json"), fmt="json", tool="validate_signatures")
+
+    with profiling.phase("read", file=path):
+        data = path.read_bytes()
+        profiling.add_bytes(len(data))
+"""
+
+import atexit
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+class _PhaseStats:
+    __slots__ = ('calls', 'wall_s', 'bytes_read', 'peak_kb')
+
+    def __init__(self):
+        self.calls = 0
+        self.wall_s = 0.0
+        self.bytes_read = 0
+        self.peak_kb = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            'calls': self.calls,
+            'wall_s': round(self.wall_s, 6),
+            'bytes_read': self.bytes_read,
+            'peak_kb': round(self.peak_kb, 1),
+        }
+
+
+class _Frame:
+    __slots__ = ('name', 'file', 'started', 'bytes_read', 'child_peak')
+
+    def __init__(self, name: str, file: Optional[str]):
+        self.name = name
+        self.file = file
+        self.started = time.perf_counter()
+        self.bytes_read = 0
+        self.child_peak = 0
+
+
+class Profiler:
+    """Collects per-phase and per-file statistics."""
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_memory = False
+        self.tool = ""
+        self.output: Optional[Path] = None
+        self.fmt = "json"
+        self.phases: Dict[str, _PhaseStats] = {}
+        self.files: Dict[str, Dict[str, _PhaseStats]] = {}
+        self.events: List[dict] = []
+        self._stack = threading.local()
+        self._origin = time.perf_counter()
+
+    def _frames(self) -> List[_Frame]:
+        frames = getattr(self._stack, 'frames', None)
+        if frames is None:
+            frames = self._stack.frames = []
+        return frames
+
+    @contextlib.contextmanager
+    def phase(self, name: str, file=None):
+        frame = _Frame(name, str(file) if file is not None else None)
+        frames = self._frames()
+        frames.append(frame)
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            ended = time.perf_counter()
+            frames.pop()
+            self._record(frame, ended, frames)
+
+    def _peak_kb(self, frame: _Frame) -> float:
+        if self.trace_memory:
+            peak = max(tracemalloc.get_traced_memory()[1], frame.child_peak)
+            return peak / 1024
+        if resource is not None:
+            # ru_maxrss is in KB on Linux, bytes on macOS
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return rss / 1024 if os.uname().sysname == 'Darwin' else rss
+        return 0.0
+
+    def _record(self, frame: _Frame, ended: float, parents: List[_Frame]):
+        wall = ended - frame.started
+        peak_kb = self._peak_kb(frame)
+        if parents and self.trace_memory:
+            parents[-1].child_peak = max(parents[-1].child_peak, int(peak_kb * 1024))
+
+        targets = [self.phases.setdefault(frame.name, _PhaseStats())]
+        if frame.file is not None:
+            targets.append(self.files.setdefault(frame.file, {}).setdefault(frame.name, _PhaseStats()))
+        for stats in targets:
+            stats.calls += 1
+            stats.wall_s += wall
+            stats.bytes_read += frame.bytes_read
+            stats.peak_kb = max(stats.peak_kb, peak_kb)
+
+        if self.fmt == 'chrome':
+            args = {'bytes_read': frame.bytes_read}
+            if frame.file is not None:
+                args['file'] = frame.file
+            self.events.append({
+                'name': frame.name,
+                'cat': self.tool,
+                'ph': 'X',
+                'ts': round((frame.started - self._origin) * 1e6, 1),
+                'dur': round(wall * 1e6, 1),
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+                'args': args,
+            })
+
+    def add_bytes(self, count: int):
+        frames = self._frames()
+        if frames:
+            frames[-1].bytes_read += count
+
+    def report(self) -> dict:
+        """Return the collected statistics as plain data."""
+        if self.fmt == 'chrome':
+            return {'traceEvents': self.events, 'displayTimeUnit': 'ms'}
+        return {
+            'tool': self.tool,
+            'wall_s': round(time.perf_counter() - self._origin, 6),
+            'memory': 'traced' if self.trace_memory else 'max_rss',
+            'phases': {name: stats.as_dict() for name, stats in sorted(self.phases.items())},
+            'files': {
+                file: {name: stats.as_dict() for name, stats in sorted(phases.items())}
+                for file, phases in sorted(self.files.items())
+            },
+        }
+
+    def write(self):
+        if self.output is None:
+            return
+        with open(self.output, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=1)
+
+
+PROFILER = Profiler()
+
+
+def enable(output: Path, fmt: str = "json", tool: str = "", trace_memory: bool = False):
+    """Turn profiling on; the report is written to `output` at exit."""
+    PROFILER.enabled = True
+    PROFILER.output = Path(output)
+    PROFILER.fmt = fmt
+    PROFILER.tool = tool
+    PROFILER.trace_memory = trace_memory
+    PROFILER._origin = time.perf_counter()
+    if trace_memory:
+        tracemalloc.start()
+    atexit.register(PROFILER.write)
+
+
+def phase(name: str, file=None):
+    """Context manager timing one phase (a no-op unless profiling is enabled)."""
+    if not PROFILER.enabled:
+        return _NULL_CONTEXT
+    return PROFILER.phase(name, file)
+
+
+def add_bytes(count: int):
+    """Attribute `count` bytes read to the innermost open phase."""
+    if PROFILER.enabled:
+        PROFILER.add_bytes(count)
+
+
+def profiled(name: str) -> Callable:
+    """Decorator that times every call of a function as phase `name`."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            with PROFILER.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def add_arguments(parser):
+    """Add the shared --profile options to an argparse parser."""
+    parser.add_argument('--profile', type=Path, metavar='FILE',
+                        help='Write per-phase timing, call counts, bytes read and peak memory to FILE')
+    parser.add_argument('--profile-format', choices=('json', 'chrome'), default='json',
+                        help='Profile format: summary JSON or Chrome trace events (default: json)')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='Trace Python allocations for per-phase peak memory (slower)')
+
+
+def enable_from_args(args, tool: str):
+    """Enable profiling if --profile was given."""
+    if args.profile is not None:
+        enable(args.profile, fmt=args.profile_format, tool=tool, trace_memory=args.profile_memory)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Single-pass parser for `// #region name` ... `// #endregion name` markers.
+
+Shared by the baseline tool, signature validation and include checking, so
+every tool pairs markers the same way VitePress does:
+
+    - `#endregion name` closes the most recent open region of that name,
+      which allows nested and overlapping regions
+    - a bare `#endregion` closes the innermost open region
+    - markers must start their line (after indentation)
+
+The text is scanned once with a bytes regex, so it works on `bytes` and on
+memory-mapped files alike. Regions carry 1-based line numbers of their
+markers and byte offsets of their bodies.
+
+Usage:
+    scan = scan_file(Path("code_samples/lib/get_it/async_objects.dart"))
+    for region in scan.regions:
+        print(region.name, region.start_line, region.end_line, region.body)
+"""
+
+import mmap
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import profiling
+
+# Files at least this large are memory-mapped instead of read
+MMAP_THRESHOLD = 256 * 1024
+
+# Scans shared by every tool run in this process, keyed by (path, size,
+# mtime) so edited files are re-scanned (see enable_sharing); None while off
+_shared_scans: Optional[Dict[Tuple[str, int, int], 'RegionScan']] = None
+
+_MARKER_RE = re.compile(rb'^[ \t]*//[ \t]*#(region|endregion)\b[ \t]*(\S*)[^\n]*\n?', re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class Region:
+    """A closed region; offsets index into the scanned bytes."""
+    name: str
+    start_line: int  # line of the `#region` marker
+    end_line: int  # line of the `#endregion` marker
+    body_start: int  # first byte after the `#region` line
+    body_end: int  # first byte of the `#endregion` line
+    depth: int  # number of regions open around it
+    body: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RegionIssue:
+    """A marker that could not be paired."""
+    name: str
+    line: int
+    problem: str  # 'unclosed', 'unmatched_end'
+
+
+@dataclass
+class RegionScan:
+    """All regions of one file, in order of their `#region` markers."""
+    regions: List[Region] = field(default_factory=list)
+    issues: List[RegionIssue] = field(default_factory=list)
+
+    def find(self, name: str) -> Optional[Region]:
+        """Return the first region called `name`."""
+        return next((region for region in self.regions if region.name == name), None)
+
+    def names(self) -> Counter:
+        """Return how often each region name is defined."""
+        return Counter(region.name for region in self.regions)
+
+
+def parse_regions(data: Union[bytes, mmap.mmap, str], bodies: bool = True) -> RegionScan:
+    """
+    Pair the region markers of a file in one pass.
+
+    `data` may be bytes, a memory map or text (which is encoded as UTF-8,
+    so offsets are always byte offsets). With `bodies`, each region's text
+    is decoded with universal newlines (like a text-mode read) and stored
+    in `Region.body`.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+
+    scan = RegionScan()
+    # Open regions: [name, marker line, body start, depth, order]
+    stack: List[list] = []
+    closed = []
+    line = 1
+    position = 0
+
+    for match in _MARKER_RE.finditer(data):
+        line += data[position:match.start()].count(b'\n')
+        position = match.start()
+        name = match.group(2).decode('utf-8', 'replace')
+
+        if match.group(1) == b'region':
+            stack.append([name, line, match.end(), len(stack), len(closed) + len(stack)])
+            continue
+
+        # `#endregion name` closes the latest region of that name; bare closes the innermost
+        for i in range(len(stack) - 1, -1, -1):
+            if not name or stack[i][0] == name:
+                open_name, start_line, body_start, depth, order = stack.pop(i)
+                body = _decode(data[body_start:match.start()]) if bodies else None
+                closed.append((order, Region(open_name, start_line, line, body_start,
+                                             match.start(), depth, body)))
+                break
+        else:
+            scan.issues.append(RegionIssue(name, line, 'unmatched_end'))
+
+    for open_name, start_line, _, _, _ in stack:
+        scan.issues.append(RegionIssue(open_name, start_line, 'unclosed'))
+
+    scan.regions = [region for _, region in sorted(closed, key=lambda item: item[0])]
+    scan.issues.sort(key=lambda issue: issue.line)
+    return scan
+
+
+def _decode(raw: bytes) -> str:
+    text = raw.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def enable_sharing():
+    """Keep every file scan for later callers in this process (see maintain.py)."""
+    global _shared_scans
+    if _shared_scans is None:
+        _shared_scans = {}
+
+
+def scan_file(path: Path, bodies: bool = True, data: Optional[bytes] = None) -> RegionScan:
+    """
+    Read a file once (memory-mapped if large) and parse its regions.
+
+    Pass `data` when the file was already read (e.g. by file_loader). With
+    sharing enabled, bodies are always kept and an unchanged file is
+    scanned only once per process.
+    """
+    if _shared_scans is None:
+        return _scan_file(path, bodies, data)
+
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    scan = _shared_scans.get(key)
+    if scan is None:
+        scan = _shared_scans[key] = _scan_file(path, True, data)
+    return scan
+
+
+def _scan_file(path: Path, bodies: bool, data: Optional[bytes]) -> RegionScan:
+    if data is not None:
+        return parse_regions(data, bodies)
+    with open(path, 'rb') as f:
+        size = f.seek(0, 2)
+        f.seek(0)
+        profiling.add_bytes(size)
+        if size < MMAP_THRESHOLD:
+            return parse_regions(f.read(), bodies)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return parse_regions(data, bodies)
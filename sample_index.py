@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Inverted index from declared method names to documentation signature files.
+
+Every `*_signature.dart` file is read once; the declarations inside its
+`#region example` block are scanned and recorded in both directions:
+
+    method name -> signature files declaring it
+    signature file -> method names it declares
+
+This replaces per-method scans of the sample directory and hand-maintained
+method-to-file tables.
+
+Usage:
+    index = build_signature_index(Path("code_samples/lib/get_it"))
+    for sig_file in index.files_for('registerSingleton'):
+        print(sig_file)
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+import profiling
+from dart_scanner import scan_declarations
+from file_loader import iter_files
+from region_parser import parse_regions, scan_file
+
+SIGNATURE_GLOB = "*_signature.dart"
+
+
+class SignatureIndex:
+    """Method name <-> signature file index."""
+
+    def __init__(self):
+        self.files_by_method: Dict[str, List[Path]] = {}
+        self.methods_by_file: Dict[Path, List[str]] = {}
+
+    def add_file(self, sig_file: Path, methods: Iterable[str]):
+        """Record the methods declared by one signature file."""
+        methods = list(dict.fromkeys(methods))
+        self.methods_by_file[sig_file] = methods
+        for method in methods:
+            self.files_by_method.setdefault(method, []).append(sig_file)
+
+    def remove_file(self, sig_file: Path):
+        """Forget a signature file (before re-adding it or after deletion)."""
+        for method in self.methods_by_file.pop(sig_file, []):
+            files = self.files_by_method.get(method, [])
+            if sig_file in files:
+                files.remove(sig_file)
+            if not files:
+                self.files_by_method.pop(method, None)
+
+    def files_for(self, method_name: str) -> List[Path]:
+        """Return the signature files that declare `method_name`."""
+        return self.files_by_method.get(method_name, [])
+
+    def methods_in(self, sig_file: Path) -> List[str]:
+        """Return the methods declared by `sig_file`."""
+        return self.methods_by_file.get(sig_file, [])
+
+
+def declared_methods(content: str) -> List[str]:
+    """Return the public methods declared in a signature file's example region."""
+    example = parse_regions(content).find('example')
+    return _public_methods(example.body if example is not None else content)
+
+
+def _public_methods(content: str) -> List[str]:
+    return [
+        decl.name
+        for decl in scan_declarations(content)
+        if decl.kind == 'method' and not decl.name.startswith('_')
+    ]
+
+
+def build_signature_index(*sig_dirs: Path) -> SignatureIndex:
+    """Read every signature file in `sig_dirs` once and index its methods."""
+    index = SignatureIndex()
+    sig_files = [sig_file for sig_dir in sig_dirs for sig_file in sorted(sig_dir.glob(SIGNATURE_GLOB))]
+
+    # Files are prefetched on a thread pool while earlier ones are scanned
+    for loaded in iter_files(sig_files):
+        with profiling.phase('read', loaded.path):
+            raw = loaded.read()
+            example = scan_file(loaded.path, data=raw).find('example')
+            content = example.body if example is not None else raw.decode('utf-8')
+        index.add_file(loaded.path, _public_methods(content))
+
+    return index
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Content-hash keyed on-disk cache for parsed signatures.
+
+Each entry is keyed by the SHA-256 of the file contents plus a namespace that
+includes the parser version, so editing a file or changing the parser
+invalidates exactly the affected entries. Values are stored as JSON so they
+do not depend on the module that produced them.
+
+The cache is bounded: once the total size exceeds `max_bytes`, the least
+recently used entries are evicted by `prune()`.
+
+Usage:
+    cache = SignatureCache(Path(".signature_cache"), namespace="validate/1")
+    data = cache.get(content_bytes)
+    if data is None:
+        data = parse(content_bytes)
+        cache.put(content_bytes, data)
+    cache.prune()
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from file_writer import write_atomic
+
+DEFAULT_CACHE_DIR = Path(".signature_cache")
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+class SignatureCache:
+    """Persistent cache of parse results keyed by content hash."""
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, namespace: str = "",
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, content: bytes) -> Path:
+        digest = hashlib.sha256()
+        digest.update(self.namespace.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(content)
+        return self.cache_dir / f"{digest.hexdigest()}.json"
+
+    def get(self, content: bytes) -> Optional[Any]:
+        """Return the cached value for `content`, or None on a miss."""
+        entry = self._entry_path(content)
+        try:
+            with open(entry, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        # Mark as recently used for eviction
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return value
+
+    def put(self, content: bytes, value: Any) -> None:
+        """Store `value` for `content`, replacing any existing entry atomically."""
+        entry = self._entry_path(content)
+        data = json.dumps(value, separators=(',', ':')).encode('utf-8')
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Removes its temporary file on failure, so no orphan escapes prune()
+            write_atomic(entry, data)
+        except OSError:
+            # A cache that cannot be written is just a slower run
+            pass
+
+    def prune(self) -> int:
+        """Evict least recently used entries until under `max_bytes`.
+
+        Returns:
+            Number of entries removed
+        """
+        try:
+            entries = [
+                (stat.st_mtime, stat.st_size, path)
+                for path in self.cache_dir.glob("*.json")
+                for stat in (path.stat(),)
+            ]
+        except OSError:
+            return 0
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        return removed
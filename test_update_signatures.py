@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for update_signatures.py.
+
+Usage:
+    python3 -m pytest test_update_signatures.py
+"""
+
+import unittest
+
+from update_signatures import MethodSignature, update_signature_content
+
+REGISTER_FACTORY = MethodSignature(
+    name='registerFactory',
+    return_type='void',
+    generic_params='<T extends Object>',
+    parameters='FactoryFunc<T> factoryFunc, {String? instanceName}',
+    full_signature='  void registerFactory<T extends Object>(\n'
+                   '    FactoryFunc<T> factoryFunc, {\n'
+                   '    String? instanceName,\n'
+                   '  });',
+    comment='  /// registers a type so that a new instance will be created on each call',
+)
+
+
+class UpdateSignatureContentTest(unittest.TestCase):
+    def test_keeps_hand_written_header(self):
+        current = (
+            "// ignore_for_file: missing_function_body, unused_element\n"
+            "import 'package:get_it/get_it.dart';\n"
+            "import '_shared/stubs.dart';\n"
+            "\n"
+            "final getIt = GetIt.instance;\n"
+            "\n"
+            "// #region example\n"
+            "void registerFactory<T>(\n"
+            "  FactoryFunc<T> factoryFunc, {\n"
+            "  String? instanceName,\n"
+            "}) {}\n"
+            "// #endregion example\n"
+        ).encode('utf-8')
+
+        updated = update_signature_content(current, REGISTER_FACTORY).decode('utf-8')
+
+        header, _, rest = updated.partition("// #region example\n")
+        self.assertEqual(header, current.decode('utf-8').partition("// #region example\n")[0])
+        self.assertIn("import 'package:get_it/get_it.dart';", header)
+        self.assertIn("import '_shared/stubs.dart';", header)
+        self.assertIn("final getIt = GetIt.instance;", header)
+        self.assertEqual(rest, (
+            "/// registers a type so that a new instance will be created on each call\n"
+            "void registerFactory<T extends Object>(\n"
+            "  FactoryFunc<T> factoryFunc, {\n"
+            "  String? instanceName,\n"
+            "});\n"
+            "// #endregion example\n"
+        ))
+
+    def test_keeps_content_after_region(self):
+        current = b"// #region example\nvoid old();\n// #endregion example\n\nvoid main() {}\n"
+        updated = update_signature_content(current, REGISTER_FACTORY)
+        self.assertTrue(updated.endswith(b"// #endregion example\n\nvoid main() {}\n"))
+
+    def test_unchanged_file_is_not_rewritten(self):
+        current = update_signature_content(b"// #region example\n// #endregion example\n", REGISTER_FACTORY)
+        self.assertEqual(update_signature_content(current, REGISTER_FACTORY), current)
+
+    def test_file_without_region_gets_template(self):
+        updated = update_signature_content(b"", REGISTER_FACTORY).decode('utf-8')
+        self.assertTrue(updated.startswith("// ignore_for_file: missing_function_body, unused_element\n"))
+        self.assertIn("// #region example\n/// registers a type", updated)
+
+
+if __name__ == '__main__':
+    unittest.main()
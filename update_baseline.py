@@ -2,109 +2,612 @@
 """
 Update baseline code snapshot from current state.
 
-This script extracts code from all files in code_samples/lib/get_it/ and saves
-a JSON snapshot for future comparison and verification work.
+This script extracts code from all files in code_samples/lib/get_it/ and
+records a snapshot for future comparison and verification work. By default
+it rewrites the committed JSON baseline (phase1_original_code.json); an
+output file ending in .db is a SQLite store that keeps the history of its
+snapshots instead (see baseline_store.py).
 
 Usage:
-    python3 update_baseline.py [--output FILE]
+    python3 update_baseline.py [--output FILE] [--full] [--label TEXT] [--check [--since REF]] [--profile FILE]
+    python3 update_baseline.py --history FILE#REGION [--last N]
+    python3 update_baseline.py --snapshots [--last N]
+    python3 update_baseline.py --import JSON_FILE [--label TEXT]
 
 Options:
-    --output FILE    Output JSON file (default: phase1_original_code.json)
+    --output FILE    JSON file or baseline store (default: phase1_original_code.json)
+    --label TEXT     Name the new snapshot (also records it when nothing changed)
+    --check          Compare current regions against the baseline, exit 1 on drift
+    --since REF      With --check, only compare files changed since the git ref REF
+    --full           Re-extract every file instead of only the changed ones
+    --history FILE#REGION
+                     Show how a region changed across the last N snapshots
+    --snapshots      List the last N snapshots
+    --last N         Number of snapshots for --history and --snapshots (default: 10)
+    --import FILE    Record a JSON baseline (e.g. phase1_original_code.json) as a snapshot
+
+--history, --snapshots and --import work on the store named by --output,
+or on baseline.db when --output is a JSON file. --history and --snapshots
+only read the store and fail if it does not exist.
+    --profile FILE   Write per-phase timing, bytes read and peak memory to FILE
+
+The committed JSON baseline (phase1_original_code.json) is the source of
+truth; baseline.db is an opt-in local history store (--output baseline.db)
+and is not committed. A missing store is seeded from the JSON baseline on
+its first run, and --check falls back to the JSON baseline until the store
+exists.
+
+Only files whose size, mtime or content hash changed since the last run are
+re-extracted. The per-file fingerprints are kept in the store, or in a
+manifest next to a JSON output file (e.g. phase1_original_code.manifest.json).
 """
 
+import difflib
+import hashlib
 import json
-import re
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import sys
 
+import profiling
+from baseline_store import BaselineStore, StoreError, is_store_path
+from file_loader import iter_files
+from file_writer import write_atomic
+from git_changes import GitError, changed_files, head_commit
+from region_parser import scan_file
 
-def extract_regions_from_file(file_path: Path) -> Dict[str, str]:
-    """Extract all #region blocks from a Dart file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+# Committed JSON baseline: the default output; seeds a new store and is
+# checked when there is none
+SEED_BASELINE = "phase1_original_code.json"
 
-    regions = {}
+# Store for --history, --snapshots and --import when --output is JSON
+DEFAULT_STORE = "baseline.db"
 
-    # Find all region blocks
-    pattern = r'// #region\s+(\S+)(.*?)// #endregion'
-    matches = re.finditer(pattern, content, re.DOTALL)
+# Per-file size/mtime/hash manifest stored next to the baseline
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
 
-    for match in matches:
-        region_name = match.group(1)
-        region_content = match.group(2).strip()
-        regions[region_name] = region_content
 
-    return regions
+def extract_regions_from_file(file_path: Path, data: Optional[bytes] = None) -> Dict[str, str]:
+    """Extract all #region blocks from a Dart file (nested regions included)."""
+    with profiling.phase('extract', file_path):
+        scan = scan_file(file_path, data=data)
 
+    # A region name defined twice keeps the later body
+    return {region.name: region.body.strip() for region in scan.regions}
 
-def extract_all_code_samples(base_dir: Path) -> Dict[str, Dict[str, str]]:
-    """Extract code from all files in get_it code samples directory."""
+
+def file_fingerprint(file_path: Path, stat: os.stat_result, data: Optional[bytes] = None) -> Dict[str, object]:
+    """Return the manifest entry (size, mtime, content hash) for a file."""
+    with profiling.phase('hash', file_path):
+        if data is None:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            profiling.add_bytes(len(data))
+        digest = hashlib.sha256(data).hexdigest()
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest}
+
+
+def find_dart_files(get_it_dir: Path) -> List[Path]:
+    """Find all .dart files (excluding _shared directory) in sorted order."""
+    return sorted(
+        f for f in get_it_dir.rglob("*.dart")
+        if "_shared" not in f.parts
+    )
+
+
+def extract_changed_code_samples(
+    base_dir: Path,
+    previous: Dict[str, Dict[str, str]],
+    previous_manifest: Dict[str, Dict[str, object]],
+    verbose: bool = True,
+) -> Tuple[Dict[str, Dict[str, str]], Dict[str, Dict[str, object]], Dict[str, List[str]]]:
+    """
+    Re-extract code only from files that changed since the previous baseline.
+
+    A file is unchanged when its size and mtime match the manifest, or when
+    its content hash does. Unchanged files keep their regions from
+    `previous`; added and changed files are re-extracted. With `verbose`
+    off, per-file progress is not printed.
+
+    Returns:
+        (code_samples, manifest, changes) where changes maps 'added',
+        'changed', 'deleted' and 'unchanged' to lists of file keys
+    """
     code_samples = {}
+    manifest = {}
+    changes = {'added': [], 'changed': [], 'deleted': [], 'unchanged': []}
 
     get_it_dir = base_dir / "code_samples" / "lib" / "get_it"
 
     if not get_it_dir.exists():
         print(f"Error: Directory not found: {get_it_dir}")
-        return code_samples
+        return code_samples, manifest, changes
 
-    # Find all .dart files (excluding _shared directory)
-    dart_files = [
-        f for f in get_it_dir.rglob("*.dart")
-        if "_shared" not in f.parts
-    ]
+    dart_files = find_dart_files(get_it_dir)
+
+    if verbose:
+        print(f"Found {len(dart_files)} Dart files")
+
+    # Use relative path from get_it directory as key
+    files = []
+    for dart_file in dart_files:
+        file_key = str(dart_file.relative_to(get_it_dir))
+        try:
+            files.append((dart_file, file_key, dart_file.stat()))
+        except OSError as e:
+            print(f"  ✗ {file_key}: {e}")
 
-    print(f"Found {len(dart_files)} Dart files")
+    def stat_unchanged(file_key: str, stat: os.stat_result) -> bool:
+        entry = previous_manifest.get(file_key)
+        return entry is not None and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns
 
-    for dart_file in sorted(dart_files):
-        # Use relative path from get_it directory as key
-        rel_path = dart_file.relative_to(get_it_dir)
-        file_key = str(rel_path)
+    # Files that must be read are prefetched on a thread pool, in loop order
+    loaded_files = iter_files(dart_file for dart_file, file_key, stat in files
+                              if not stat_unchanged(file_key, stat))
+
+    for dart_file, file_key, stat in files:
+        entry = previous_manifest.get(file_key)
+        raw = None
+
+        if entry is None or not stat_unchanged(file_key, stat):
+            loaded = next(loaded_files)
+            if loaded.error is not None:
+                # Unreadable or vanished: skipped, like a file whose extraction fails
+                print(f"  ✗ {file_key}: {loaded.error}")
+                changes['changed' if entry is not None else 'added'].append(file_key)
+                continue
+            raw = loaded.read()
+
+        if entry is not None:
+            fingerprint = entry if raw is None else file_fingerprint(dart_file, stat, raw)
+            if fingerprint['sha256'] == entry['sha256']:
+                manifest[file_key] = fingerprint
+                if file_key in previous:
+                    code_samples[file_key] = previous[file_key]
+                changes['unchanged'].append(file_key)
+                continue
+            changes['changed'].append(file_key)
+        else:
+            fingerprint = file_fingerprint(dart_file, stat, raw)
+            changes['added'].append(file_key)
 
         try:
-            regions = extract_regions_from_file(dart_file)
+            regions = extract_regions_from_file(dart_file, raw)
+            manifest[file_key] = fingerprint
             if regions:
                 code_samples[file_key] = regions
-                print(f"  ✓ {file_key}: {len(regions)} regions")
-            else:
-                print(f"  ⚠ {file_key}: no regions found")
+            if verbose:
+                if regions:
+                    print(f"  ✓ {file_key}: {len(regions)} regions")
+                else:
+                    print(f"  ⚠ {file_key}: no regions found")
         except Exception as e:
             print(f"  ✗ {file_key}: {e}")
 
+    for file_key in sorted(set(previous_manifest) - set(manifest) - set(changes['changed'])):
+        changes['deleted'].append(file_key)
+        if verbose:
+            print(f"  - {file_key}: removed")
+
+    return code_samples, manifest, changes
+
+
+def extract_all_code_samples(base_dir: Path) -> Dict[str, Dict[str, str]]:
+    """Extract code from all files in get_it code samples directory."""
+    code_samples, _, _ = extract_changed_code_samples(base_dir, {}, {})
     return code_samples
 
 
-def main():
+def manifest_path_for(output_path: Path) -> Path:
+    """Return the manifest file stored next to a baseline file."""
+    return output_path.with_name(output_path.stem + MANIFEST_SUFFIX)
+
+
+def load_previous_baseline(output_path: Path) -> Tuple[Dict[str, Dict[str, str]], Dict[str, Dict[str, object]]]:
+    """
+    Load the existing baseline and its manifest.
+
+    Returns empty state (forcing a full extraction) when either file is
+    missing, unreadable, or the baseline was modified outside this tool.
+    """
+    manifest_path = manifest_path_for(output_path)
+    try:
+        with open(output_path, 'rb') as f:
+            raw = f.read()
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}, {}
+
+    if manifest.get('version') != MANIFEST_VERSION or \
+            manifest.get('baseline_sha256') != hashlib.sha256(raw).hexdigest():
+        return {}, {}
+
+    try:
+        previous = json.loads(raw.decode('utf-8'))
+    except ValueError:
+        return {}, {}
+
+    return previous, manifest.get('files', {})
+
+
+def region_fingerprint(body: str) -> str:
+    """Hash a region body with every run of whitespace collapsed."""
+    return hashlib.sha1(' '.join(body.split()).encode('utf-8')).hexdigest()
+
+
+def diff_code_samples(
+    baseline: Dict[str, Dict[str, str]],
+    current: Dict[str, Dict[str, str]],
+) -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Compare region fingerprints of the current code against the baseline.
+
+    Returns:
+        Dict mapping 'changed', 'added' and 'removed' to sorted lists of
+        (file, region) pairs
+    """
+    drift = {'changed': [], 'added': [], 'removed': []}
+
+    for file_key in sorted(set(baseline) | set(current)):
+        old_regions = baseline.get(file_key, {})
+        new_regions = current.get(file_key, {})
+
+        # Unchanged files share the same dict, so skip hashing entirely
+        if old_regions is new_regions:
+            continue
+
+        for region in sorted(set(old_regions) | set(new_regions)):
+            if region not in new_regions:
+                drift['removed'].append((file_key, region))
+            elif region not in old_regions:
+                drift['added'].append((file_key, region))
+            elif region_fingerprint(old_regions[region]) != region_fingerprint(new_regions[region]):
+                drift['changed'].append((file_key, region))
+
+    return drift
+
+
+def extract_files(base_dir: Path, baseline: Dict[str, Dict[str, str]],
+                  file_keys: List[str]) -> Dict[str, Dict[str, str]]:
+    """
+    Re-extract only `file_keys`; every other file keeps its baseline regions.
+
+    Deleted files are dropped, so their regions are reported as removed.
+    """
+    get_it_dir = base_dir / "code_samples" / "lib" / "get_it"
+    current = {key: regions for key, regions in baseline.items() if key not in set(file_keys)}
+
+    paths = [get_it_dir / file_key for file_key in file_keys]
+    paths = [path for path in paths if path.is_file() and "_shared" not in path.parts]
+    for loaded in iter_files(paths):
+        regions = extract_regions_from_file(loaded.path, loaded.read())
+        if regions:
+            current[str(loaded.path.relative_to(get_it_dir))] = regions
+
+    return current
+
+
+def changed_sample_keys(base_dir: Path, since: str) -> List[str]:
+    """Return the get_it sample files (as baseline keys) changed since a git ref."""
+    get_it_dir = base_dir / "code_samples" / "lib" / "get_it"
+    return [
+        str(path.relative_to(get_it_dir))
+        for path in changed_files(since, base_dir, [get_it_dir.relative_to(base_dir)])
+        if path.suffix == '.dart'
+    ]
+
+
+def check_baseline(base_dir: Path, output_path: Path, since: Optional[str] = None) -> int:
+    """
+    Compare the current code samples against a stored baseline.
+
+    Only regions whose normalized-whitespace hashes differ get a textual
+    diff. With `since`, only files changed since that git ref are
+    re-extracted. Returns the exit code: 0 if nothing drifted, 1 otherwise.
+    """
+    if is_store_path(output_path) and not store_has_snapshots(output_path):
+        seed_path = base_dir / SEED_BASELINE
+        print(f"{output_path.name} has no snapshots yet, checking against {seed_path.name}")
+        output_path = seed_path
+
+    if is_store_path(output_path):
+        try:
+            with BaselineStore(output_path, read_only=True) as store:
+                baseline, previous_manifest = store.load(), store.manifest()
+        except StoreError as e:
+            print(f"Error: {e}")
+            return 1
+    else:
+        baseline, previous_manifest = load_previous_baseline(output_path)
+
+    if not previous_manifest and not is_store_path(output_path):
+        # No usable manifest: compare against the baseline, re-extract everything
+        try:
+            with open(output_path, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot read baseline {output_path}: {e}")
+            return 1
+
+    if since is not None:
+        try:
+            file_keys = changed_sample_keys(base_dir, since)
+        except GitError as e:
+            print(f"Error: {e}")
+            return 1
+        print(f"Checking {len(file_keys)} files changed since {since} against {output_path.name}...")
+        current = extract_files(base_dir, baseline, file_keys)
+    else:
+        print(f"Checking code samples against {output_path.name}...")
+        current, _, _ = extract_changed_code_samples(base_dir, baseline, previous_manifest, verbose=False)
+    drift = diff_code_samples(baseline, current)
+
+    for file_key, region in drift['changed']:
+        print(f"\n~ {file_key}#{region}")
+        diff = difflib.unified_diff(
+            baseline[file_key][region].splitlines(),
+            current[file_key][region].splitlines(),
+            fromfile=f"baseline/{file_key}#{region}",
+            tofile=f"current/{file_key}#{region}",
+            lineterm='',
+        )
+        for line in diff:
+            print(f"    {line}")
+
+    for file_key, region in drift['added']:
+        print(f"\n+ {file_key}#{region} (not in baseline)")
+
+    for file_key, region in drift['removed']:
+        print(f"\n- {file_key}#{region} (missing from code samples)")
+
+    region_count = sum(len(regions) for regions in current.values())
+    print(f"\nChecked {region_count} regions in {len(current)} files: "
+          f"{len(drift['changed'])} changed, {len(drift['added'])} added, "
+          f"{len(drift['removed'])} removed")
+
+    if any(drift.values()):
+        print("❌ Code samples drifted from the baseline")
+        return 1
+
+    print("✓ Code samples match the baseline")
+    return 0
+
+
+def store_has_snapshots(output_path: Path) -> bool:
+    """True if the store exists and holds at least one snapshot (opening never creates it)."""
+    if not output_path.exists() or output_path.stat().st_size == 0:
+        return False
+    try:
+        with BaselineStore(output_path, read_only=True) as store:
+            return store.latest() is not None
+    except StoreError:
+        return True  # let the caller report the error
+
+
+def seed_store(output_path: Path, seed_path: Path):
+    """Record the JSON baseline as the first snapshot of a new store."""
+    with open(seed_path, 'r', encoding='utf-8') as f:
+        seed = json.load(f)
+    with BaselineStore(output_path) as store:
+        snapshot = store.add_snapshot(seed, label=seed_path.name)
+    print(f"Seeded {output_path.name} with {seed_path.name} as snapshot {describe_snapshot(snapshot)}\n")
+
+
+def save_snapshot(output_path: Path, code_samples: Dict[str, Dict[str, str]],
+                  manifest: Dict[str, Dict[str, object]], label: Optional[str] = None,
+                  git_commit: Optional[str] = None):
+    """Add a snapshot to the store; identical unlabelled snapshots are not repeated."""
+    with BaselineStore(output_path) as store:
+        snapshot = store.add_snapshot(code_samples, manifest, label=label, git_commit=git_commit)
+        snapshot_count = len(store.snapshots())
+
+    if snapshot is not None:
+        print(f"\n✓ Saved snapshot #{snapshot.id} with {len(code_samples)} files to {output_path.name}")
+    else:
+        print(f"\n✓ {output_path.name} is up to date ({len(code_samples)} files)")
+    print(f"  Total size: {output_path.stat().st_size / 1024:.1f} KB, {snapshot_count} snapshots")
+
+
+def describe_snapshot(snapshot) -> str:
+    """One-line summary of a snapshot: id, date, commit and label."""
+    text = f"#{snapshot.id} {snapshot.created_at}"
+    if snapshot.git_commit:
+        text += f" {snapshot.git_commit[:10]}"
+    if snapshot.label:
+        text += f" [{snapshot.label}]"
+    return text
+
+
+def print_region_history(store: BaselineStore, file_key: str, region: str, last: int):
+    """Print how one region changed across the last `last` snapshots, oldest first."""
+    history = list(reversed(store.region_history(file_key, region, last)))
+    print(f"History of {file_key}#{region} over the last {len(history)} snapshots:")
+
+    older = None
+    for i, (snapshot, body) in enumerate(history):
+        if i == 0:
+            state = f"{len(body.splitlines())} lines" if body is not None else "not present"
+        elif body == older:
+            state = "unchanged"
+        elif older is None:
+            state = "added"
+        elif body is None:
+            state = "removed"
+        else:
+            state = "changed"
+        print(f"\n  {describe_snapshot(snapshot)}: {state}")
+
+        if state == "changed":
+            diff = difflib.unified_diff(older.splitlines(), body.splitlines(),
+                                        fromfile='previous', tofile=f"#{snapshot.id}", lineterm='')
+            for line in diff:
+                print(f"      {line}")
+        older = body
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None):
     """Main entry point."""
     import argparse
 
     parser = argparse.ArgumentParser(
+        prog=prog,
         description="Update baseline code snapshot from current state"
     )
     parser.add_argument(
         '--output',
-        default='phase1_original_code.json',
-        help='Output JSON file (default: phase1_original_code.json)'
+        default=SEED_BASELINE,
+        help=f'JSON baseline, or a .db baseline store that keeps history (default: {SEED_BASELINE})'
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        '--label',
+        metavar='TEXT',
+        help='Name the new snapshot'
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Compare current regions against the baseline instead of writing it; exit 1 on drift'
+    )
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='Re-extract every file instead of only the changed ones'
+    )
+    parser.add_argument(
+        '--since',
+        metavar='REF',
+        help='With --check, only compare files changed since the git ref REF'
+    )
+    query = parser.add_mutually_exclusive_group()
+    query.add_argument(
+        '--history',
+        metavar='FILE#REGION',
+        help='Show how a region changed across the last N snapshots'
+    )
+    query.add_argument(
+        '--snapshots',
+        action='store_true',
+        help='List the last N snapshots'
+    )
+    query.add_argument(
+        '--import',
+        dest='import_json',
+        metavar='FILE',
+        help='Record a JSON baseline file as a snapshot'
+    )
+    parser.add_argument(
+        '--last',
+        type=int,
+        default=10,
+        metavar='N',
+        help='Number of snapshots for --history and --snapshots (default: 10)'
+    )
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.since and not args.check:
+        parser.error('--since requires --check')
+
+    profiling.enable_from_args(args, tool='update_baseline')
 
     # Extract code samples
     base_dir = Path(__file__).parent
+    output_path = base_dir / args.output
+
+    if args.history or args.snapshots or args.import_json:
+        if args.check:
+            parser.error('--check cannot be combined with --history, --snapshots or --import')
+        store_path = output_path if is_store_path(output_path) else base_dir / DEFAULT_STORE
+        read_only = not args.import_json
+        if read_only and not store_path.exists():
+            print(f"Error: Baseline store {store_path.name} does not exist "
+                  f"(record snapshots with --output {store_path.name})")
+            sys.exit(1)
+        try:
+            with BaselineStore(store_path, read_only=read_only) as store:
+                if args.history:
+                    file_key, sep, region = args.history.rpartition('#')
+                    if not sep:
+                        parser.error('--history expects FILE#REGION')
+                    print_region_history(store, file_key, region, args.last)
+                elif args.snapshots:
+                    for snapshot in store.snapshots(last=args.last):
+                        print(describe_snapshot(snapshot))
+                else:
+                    with open(args.import_json, 'r', encoding='utf-8') as f:
+                        snapshot = store.add_snapshot(json.load(f), label=args.label or Path(args.import_json).name)
+                    print(f"✓ Imported {args.import_json} as snapshot {describe_snapshot(snapshot)}")
+        except (StoreError, OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        sys.exit(0)
+
+    if args.check:
+        sys.exit(check_baseline(base_dir, output_path, since=args.since))
+
     print(f"Extracting code samples from {base_dir}/code_samples/lib/get_it/\n")
 
-    code_samples = extract_all_code_samples(base_dir)
+    seed_path = base_dir / SEED_BASELINE
+    if is_store_path(output_path) and not store_has_snapshots(output_path) and seed_path.exists():
+        try:
+            seed_store(output_path, seed_path)
+        except (StoreError, OSError, ValueError) as e:
+            print(f"Error: Cannot seed {output_path.name} from {seed_path.name}: {e}")
+            sys.exit(1)
+
+    if args.full:
+        previous, previous_manifest = {}, {}
+    elif is_store_path(output_path):
+        try:
+            with BaselineStore(output_path) as store:
+                previous, previous_manifest = store.load(), store.manifest()
+        except StoreError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    else:
+        previous, previous_manifest = load_previous_baseline(output_path)
+    if previous_manifest:
+        print(f"Loaded previous baseline with {len(previous_manifest)} files, re-extracting changes only")
+
+    with profiling.phase('collect'):
+        code_samples, manifest, changes = extract_changed_code_samples(base_dir, previous, previous_manifest)
 
     if not code_samples:
         print("\nError: No code samples found")
         sys.exit(1)
 
-    # Save to JSON
-    output_path = base_dir / args.output
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(code_samples, f, indent=2, ensure_ascii=False)
+    print(f"\nChanges: {len(changes['added'])} added, {len(changes['changed'])} changed, "
+          f"{len(changes['deleted'])} deleted, {len(changes['unchanged'])} unchanged")
+
+    if is_store_path(output_path):
+        with profiling.phase('write', output_path):
+            save_snapshot(output_path, code_samples, manifest, label=args.label, git_commit=head_commit(base_dir))
+        return
+
+    # Save to JSON (sorted like a full run, so incremental output is identical)
+    with profiling.phase('serialize'):
+        baseline = json.dumps(dict(sorted(code_samples.items())), indent=2, ensure_ascii=False).encode('utf-8')
+
+    with profiling.phase('write', output_path):
+        baseline_changed = not output_path.exists() or output_path.read_bytes() != baseline
+        if baseline_changed:
+            write_atomic(output_path, baseline)
+
+        manifest_data = {
+            'version': MANIFEST_VERSION,
+            'baseline_sha256': hashlib.sha256(baseline).hexdigest(),
+            'files': manifest,
+        }
+        write_atomic(manifest_path_for(output_path), json.dumps(manifest_data, indent=1).encode('utf-8'))
 
-    print(f"\n✓ Saved {len(code_samples)} files to {args.output}")
-    print(f"  Total size: {output_path.stat().st_size / 1024:.1f} KB")
+    if baseline_changed:
+        print(f"\n✓ Saved {len(code_samples)} files to {args.output}")
+    else:
+        print(f"\n✓ {args.output} is up to date ({len(code_samples)} files)")
+    print(f"  Total size: {len(baseline) / 1024:.1f} KB")
 
 
 if __name__ == '__main__':
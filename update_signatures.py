@@ -2,23 +2,46 @@
 """
 Update signature files from get_it source.
 
-This script extracts method signatures from get_it.dart and updates the
+This script extracts method signatures from the get_it sources and updates the
 corresponding signature files in the documentation code samples.
 
+Only the body of each file's `example` region is regenerated; everything
+around it (imports, stubs, `getIt` setup) is kept as written. A file without
+an `example` region is written from the template.
+
+All new file contents are generated in memory first and compared with the
+files on disk. Only files whose content differs are written, each through a
+temporary file and rename, so a run that changes nothing writes nothing and
+an interrupted run never leaves a half-written file.
+
 Usage:
-    python3 update_signatures.py [--dry-run] [--verbose]
+    python3 update_signatures.py [--dry-run] [--verbose] [--no-cache] [--profile FILE]
 
 Options:
-    --dry-run   Show what would be updated without making changes
+    --dry-run   Show a unified diff of every file that would change, without writing
     --verbose   Show detailed information about each signature
+    --no-cache  Re-parse every source file instead of using the on-disk cache
+    --profile FILE
+                Write per-phase timing, bytes read and peak memory to FILE
 """
 
-import re
+import difflib
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+import profiling
+from api_index import INDEX_CACHE_NAMESPACE, ApiIndex, build_api_index, package_lib_dir
+from file_loader import iter_files
+from file_writer import write_atomic
+from region_parser import parse_regions
+from sample_index import build_signature_index
+from signature_cache import SignatureCache
+
+# Package whose signature files this tool maintains
+PACKAGE = "get_it"
+
 
 @dataclass
 class MethodSignature:
@@ -31,127 +54,36 @@ class MethodSignature:
     comment: Optional[str] = None
 
 
-def extract_source_signatures(source_file: Path) -> Dict[str, MethodSignature]:
-    """Extract method signatures from get_it source code."""
-    if not source_file.exists():
-        print(f"Error: Source file not found: {source_file}")
-        return {}
-
-    with open(source_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
+def extract_source_signatures(index: ApiIndex, package: str) -> Dict[str, MethodSignature]:
+    """Extract public method signatures of one package from the API index."""
     signatures = {}
-    lines = content.split('\n')
-    i = 0
-
-    while i < len(lines):
-        line = lines[i]
-
-        # Look for doc comments
-        doc_comment = None
-        if line.strip().startswith('///'):
-            doc_lines = []
-            j = i
-            while j < len(lines) and lines[j].strip().startswith('///'):
-                doc_lines.append(lines[j])
-                j += 1
-            doc_comment = '\n'.join(doc_lines)
-            i = j
-            if i >= len(lines):
-                break
-            line = lines[i]
-
-        # Try to match method start
-        # Pattern: ReturnType methodName<T>(...) {
-        # Return type can include ? for nullable, and generic parameters
-        match = re.match(r'^\s*(\w+(?:<[^>]+>)?\??)\s+(\w+)(<[^>]*>)?\s*\(', line)
-        if match:
-            return_type = match.group(1)
-            method_name = match.group(2)
-            generic_params = match.group(3) or ""
-
-            # Skip private methods, constructors, and certain methods
-            if method_name.startswith('_') or method_name == 'GetIt':
-                i += 1
-                continue
-
-            # Collect full method signature across multiple lines until we hit ); or ) {
-            full_signature = line
-            j = i
-            while j < len(lines) and not re.search(r'\)\s*[;{]', full_signature):
-                j += 1
-                if j < len(lines):
-                    full_signature += '\n' + lines[j]
-
-            # Extract parameters from full signature
-            paren_start = full_signature.find('(')
-            if paren_start == -1:
-                params_text = ""
-            else:
-                paren_count = 1
-                k = paren_start + 1
-                while k < len(full_signature) and paren_count > 0:
-                    if full_signature[k] == '(':
-                        paren_count += 1
-                    elif full_signature[k] == ')':
-                        paren_count -= 1
-                    k += 1
-                params_text = full_signature[paren_start + 1:k - 1]
-
-            # Clean up the signature - remove implementation and keep only declaration
-            # First handle => expression; pattern
-            clean_sig = re.sub(r'\)\s*=>.*?;', ');', full_signature, flags=re.DOTALL)
-            # Then handle { ... } blocks
-            clean_sig = re.sub(r'\)\s*\{.*', ');', clean_sig, flags=re.DOTALL)
-            # Finally handle remaining ; patterns
-            clean_sig = re.sub(r'\)\s*;.*', ');', clean_sig, flags=re.DOTALL)
-
-            signature = MethodSignature(
-                name=method_name,
-                return_type=return_type,
-                generic_params=generic_params,
-                parameters=params_text,
-                full_signature=clean_sig.rstrip(),  # Only strip trailing whitespace
-                comment=doc_comment
-            )
-
-            signatures[method_name] = signature
-            i = j
-
-        i += 1
-
-    return signatures
 
+    for symbol in index.public_symbols(package):
+        decl = symbol.declaration
+        # The first public declaration wins (API class before extensions)
+        if decl.name in signatures:
+            continue
 
-def find_signature_files_for_method(method_name: str, sig_dir: Path) -> List[Path]:
-    """Find all signature files that might correspond to a method."""
-    candidates = []
-
-    # Look for files that might contain this method
-    for sig_file in sig_dir.glob("*_signature.dart"):
-        with open(sig_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            # Check if method name appears in the file
-            if re.search(rf'\b{method_name}\b', content):
-                candidates.append(sig_file)
-
-    return candidates
-
-
-def update_signature_file(sig_file: Path, signature: MethodSignature, dry_run: bool = False) -> bool:
-    """Update a signature file with the new signature."""
-
-    # Generate the new content
-    lines = []
-    lines.append("// ignore_for_file: missing_function_body, unused_element")
+        # Keep the declaration as written (from the start of its line up to
+        # the closing parenthesis) and drop the implementation
+        content = index.source_text(symbol.file)
+        line_start = content.rfind('\n', 0, decl.start) + 1
+        full_signature = content[line_start:decl.params_end] + ';'
+
+        signatures[decl.name] = MethodSignature(
+            name=decl.name,
+            return_type=decl.return_type,
+            generic_params=decl.generic_params,
+            parameters=content[decl.params_start + 1:decl.params_end - 1],
+            full_signature=full_signature.rstrip(),  # Only strip trailing whitespace
+            comment=decl.doc_comment
+        )
 
-    # Check if we need import
-    if 'GetIt' in signature.full_signature or 'ObjectRegistration' in signature.full_signature:
-        lines.append("import 'package:get_it/get_it.dart';")
-        lines.append("")
+    return signatures
 
-    lines.append("// #region example")
 
+def render_signature_region(signature: MethodSignature) -> str:
+    """Generate the body of the `example` region for one method."""
     # Collect all content (signature only, skip verbose doc comments for signature files)
     all_content = []
     # Only include first line of doc comment if it's short and descriptive
@@ -172,47 +104,100 @@ def update_signature_file(sig_file: Path, signature: MethodSignature, dry_run: b
     if min_indent < float('inf'):
         all_content = [line[min_indent:] if len(line) > min_indent else line for line in all_content]
 
-    lines.extend(all_content)
-
-    lines.append("// #endregion example")
+    return '\n'.join(all_content) + '\n'
 
-    new_content = '\n'.join(lines) + '\n'
 
-    if dry_run:
-        print(f"Would update {sig_file.name}:")
-        print(new_content)
-        return False
-    else:
-        with open(sig_file, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-        return True
+def render_signature_file(signature: MethodSignature) -> str:
+    """Generate the content of a new signature file for one method."""
+    lines = []
+    lines.append("// ignore_for_file: missing_function_body, unused_element")
 
+    # Check if we need import
+    if 'GetIt' in signature.full_signature or 'ObjectRegistration' in signature.full_signature:
+        lines.append("import 'package:get_it/get_it.dart';")
+        lines.append("")
 
-def main():
+    lines.append("// #region example")
+    return '\n'.join(lines) + '\n' + render_signature_region(signature) + "// #endregion example\n"
+
+
+def update_signature_content(current: bytes, signature: MethodSignature) -> bytes:
+    """
+    Return the new content of a signature file.
+
+    Only the body of the `example` region is replaced; the file header and
+    anything after the region are kept. Files without the region (or empty,
+    i.e. missing, files) get the full template.
+    """
+    region = parse_regions(current, bodies=False).find('example')
+    if region is None:
+        return render_signature_file(signature).encode('utf-8')
+    body = render_signature_region(signature).encode('utf-8')
+    return current[:region.body_start] + body + current[region.body_end:]
+
+
+def unified_diff(sig_file: Path, old: bytes, new: bytes) -> str:
+    """Return a unified diff between the current and the generated content."""
+    return ''.join(difflib.unified_diff(
+        old.decode('utf-8').splitlines(keepends=True),
+        new.decode('utf-8').splitlines(keepends=True),
+        fromfile=f"a/{sig_file.name}",
+        tofile=f"b/{sig_file.name}",
+    ))
+
+
+def find_changed_files(planned: List[Tuple[Path, str, MethodSignature]]) -> List[Tuple[Path, str, bytes, bytes]]:
+    """
+    Regenerate the signature files in memory and compare them with the files on disk.
+
+    Returns (file, method, current bytes, new bytes) for every file whose
+    content would change.
+    """
+    changed = []
+    loaded_files = iter_files(sig_file for sig_file, _, _ in planned)
+    for (sig_file, method_name, signature), loaded in zip(planned, loaded_files):
+        with profiling.phase('read', sig_file):
+            current = b'' if isinstance(loaded.error, FileNotFoundError) else loaded.read()
+        with profiling.phase('render', sig_file):
+            new = update_signature_content(current, signature)
+        if current != new:
+            changed.append((sig_file, method_name, current, new))
+    return changed
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None):
     """Main entry point."""
     import argparse
 
-    parser = argparse.ArgumentParser(description="Update signature files from get_it source")
+    parser = argparse.ArgumentParser(prog=prog, description="Update signature files from get_it source")
     parser.add_argument('--dry-run', action='store_true', help='Show changes without applying them')
     parser.add_argument('--verbose', action='store_true', help='Show detailed information')
-    args = parser.parse_args()
+    parser.add_argument('--no-cache', action='store_true', help='Re-parse every source file, ignoring the on-disk cache')
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    profiling.enable_from_args(args, tool='update_signatures')
 
     # Paths
     base_dir = Path(__file__).parent
-    source_file = base_dir.parent / "get_it" / "lib" / "get_it.dart"
-    sig_dir = base_dir / "code_samples" / "lib" / "get_it"
+    source_dir = package_lib_dir(PACKAGE, base_dir.parent)
+    sig_dir = base_dir / "code_samples" / "lib" / PACKAGE
 
-    if not source_file.exists():
-        print(f"Error: Source file not found: {source_file}")
+    if not source_dir.exists():
+        print(f"Error: Source directory not found: {source_dir}")
         sys.exit(1)
 
     if not sig_dir.exists():
         print(f"Error: Signature directory not found: {sig_dir}")
         sys.exit(1)
 
-    # Extract signatures from source
-    print(f"Extracting signatures from {source_file}...")
-    signatures = extract_source_signatures(source_file)
+    # Index the package sources (whole lib/ tree, including part files)
+    cache = None if args.no_cache else SignatureCache(base_dir / ".signature_cache", namespace=INDEX_CACHE_NAMESPACE)
+    print(f"Indexing sources in {source_dir}...")
+    with profiling.phase('index'):
+        index = build_api_index((PACKAGE,), base_dir.parent, cache=cache)
+    with profiling.phase('extract'):
+        signatures = extract_source_signatures(index, PACKAGE)
     print(f"Found {len(signatures)} methods in source\n")
 
     if args.verbose:
@@ -221,27 +206,19 @@ def main():
             print(f"  - {name}")
         print()
 
-    # Find and update signature files
-    updated_count = 0
+    # Generate every file first; nothing is written until all contents are known
     not_found_count = 0
+    planned: List[Tuple[Path, str, MethodSignature]] = []
 
-    # Common signature file mappings (based on existing files)
-    known_mappings = {
-        'get': ['code_sample_908a2d50.dart'],
-        'maybeGet': ['code_sample_fdab4a35_signature.dart'],
-        'isRegistered': ['code_sample_3ddc0f1f_signature.dart'],
-        'unregister': ['function_example_1_signature.dart'],
-        'resetLazySingleton': ['function_example_2_signature.dart'],
-        'findFirstObjectRegistration': ['code_sample_f4194899_signature.dart'],
-        'registerSingleton': ['t_example_signature.dart'],
-        'registerSingletonAsync': ['register_singleton_async_signature.dart'],
-        'registerFactoryAsync': ['register_factory_async_signature.dart'],
-        'registerCachedFactoryAsync': ['register_cached_factory_async_signature.dart'],
-        'registerLazySingletonAsync': ['register_lazy_singleton_async_signature.dart'],
-        # Add more mappings as needed
-    }
-
-    for method_name, sig_files in known_mappings.items():
+    # Map every method declared in a signature file to that file (one read per file)
+    with profiling.phase('signature_index'):
+        sig_index = build_signature_index(sig_dir)
+
+    if args.verbose:
+        print(f"Signature files: {len(sig_index.methods_by_file)}")
+        print(f"Methods declared in signature files: {len(sig_index.files_by_method)}\n")
+
+    for method_name in sorted(sig_index.files_by_method):
         if method_name not in signatures:
             print(f"⚠️  Method '{method_name}' not found in source")
             not_found_count += 1
@@ -249,21 +226,28 @@ def main():
 
         signature = signatures[method_name]
 
-        for sig_file_name in sig_files:
-            sig_file = sig_dir / sig_file_name
-
-            if not sig_file.exists():
-                print(f"⚠️  Signature file not found: {sig_file_name}")
+        for sig_file in sig_index.files_for(method_name):
+            # Regenerating would drop the other declarations in the file
+            if len(sig_index.methods_in(sig_file)) > 1:
+                print(f"⚠️  Skipping {sig_file.name}: declares several methods")
                 continue
 
-            if update_signature_file(sig_file, signature, dry_run=args.dry_run):
-                print(f"✅ Updated: {sig_file_name} ({method_name})")
-                updated_count += 1
-            elif args.dry_run:
-                print(f"📝 Would update: {sig_file_name} ({method_name})")
+            planned.append((sig_file, method_name, signature))
+
+    changed = find_changed_files(planned)
+
+    for sig_file, method_name, current, new in changed:
+        if args.dry_run:
+            print(unified_diff(sig_file, current, new), end='')
+            print(f"📝 Would update: {sig_file.name} ({method_name})\n")
+        else:
+            with profiling.phase('write', sig_file):
+                write_atomic(sig_file, new)
+            print(f"✅ Updated: {sig_file.name} ({method_name})")
 
     print(f"\n{'DRY RUN - ' if args.dry_run else ''}Summary:")
-    print(f"  Updated: {updated_count} files")
+    print(f"  {'Would update' if args.dry_run else 'Updated'}: {len(changed)} files")
+    print(f"  Unchanged: {len(planned) - len(changed)} files")
     if not_found_count > 0:
         print(f"  Not found in source: {not_found_count} methods")
 
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Validate VitePress snippet includes in the documentation.
+
+This script scans every markdown page under docs/ (including translations
+such as docs/es/) once and builds an include graph of page -> file#region
+references from lines like:
+
+    <<< @/../code_samples/lib/get_it/disposable_example.dart#example
+
+Each reference is resolved against a region index built in one pass over
+code_samples/, so dangling or ambiguous includes are caught before the much
+slower `vitepress build`.
+
+Usage:
+    python3 validate_includes.py [--json] [--verbose]
+
+Options:
+    --json      Output results in JSON format
+    --verbose   Show include graph statistics
+"""
+
+import json
+import os
+import re
+import sys
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from region_parser import scan_file
+
+# Paths
+DOCS_DIR = Path("docs")
+SAMPLES_DIR = Path("code_samples")
+SAMPLE_SUBDIRS = ("lib", "test")
+
+# `<<< @/path/to/file.dart#region{1,3} [label]`; `@` is the VitePress source dir
+INCLUDE_RE = re.compile(r'^\s*<<<\s+(?P<path>[^\s#{\[]+)(?:#(?P<region>[^\s{\[]+))?')
+FENCE_RE = re.compile(r'^\s*(```|~~~)')
+
+
+@dataclass
+class Include:
+    """One `<<<` snippet include on a markdown page."""
+    page: str
+    line: int
+    target: str
+    region: Optional[str]
+
+
+@dataclass
+class IncludeIssue:
+    """A dangling or ambiguous include."""
+    page: str
+    line: int
+    target: str
+    region: Optional[str]
+    problem: str  # 'missing_file', 'missing_region', 'ambiguous_region'
+
+
+def include_target(path: str, page: Path, docs_dir: Path) -> str:
+    """Resolve the file path of an include; `@/` is the VitePress source dir."""
+    if path.startswith('@/'):
+        return os.path.normpath(docs_dir / path[2:])
+    return os.path.normpath(page.parent / path)
+
+
+def parse_includes(page: Path, docs_dir: Path) -> List[Include]:
+    """Return the snippet includes of one markdown page, outside code fences."""
+    includes = []
+    in_fence = False
+
+    with open(page, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            if FENCE_RE.match(line):
+                in_fence = not in_fence
+                continue
+            if in_fence or '<<<' not in line:
+                continue
+
+            match = INCLUDE_RE.match(line)
+            if not match:
+                continue
+
+            includes.append(Include(
+                page=str(page),
+                line=line_no,
+                target=include_target(match.group('path'), page, docs_dir),
+                region=match.group('region'),
+            ))
+
+    return includes
+
+
+def build_include_graph(docs_dir: Path = DOCS_DIR) -> Dict[str, List[Include]]:
+    """Scan every markdown page once and return page -> includes."""
+    graph = {}
+    for page in sorted(docs_dir.rglob("*.md")):
+        if 'node_modules' in page.parts:
+            continue
+        includes = parse_includes(page, docs_dir)
+        if includes:
+            graph[str(page)] = includes
+    return graph
+
+
+def build_region_index(samples_dir: Path = SAMPLES_DIR) -> Dict[str, Counter]:
+    """Return file path -> Counter of region names, in one pass over the samples."""
+    index = {}
+    for subdir in SAMPLE_SUBDIRS:
+        for dart_file in (samples_dir / subdir).rglob("*.dart"):
+            index[os.path.normpath(dart_file)] = scan_file(dart_file, bodies=False).names()
+    return index
+
+
+def resolve_includes(graph: Dict[str, List[Include]],
+                     region_index: Dict[str, Counter]) -> List[IncludeIssue]:
+    """Check every include against the region index."""
+    issues = []
+
+    for includes in graph.values():
+        for include in includes:
+            regions = region_index.get(include.target)
+            problem = None
+
+            if regions is None:
+                # Not a code sample (or outside code_samples/): check existence only
+                if not Path(include.target).is_file():
+                    problem = 'missing_file'
+                elif include.region is not None:
+                    regions = scan_file(Path(include.target), bodies=False).names()
+                    region_index[include.target] = regions
+
+            if problem is None and include.region is not None:
+                count = regions.get(include.region, 0)
+                if count == 0:
+                    problem = 'missing_region'
+                elif count > 1:
+                    problem = 'ambiguous_region'
+
+            if problem:
+                issues.append(IncludeIssue(
+                    page=include.page,
+                    line=include.line,
+                    target=include.target,
+                    region=include.region,
+                    problem=problem,
+                ))
+
+    return issues
+
+
+def print_report(graph: Dict[str, List[Include]], issues: List[IncludeIssue]):
+    """Print human-readable include report."""
+    include_count = sum(len(includes) for includes in graph.values())
+
+    print("\n" + "="*80)
+    print("SNIPPET INCLUDE REPORT")
+    print("="*80 + "\n")
+
+    counts = Counter(issue.problem for issue in issues)
+
+    print("SUMMARY:")
+    print(f"  ✅ {include_count - len(issues)} includes resolved")
+    print(f"  ❌ {counts['missing_file']} includes of missing files")
+    print(f"  ❌ {counts['missing_region']} includes of missing regions")
+    print(f"  ⚠️  {counts['ambiguous_region']} includes of regions defined more than once")
+    print(f"  Total: {include_count} includes on {len(graph)} pages\n")
+
+    if issues:
+        print("="*80)
+        print("❌ BROKEN INCLUDES:")
+        print("="*80)
+        for issue in issues:
+            region = f"#{issue.region}" if issue.region else ""
+            print(f"\n{issue.page}:{issue.line}")
+            print(f"  {issue.problem}: {issue.target}{region}")
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None):
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog=prog, description="Validate VitePress snippet includes in the docs")
+    parser.add_argument('--json', action='store_true', help='Output JSON format')
+    parser.add_argument('--verbose', action='store_true', help='Verbose output')
+    args = parser.parse_args(argv)
+
+    graph = build_include_graph(DOCS_DIR)
+    region_index = build_region_index(SAMPLES_DIR)
+    issues = resolve_includes(graph, region_index)
+
+    if args.verbose and not args.json:
+        targets = {include.target for includes in graph.values() for include in includes}
+        print(f"Indexed {len(region_index)} sample files")
+        print(f"Found {len(graph)} pages including {len(targets)} distinct files")
+
+    if args.json:
+        output = {
+            'pages': len(graph),
+            'includes': sum(len(includes) for includes in graph.values()),
+            'broken': len(issues),
+            'issues': [asdict(issue) for issue in issues],
+        }
+        print(json.dumps(output, indent=2))
+    else:
+        print_report(graph, issues)
+
+    sys.exit(1 if issues else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,31 +1,81 @@
 #!/usr/bin/env python3
 """
-Validate documentation signature files against actual get_it package source.
+Validate documentation signature files against the actual package sources.
 
 This script compares method signatures in documentation examples with the actual
-get_it package implementation to detect API drift and outdated documentation.
+get_it, watch_it, command_it and listen_it implementations to detect API drift
+and outdated documentation.
 
 Usage:
-    python3 validate_signatures.py [--json] [--verbose]
+    python3 validate_signatures.py [--json | --ndjson] [--verbose] [--no-cache] [--jobs N] [--watch]
+                                   [--since REF [--source-since REF]] [--source-root [LABEL=]PATH ...]
+                                   [--profile FILE [--profile-format json|chrome] [--profile-memory]]
 
 Options:
     --json      Output results in JSON format
+    --ndjson    Stream one compact JSON record per signature file as it is
+                validated, then a summary record (progress goes to stderr)
     --verbose   Show detailed comparison information
+    --no-cache  Re-parse every file instead of using the on-disk cache
+    --jobs N    Validate signature files in N worker processes (0 = one per CPU)
+    --watch     Keep running and re-validate only the files affected by each change
+                (not with --json, --ndjson or --since)
+    --since REF Only validate signature files changed since the git ref REF
+    --source-since REF
+                With --since, also re-validate the signature files of members
+                changed in the package checkouts since REF (their own git ref)
+    --source-root [LABEL=]PATH
+                Validate against this copy of a package instead of
+                ../<package>, e.g. a release in ~/.pub-cache (repeatable).
+                With several roots, every signature file is checked against
+                each of them and a method x version matrix is printed
+    --profile FILE
+                Write per-phase and per-file timing, call counts, bytes read and
+                peak memory to FILE (see profiling.py)
 """
 
+import functools
 import re
 import json
+import os
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
 from dataclasses import dataclass, asdict
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import profiling
+from api_index import (
+    INDEX_CACHE_NAMESPACE, PACKAGES, PACKAGES_DIR, ApiIndex, build_api_index,
+    index_package, package_lib_dir, scan_source_file,
+)
+from dart_scanner import SCANNER_VERSION, Declaration, scan_declarations
+from dart_types import TypeCanonicalizer, canonical_generic_params
+from file_loader import LoadedFile, iter_files
+from file_watcher import watch_changes
+from git_changes import GitError, changed_files, file_at_ref
+from line_index import LineIndex, Span
+from region_parser import parse_regions
+from sample_index import build_signature_index, declared_methods
+from signature_cache import SignatureCache
 
 # Paths
-GET_IT_SOURCE = Path("../get_it/lib/get_it.dart")
-SIGNATURE_DIR = Path("code_samples/lib/get_it")
+SAMPLES_DIR = Path("code_samples/lib")
+CACHE_DIR = Path(".signature_cache")
 
+# Bump when parsing or the cached signature format changes so cached results are invalidated
+PARSER_VERSION = f"4.{SCANNER_VERSION}"
 
-@dataclass
+# ReturnType methodName<T>( -- the start of the documented signature
+SIGNATURE_START_RE = re.compile(r'(\w+(?:<[^>]+>)?)\s+(\w+)(<[^>]*>)?\s*\(')
+
+# Flags of a parameter in the compact cache format
+_OPTIONAL = 1
+_NAMED = 2
+
+
+@dataclass(frozen=True, slots=True)
 class Parameter:
     """Represents a function parameter."""
     name: str
@@ -35,17 +85,13 @@ class Parameter:
     default_value: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MethodSignature:
     """Represents a method signature."""
     name: str
     return_type: str
     generic_params: str = ""
-    parameters: List[Parameter] = None
-
-    def __post_init__(self):
-        if self.parameters is None:
-            self.parameters = []
+    parameters: Tuple[Parameter, ...] = ()
 
     def signature_str(self) -> str:
         """Generate a comparable signature string."""
@@ -65,90 +111,96 @@ class ValidationResult:
     issues: List[str]
     signature_found: Optional[MethodSignature] = None
     signature_expected: Optional[MethodSignature] = None
+    package: Optional[str] = None
+    signature_span: Optional[Span] = None  # the signature in the signature file
+    source_span: Optional[Span] = None  # the declaration in the package source
+
+
+# Parameters are immutable, so equal ones are shared to save memory and
+# their strings are interned. Sharing is not guaranteed (the pool is
+# cleared when full), so parameters are still compared by value.
+_PARAMETER_POOL_SIZE = 65536
+_parameter_pool: Dict[Tuple, Parameter] = {}
+
+
+def make_parameter(name: str, type: str, is_optional: bool = False, is_named: bool = False,
+                   default_value: Optional[str] = None) -> Parameter:
+    """Return the shared Parameter instance for these values."""
+    key = (name, type, is_optional, is_named, default_value)
+    parameter = _parameter_pool.get(key)
+    if parameter is None:
+        parameter = Parameter(
+            name=sys.intern(name),
+            type=sys.intern(type),
+            is_optional=is_optional,
+            is_named=is_named,
+            default_value=sys.intern(default_value) if default_value is not None else None
+        )
+        if len(_parameter_pool) >= _PARAMETER_POOL_SIZE:
+            _parameter_pool.clear()
+        _parameter_pool[key] = parameter
+    return parameter
 
 
-def extract_source_signatures(source_file: Path) -> Dict[str, MethodSignature]:
-    """Extract method signatures from get_it source code."""
-    if not source_file.exists():
-        print(f"Warning: Source file not found: {source_file}")
-        return {}
-
-    with open(source_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    signatures = {}
-
-    # Pattern to match method signatures
-    # Matches: ReturnType methodName<T>(...) { or ReturnType methodName<T>(...);
-    method_pattern = r'^\s*(\w+(?:<[^>]+>)?)\s+(\w+)(<[^>]*>)?\s*\('
-
-    lines = content.split('\n')
-    i = 0
-
-    while i < len(lines):
-        line = lines[i]
+def make_signature(name: str, return_type: str, generic_params: str,
+                   parameters: Tuple[Parameter, ...]) -> MethodSignature:
+    """Build a signature with interned strings."""
+    return MethodSignature(
+        name=sys.intern(name),
+        return_type=sys.intern(return_type),
+        generic_params=sys.intern(generic_params),
+        parameters=parameters
+    )
 
-        # Try to match method start
-        match = re.match(method_pattern, line)
-        if match:
-            return_type = match.group(1)
-            method_name = match.group(2)
-            generic_params = match.group(3) or ""
 
-            # Skip private methods
-            if method_name.startswith('_'):
-                i += 1
-                continue
+def signature_to_data(signature: MethodSignature) -> list:
+    """
+    Convert a signature to compact plain data for caching:
 
-            # Collect full method signature across multiple lines until we hit ); or ) {
-            full_signature = line
-            j = i
-            while j < len(lines) and not re.search(r'\)\s*[;{]', full_signature):
-                j += 1
-                if j < len(lines):
-                    full_signature += ' ' + lines[j].strip()
-
-            # Extract parameters from full signature
-            # Find content between first ( and matching ) before ; or {
-            # Need to handle nested parentheses like DisposingFunc<T>
-            paren_start = full_signature.find('(')
-            if paren_start == -1:
-                params_text = ""
-            else:
-                paren_count = 1
-                i = paren_start + 1
-                while i < len(full_signature) and paren_count > 0:
-                    if full_signature[i] == '(':
-                        paren_count += 1
-                    elif full_signature[i] == ')':
-                        paren_count -= 1
-                    i += 1
-                params_text = full_signature[paren_start + 1:i - 1]
-
-            # Parse parameters
-            parameters = parse_parameters(params_text)
-
-            signature = MethodSignature(
-                name=method_name,
-                return_type=return_type,
-                generic_params=generic_params,
-                parameters=parameters
-            )
-
-            signatures[method_name] = signature
-            i = j  # Skip to end of this method signature
+        [name, return_type, generic_params, [[name, type, flags, default], ...]]
+    """
+    return [
+        signature.name,
+        signature.return_type,
+        signature.generic_params,
+        [
+            [p.name, p.type, (_OPTIONAL if p.is_optional else 0) | (_NAMED if p.is_named else 0), p.default_value]
+            for p in signature.parameters
+        ],
+    ]
+
+
+def signature_from_data(data: list) -> MethodSignature:
+    """Rebuild a signature from data produced by signature_to_data."""
+    name, return_type, generic_params, parameters = data
+    return make_signature(
+        name,
+        return_type,
+        generic_params,
+        tuple(
+            make_parameter(p_name, p_type, bool(flags & _OPTIONAL), bool(flags & _NAMED), default)
+            for p_name, p_type, flags, default in parameters
+        )
+    )
 
-        i += 1
 
-    return signatures
+def signature_from_declaration(decl: Declaration) -> MethodSignature:
+    """Build a comparable signature from an indexed source declaration."""
+    return make_signature(
+        decl.name,
+        decl.return_type,
+        decl.generic_params,
+        parse_parameters(decl.params_text)
+    )
 
 
-def parse_parameters(params_text: str) -> List[Parameter]:
+@profiling.profiled('parse_parameters')
+def parse_parameters(params_text: str) -> Tuple[Parameter, ...]:
     """Parse parameter list from Dart method signature."""
     parameters = []
 
     if not params_text.strip():
-        return parameters
+        return ()
 
     # Split by comma, but not within <> brackets
     parts = []
@@ -221,7 +273,7 @@ def parse_parameters(params_text: str) -> List[Parameter]:
         else:
             continue
 
-        parameters.append(Parameter(
+        parameters.append(make_parameter(
             name=param_name,
             type=param_type,
             is_optional=is_optional or is_named or default_value is not None,
@@ -229,34 +281,63 @@ def parse_parameters(params_text: str) -> List[Parameter]:
             default_value=default_value
         ))
 
-    return parameters
+    return tuple(parameters)
+
+
+def extract_signature_from_file(signature_file: Path,
+                                cache: Optional[SignatureCache] = None,
+                                raw: Optional[bytes] = None) -> Tuple[Optional[MethodSignature], Optional[Span]]:
+    """
+    Extract method signature from documentation signature file.
+
+    Returns the signature and where it is in the file. Pass `raw` when the
+    file was already read (e.g. by file_loader).
+    """
+    if raw is None:
+        with profiling.phase('read', signature_file):
+            with open(signature_file, 'rb') as f:
+                raw = f.read()
+            profiling.add_bytes(len(raw))
+
+    if cache is not None:
+        cached = cache.get(raw)
+        if cached is not None:
+            if cached['signature'] is None:
+                return None, None
+            return signature_from_data(cached['signature']), Span(str(signature_file), *cached['span'])
+
+    with profiling.phase('extract', signature_file):
+        signature, span = parse_signature_with_span(raw.decode('utf-8'), str(signature_file))
+
+    if cache is not None:
+        cache.put(raw, {
+            'signature': signature_to_data(signature) if signature else None,
+            'span': [span.line, span.column, span.end_line, span.end_column] if span else None,
+        })
 
+    return signature, span
 
-def extract_signature_from_file(signature_file: Path) -> Optional[MethodSignature]:
-    """Extract method signature from documentation signature file."""
-    with open(signature_file, 'r', encoding='utf-8') as f:
-        content = f.read()
 
+def parse_signature_with_span(content: str, file: str = '') -> Tuple[Optional[MethodSignature], Optional[Span]]:
+    """Parse the method signature of a signature file and locate it (return type to closing ')')."""
     # Extract content within #region example if it exists
-    region_match = re.search(r'// #region example(.*?)// #endregion', content, re.DOTALL)
-    if region_match:
-        content = region_match.group(1)
+    first_line = 1
+    example = parse_regions(content).find('example')
+    if example is not None:
+        content = example.body
+        first_line = example.start_line + 1
 
     # Look for method definitions (function signatures)
     # Pattern: ReturnType methodName<T>(...) followed by =>, {, or just end
-    pattern = r'(\w+(?:<[^>]+>)?)\s+(\w+)(<[^>]*>)?\s*\('
-
-    # Handle multi-line signatures - normalize whitespace
-    content_single_line = re.sub(r'\s+', ' ', content)
-
-    match = re.search(pattern, content_single_line)
+    match = SIGNATURE_START_RE.search(content)
 
     if not match:
-        return None
+        return None, None
 
-    return_type = match.group(1)
+    # Handle multi-line signatures - normalize whitespace of each part
+    return_type = _single_line(match.group(1))
     method_name = match.group(2)
-    generic_params = match.group(3) or ""
+    generic_params = _single_line(match.group(3) or "")
 
     # Extract parameters - find content between ( and )
     # Need to handle nested parentheses in types like Function(String)
@@ -264,43 +345,62 @@ def extract_signature_from_file(signature_file: Path) -> Optional[MethodSignatur
     paren_count = 1
     i = paren_start + 1
 
-    while i < len(content_single_line) and paren_count > 0:
-        if content_single_line[i] == '(':
+    while i < len(content) and paren_count > 0:
+        if content[i] == '(':
             paren_count += 1
-        elif content_single_line[i] == ')':
+        elif content[i] == ')':
             paren_count -= 1
         i += 1
 
-    params_text = content_single_line[paren_start + 1:i - 1]
+    params_text = _single_line(content[paren_start + 1:i - 1])
 
     parameters = parse_parameters(params_text)
 
-    return MethodSignature(
+    signature = make_signature(
         name=method_name,
         return_type=return_type,
         generic_params=generic_params,
         parameters=parameters
     )
+    return signature, LineIndex(content).span(file, match.start(), i, first_line)
+
+
+def _single_line(text: str) -> str:
+    return re.sub(r'\s+', ' ', text)
 
 
-def compare_signatures(doc_sig: MethodSignature, source_sig: MethodSignature) -> Tuple[str, List[str]]:
+# Canonicalizer used when no package typedefs are available
+_PLAIN_TYPES = TypeCanonicalizer()
+
+
+@profiling.profiled('compare')
+def compare_signatures(doc_sig: MethodSignature, source_sig: MethodSignature,
+                       types: Optional[TypeCanonicalizer] = None) -> Tuple[str, List[str]]:
     """
     Compare two signatures and return status and list of issues.
 
+    Types are compared by canonical form (see dart_types), so spacing,
+    parameter names inside function types and typedef aliases known to
+    `types` do not cause mismatches.
+
     Returns:
         (status, issues) where status is 'valid', 'minor_diff', or 'broken'
     """
+    # Equal signatures are valid, whatever the types
+    if doc_sig == source_sig:
+        return ('valid', [])
+
+    if types is None:
+        types = _PLAIN_TYPES
+
     issues = []
 
     # Compare return types
-    if doc_sig.return_type != source_sig.return_type:
+    if not types.same(doc_sig.return_type, source_sig.return_type):
         issues.append(f"Return type mismatch: doc='{doc_sig.return_type}' vs source='{source_sig.return_type}'")
 
     # Compare generic parameters - allow simplified versions without 'extends Object'
-    doc_generics_simplified = re.sub(r'\s*extends\s+Object', '', doc_sig.generic_params)
-    source_generics_simplified = re.sub(r'\s*extends\s+Object', '', source_sig.generic_params)
-
-    if doc_generics_simplified != source_generics_simplified:
+    if canonical_generic_params(doc_sig.generic_params) != canonical_generic_params(source_sig.generic_params):
         issues.append(f"Generic params mismatch: doc='{doc_sig.generic_params}' vs source='{source_sig.generic_params}'")
 
     # Compare parameter count
@@ -311,8 +411,11 @@ def compare_signatures(doc_sig: MethodSignature, source_sig: MethodSignature) ->
     # Compare each parameter
     minor_issues = []
     for i, (doc_param, source_param) in enumerate(zip(doc_sig.parameters, source_sig.parameters)):
+        if doc_param == source_param:
+            continue
+
         # Type mismatch is critical
-        if doc_param.type != source_param.type:
+        if not types.same(doc_param.type, source_param.type):
             issues.append(f"Param {i} type mismatch: doc='{doc_param.type}' vs source='{source_param.type}'")
 
         # Name mismatch is minor (docs might use different names for clarity)
@@ -336,66 +439,195 @@ def compare_signatures(doc_sig: MethodSignature, source_sig: MethodSignature) ->
         return ('valid', [])
 
 
-def validate_signatures(verbose: bool = False) -> List[ValidationResult]:
-    """Validate all signature files against source."""
-    results = []
+def find_signature_files(packages=PACKAGES) -> List[Tuple[str, Path]]:
+    """Return (package, signature file) pairs in a stable order."""
+    return [
+        (package, sig_file)
+        for package in packages
+        for sig_file in sorted((SAMPLES_DIR / package).glob("*_signature.dart"))
+    ]
 
-    # Extract source signatures
-    print(f"Extracting signatures from {GET_IT_SOURCE}...")
-    source_signatures = extract_source_signatures(GET_IT_SOURCE)
-    print(f"Found {len(source_signatures)} methods in source\n")
-
-    # Find all signature files
-    signature_files = sorted(SIGNATURE_DIR.glob("*_signature.dart"))
-    print(f"Found {len(signature_files)} signature files\n")
-
-    # Validate each signature file
-    for sig_file in signature_files:
-        if verbose:
-            print(f"Checking {sig_file.name}...")
-
-        # Extract signature from documentation file
-        doc_sig = extract_signature_from_file(sig_file)
-
-        if doc_sig is None:
-            results.append(ValidationResult(
-                signature_file=sig_file.name,
-                source_method=None,
-                status='broken',
-                issues=["Could not parse signature from file"]
-            ))
-            continue
-
-        # Find matching source method
-        source_sig = source_signatures.get(doc_sig.name)
-
-        if source_sig is None:
-            results.append(ValidationResult(
-                signature_file=sig_file.name,
-                source_method=doc_sig.name,
-                status='missing_source',
-                issues=[f"No method '{doc_sig.name}' found in source"],
-                signature_found=doc_sig
-            ))
-            continue
 
-        # Compare signatures
-        status, issues = compare_signatures(doc_sig, source_sig)
+def validate_file(
+    package: str,
+    sig_file: Path,
+    index: ApiIndex,
+    doc_cache: Optional[SignatureCache],
+    source_signatures: Dict[Tuple[str, str], Optional[MethodSignature]],
+    raw: Optional[bytes] = None,
+) -> ValidationResult:
+    """
+    Validate one signature file against the package index.
 
-        results.append(ValidationResult(
-            signature_file=sig_file.name,
+    `source_signatures` memoizes converted source signatures across calls.
+    """
+    # Extract signature from documentation file
+    doc_sig, doc_span = extract_signature_from_file(sig_file, cache=doc_cache, raw=raw)
+    result = check_signature(package, str(sig_file.relative_to(SAMPLES_DIR)), doc_sig, index, source_signatures)
+    result.signature_span = doc_span
+    return result
+
+
+def check_signature(
+    package: str,
+    file_label: str,
+    doc_sig: Optional[MethodSignature],
+    index: ApiIndex,
+    source_signatures: Dict[Tuple[str, str], Optional[MethodSignature]],
+) -> ValidationResult:
+    """Validate an already parsed documentation signature against `index`."""
+    if doc_sig is None:
+        return ValidationResult(
+            signature_file=file_label,
+            source_method=None,
+            status='broken',
+            issues=["Could not parse signature from file"],
+            package=package
+        )
+
+    # Find matching source method
+    key = (package, doc_sig.name)
+    symbol = index.lookup(doc_sig.name, package)
+    if key not in source_signatures:
+        source_signatures[key] = signature_from_declaration(symbol.declaration) if symbol else None
+    source_sig = source_signatures[key]
+
+    if source_sig is None:
+        return ValidationResult(
+            signature_file=file_label,
             source_method=doc_sig.name,
-            status=status,
-            issues=issues,
+            status='missing_source',
+            issues=[f"No method '{doc_sig.name}' found in source"],
             signature_found=doc_sig,
-            signature_expected=source_sig
-        ))
+            package=package
+        )
+
+    # Compare signatures
+    status, issues = compare_signatures(doc_sig, source_sig, index.type_canonicalizer(package))
+
+    return ValidationResult(
+        signature_file=file_label,
+        source_method=doc_sig.name,
+        status=status,
+        issues=issues,
+        signature_found=doc_sig,
+        signature_expected=source_sig,
+        package=package,
+        source_span=index.source_span(symbol)
+    )
+
+
+def _validate_profiled(package, loaded: LoadedFile, index, doc_cache, source_signatures) -> ValidationResult:
+    with profiling.phase('validate', loaded.path):
+        with profiling.phase('read', loaded.path):
+            raw = loaded.read()
+        return validate_file(package, loaded.path, index, doc_cache, source_signatures, raw)
+
+
+# Per-process state of --jobs workers: (index, doc cache, source signature memo)
+_worker_state = None
+
 
-        if verbose and issues:
-            for issue in issues:
-                print(f"  - {issue}")
+def _init_worker(index: ApiIndex, use_cache: bool):
+    """Receive the shared index once per worker process."""
+    global _worker_state
+    doc_cache = SignatureCache(CACHE_DIR, namespace=f"doc/{PARSER_VERSION}") if use_cache else None
+    _worker_state = (index, doc_cache, {})
 
-    return results
+
+def _validate_in_worker(item: Tuple[str, Path]) -> ValidationResult:
+    index, doc_cache, source_signatures = _worker_state
+    package, sig_file = item
+    return validate_file(package, sig_file, index, doc_cache, source_signatures)
+
+
+def validate_signatures(verbose: bool = False, use_cache: bool = True,
+                        packages=PACKAGES, index: Optional[ApiIndex] = None,
+                        jobs: int = 1,
+                        signature_files: Optional[List[Tuple[str, Path]]] = None) -> List[ValidationResult]:
+    """
+    Validate all signature files against source.
+
+    Pass an already built `index` to share it with other tools in the same run.
+    With `jobs` > 1 the signature files are spread across a process pool;
+    results are returned in the same order as a serial run.
+    """
+    return list(iter_validation_results(verbose=verbose, use_cache=use_cache,
+                                        packages=packages, index=index, jobs=jobs,
+                                        signature_files=signature_files))
+
+
+def iter_validation_results(verbose: bool = False, use_cache: bool = True,
+                            packages=PACKAGES, index: Optional[ApiIndex] = None,
+                            jobs: int = 1, log: Callable[..., None] = print,
+                            signature_files: Optional[List[Tuple[str, Path]]] = None) -> Iterator[ValidationResult]:
+    """
+    Yield validation results one signature file at a time, in a stable order.
+
+    Progress messages are passed to `log` (e.g. a print to stderr when
+    stdout carries machine-readable output). Pass `signature_files` to
+    validate a subset instead of every signature file of `packages`.
+    """
+    if signature_files is not None and not signature_files:
+        return
+
+    # Parsed files are cached by content hash, so unchanged files are not re-parsed
+    index_cache = doc_cache = None
+    if use_cache:
+        index_cache = SignatureCache(CACHE_DIR, namespace=INDEX_CACHE_NAMESPACE)
+        doc_cache = SignatureCache(CACHE_DIR, namespace=f"doc/{PARSER_VERSION}")
+
+    # Index the package sources once for all signature files
+    if index is None:
+        log(f"Indexing sources of {', '.join(packages)}...")
+        with profiling.phase('index'):
+            index = build_api_index(packages, PACKAGES_DIR, cache=index_cache)
+        file_count = sum(len(files) for files in index.files.values())
+        log(f"Found {len(index)} symbols in {file_count} source files\n")
+
+    # Find all signature files
+    if signature_files is None:
+        signature_files = find_signature_files(packages)
+        log(f"Found {len(signature_files)} signature files\n")
+
+    for package in sorted({package for package, _ in signature_files} & set(index.missing_packages)):
+        log(f"Warning: Source not found for {package}: {PACKAGES_DIR / package / 'lib'}")
+
+    if jobs > 1 and len(signature_files) > 1:
+        # The index is sent to each worker once; map() keeps input order.
+        # Work done in workers is not profiled; use --jobs 1 for per-file data.
+        for package in packages:
+            index.type_canonicalizer(package)  # build once, ship with the index
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                   initargs=(index, use_cache))
+        chunksize = max(1, len(signature_files) // (jobs * 4))
+        validated = pool.map(_validate_in_worker, signature_files, chunksize=chunksize)
+    else:
+        pool = None
+        # Source signatures are converted lazily, once per method
+        source_signatures: Dict[Tuple[str, str], Optional[MethodSignature]] = {}
+        # Signature files are prefetched on a thread pool while earlier ones are validated
+        loaded_files = iter_files(sig_file for _, sig_file in signature_files)
+        validated = (
+            _validate_profiled(package, loaded, index, doc_cache, source_signatures)
+            for (package, _), loaded in zip(signature_files, loaded_files)
+        )
+
+    try:
+        for result in validated:
+            if verbose:
+                log(f"Checking {result.signature_file}...")
+                if result.signature_expected is not None:
+                    for issue in result.issues:
+                        log(f"  - {issue}")
+            yield result
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    # All caches share one directory, so a single prune bounds its size
+    if doc_cache is not None:
+        doc_cache.prune()
 
 
 def print_report(results: List[ValidationResult]):
@@ -432,6 +664,8 @@ def print_report(results: List[ValidationResult]):
         for result in results:
             if result.status == 'broken':
                 print(f"\n{result.signature_file} (method: {result.source_method})")
+                if result.source_span is not None:
+                    print(f"  Source: {result.source_span}")
                 for issue in result.issues:
                     print(f"  - {issue}")
 
@@ -442,6 +676,8 @@ def print_report(results: List[ValidationResult]):
         for result in results:
             if result.status == 'minor_diff':
                 print(f"\n{result.signature_file} (method: {result.source_method})")
+                if result.source_span is not None:
+                    print(f"  Source: {result.source_span}")
                 for issue in result.issues:
                     print(f"  - {issue}")
 
@@ -452,24 +688,345 @@ def print_report(results: List[ValidationResult]):
         for result in results:
             if result.status == 'missing_source':
                 print(f"\n{result.signature_file}")
-                print(f"  Method '{result.source_method}' not found in get_it source")
+                print(f"  Method '{result.source_method}' not found in {result.package} source")
                 print(f"  (This might be a helper function or typedef, not an actual method)")
 
 
-def main():
-    """Main entry point."""
-    import argparse
+STATUS_ICONS = {
+    'valid': '✅',
+    'minor_diff': '⚠️ ',
+    'broken': '❌',
+    'missing_source': '📝',
+}
 
-    parser = argparse.ArgumentParser(description="Validate get_it documentation signatures")
-    parser.add_argument('--json', action='store_true', help='Output JSON format')
-    parser.add_argument('--verbose', action='store_true', help='Verbose output')
-    args = parser.parse_args()
 
-    # Validate signatures
-    results = validate_signatures(verbose=args.verbose)
+def _comparable(decl: Declaration) -> Tuple:
+    """The parts of a declaration that affect validation (not its offsets)."""
+    return (decl.name, decl.kind, decl.container, decl.return_type, decl.generic_params, decl.params_text)
 
-    # Output results
-    if args.json:
+
+def _touched_methods(old: List[Declaration], new: List[Declaration]) -> Set[str]:
+    """Names of members added, removed or changed between two scans of a file."""
+    return {key[0] for key in {_comparable(d) for d in old} ^ {_comparable(d) for d in new}}
+
+
+def changed_members(source_since: str, packages=PACKAGES,
+                    log: Callable[..., None] = print) -> Dict[str, Set[str]]:
+    """
+    Return package -> names of members added, removed or changed since a ref.
+
+    Each package checkout's `lib/` files changed since `source_since` (a ref
+    in that checkout's own history) are scanned at the ref and now.
+    """
+    members: Dict[str, Set[str]] = {}
+    for package in packages:
+        lib_dir = package_lib_dir(package, PACKAGES_DIR)
+        if not lib_dir.exists():
+            continue
+        repo = lib_dir.parent
+        for path in changed_files(source_since, repo, ['lib']):
+            if path.suffix != '.dart':
+                continue
+            old_text = file_at_ref(source_since, repo, path.relative_to(repo))
+            old = list(scan_declarations(old_text)) if old_text is not None else []
+            new = scan_source_file(path, None) if path.exists() else []
+            touched = _touched_methods(old, new)
+            log(f"{path}: {len(touched)} members changed since {source_since}")
+            members.setdefault(package, set()).update(touched)
+    return members
+
+
+def affected_signature_files(since: str, source_since: Optional[str] = None,
+                             packages=PACKAGES, log: Callable[..., None] = print) -> List[Tuple[str, Path]]:
+    """
+    Return the signature files a change set can affect, in validation order.
+
+    Signature files changed in this repository since `since` are always
+    included. With `source_since`, each package checkout's `lib/` files
+    changed since that ref are scanned at the ref and now; signature files
+    declaring an added, removed or changed member are included as well
+    (see changed_members).
+    """
+    affected: Set[Tuple[str, Path]] = set()
+    sample_dirs = {SAMPLES_DIR / package: package for package in packages}
+
+    for path in changed_files(since, Path("."), [SAMPLES_DIR]):
+        package = sample_dirs.get(path.parent)
+        if package is not None and path.name.endswith('_signature.dart') and path.exists():
+            affected.add((package, path))
+
+    if source_since is not None:
+        sig_index = build_signature_index(*sample_dirs)
+        for package, names in changed_members(source_since, packages, log).items():
+            for name in names:
+                affected.update(
+                    (package, sig_file) for sig_file in sig_index.files_for(name)
+                    if sig_file.parent == SAMPLES_DIR / package
+                )
+
+    order = {item: i for i, item in enumerate(find_signature_files(packages))}
+    return sorted(affected, key=lambda item: order.get(item, len(order)))
+
+
+def watch_signatures(verbose: bool = False, use_cache: bool = True, packages=PACKAGES, jobs: int = 1):
+    """
+    Validate once, then re-validate incrementally whenever a file changes.
+
+    The source index, signature file index and results stay in memory. A
+    changed source file is re-scanned and only the signature files declaring
+    one of its added, removed or changed members are re-validated; a changed
+    signature file is re-validated by itself. Runs until interrupted.
+    """
+    index_cache = doc_cache = None
+    if use_cache:
+        index_cache = SignatureCache(CACHE_DIR, namespace=INDEX_CACHE_NAMESPACE)
+        doc_cache = SignatureCache(CACHE_DIR, namespace=f"doc/{PARSER_VERSION}")
+
+    print(f"Indexing sources of {', '.join(packages)}...")
+    index = build_api_index(packages, PACKAGES_DIR, cache=index_cache)
+
+    results = validate_signatures(verbose=verbose, use_cache=use_cache, packages=packages,
+                                  index=index, jobs=jobs)
+    print_report(results)
+    results_by_file = {result.signature_file: result for result in results}
+
+    lib_dirs = {package: package_lib_dir(package, PACKAGES_DIR) for package in packages}
+    sample_dirs = {package: SAMPLES_DIR / package for package in packages}
+    sig_index = build_signature_index(*sample_dirs.values())
+    source_signatures: Dict[Tuple[str, str], Optional[MethodSignature]] = {}
+
+    print(f"\nWatching {len(lib_dirs) + len(sample_dirs)} directories for changes (Ctrl+C to stop)...")
+
+    for changed in watch_changes(list(lib_dirs.values()) + list(sample_dirs.values())):
+        started = time.perf_counter()
+        to_validate: Set[Tuple[str, Path]] = set()
+
+        for path in sorted(changed):
+            source_package = next((p for p, d in lib_dirs.items() if d in path.parents), None)
+            sample_package = next((p for p, d in sample_dirs.items() if path.parent == d), None)
+
+            if source_package is not None:
+                old = index.declarations_in(path)
+                new = scan_source_file(path, index_cache) if path.exists() else None
+                index.replace_file(source_package, path, new)
+                touched = _touched_methods(old, new or [])
+                print(f"\n{path}: {len(touched)} members changed")
+                for name in touched:
+                    source_signatures.pop((source_package, name), None)
+                    for sig_file in sig_index.files_for(name):
+                        if sig_file.parent == sample_dirs[source_package]:
+                            to_validate.add((source_package, sig_file))
+
+            elif sample_package is not None and path.name.endswith('_signature.dart'):
+                sig_index.remove_file(path)
+                if path.exists():
+                    with open(path, 'r', encoding='utf-8') as f:
+                        sig_index.add_file(path, declared_methods(f.read()))
+                    to_validate.add((sample_package, path))
+                    print(f"\n{path}: changed")
+                else:
+                    results_by_file.pop(str(path.relative_to(SAMPLES_DIR)), None)
+                    print(f"\n{path}: removed")
+
+        for package, sig_file in sorted(to_validate):
+            result = validate_file(package, sig_file, index, doc_cache, source_signatures)
+            results_by_file[result.signature_file] = result
+            print(f"  {STATUS_ICONS[result.status]} {result.signature_file} (method: {result.source_method})")
+            for issue in result.issues:
+                print(f"      - {issue}")
+
+        counts = {status: 0 for status in STATUS_ICONS}
+        for result in results_by_file.values():
+            counts[result.status] += 1
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"  Re-validated {len(to_validate)} signature files in {elapsed_ms:.0f} ms — "
+              f"{counts['valid']} valid, {counts['minor_diff']} minor, "
+              f"{counts['broken']} broken, {counts['missing_source']} missing source")
+
+
+@dataclass
+class SourceVersion:
+    """One copy of a package to validate against, e.g. a release in the pub cache."""
+    label: str
+    package: str
+    root: Path
+
+
+@dataclass
+class MatrixRow:
+    """Status of one signature file against every source version."""
+    signature_file: str
+    package: str
+    method: Optional[str]
+    statuses: Dict[str, str]  # version label -> status; absent for other packages
+    issues: Dict[str, List[str]]
+
+
+PUBSPEC_FIELD_RE = re.compile(r'^(name|version):\s*["\']?([^\s"\'#]+)', re.MULTILINE)
+
+
+def parse_source_root(spec: str) -> SourceVersion:
+    """
+    Parse a `[LABEL=]PATH` source root.
+
+    PATH is a package directory containing `lib/` (and usually
+    `pubspec.yaml`). The package name and default label (its version) come
+    from the pubspec; without one, the directory name is used, so pub cache
+    directories like `get_it-7.7.0` work either way.
+    """
+    label, sep, path = spec.partition('=')
+    if not sep:
+        label, path = '', spec
+    root = Path(path).expanduser()
+    if not (root / 'lib').is_dir():
+        raise ValueError(f"No lib/ directory in source root: {root}")
+
+    fields = {}
+    pubspec = root / 'pubspec.yaml'
+    if pubspec.exists():
+        fields = dict(PUBSPEC_FIELD_RE.findall(pubspec.read_text(encoding='utf-8')))
+    dir_package, _, dir_version = root.resolve().name.partition('-')
+    package = fields.get('name', dir_package)
+    if package not in PACKAGES:
+        raise ValueError(f"Source root {root} is package '{package}', expected one of {', '.join(PACKAGES)}")
+
+    return SourceVersion(label or fields.get('version') or dir_version or root.name, package, root)
+
+
+def _build_version_index(version: SourceVersion, use_cache: bool) -> ApiIndex:
+    cache = SignatureCache(CACHE_DIR, namespace=INDEX_CACHE_NAMESPACE) if use_cache else None
+    index = ApiIndex()
+    index_package(index, version.package, version.root / 'lib', cache)
+    index.type_canonicalizer(version.package)  # built in the worker, returned with the index
+    return index
+
+
+def build_version_indexes(versions: List[SourceVersion], use_cache: bool = True, jobs: int = 1) -> List[ApiIndex]:
+    """
+    Index every source version, one worker process per version.
+
+    Source files are cached by content hash, so files unchanged between
+    releases are scanned once and later runs only read the cache.
+    """
+    if jobs > 1 and len(versions) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(versions))) as pool:
+            return list(pool.map(_build_version_index, versions, [use_cache] * len(versions)))
+    return [_build_version_index(version, use_cache) for version in versions]
+
+
+def validate_matrix(versions: List[SourceVersion], use_cache: bool = True, jobs: int = 1,
+                    log: Callable[..., None] = print,
+                    signature_files: Optional[List[Tuple[str, Path]]] = None) -> List[MatrixRow]:
+    """
+    Validate every signature file against every source version.
+
+    Each documentation signature is parsed once and compared with the
+    index of each version of its package.
+    """
+    log(f"Indexing {len(versions)} source versions...")
+    with profiling.phase('index'):
+        indexes = build_version_indexes(versions, use_cache, jobs)
+    for version, index in zip(versions, indexes):
+        log(f"  {version.label}: {len(index)} symbols in {version.root}")
+
+    packages = tuple(package for package in PACKAGES if any(v.package == package for v in versions))
+    if signature_files is None:
+        signature_files = find_signature_files(packages)
+    signature_files = [(package, sig_file) for package, sig_file in signature_files if package in packages]
+    log(f"Found {len(signature_files)} signature files\n")
+
+    doc_cache = SignatureCache(CACHE_DIR, namespace=f"doc/{PARSER_VERSION}") if use_cache else None
+    # One source signature memo per version
+    memos: List[Dict[Tuple[str, str], Optional[MethodSignature]]] = [{} for _ in versions]
+
+    rows = []
+    for package, sig_file in signature_files:
+        with profiling.phase('extract', sig_file):
+            doc_sig, _ = extract_signature_from_file(sig_file, cache=doc_cache)
+        file_label = str(sig_file.relative_to(SAMPLES_DIR))
+        row = MatrixRow(file_label, package, doc_sig.name if doc_sig else None, {}, {})
+        with profiling.phase('validate', sig_file):
+            for version, index, memo in zip(versions, indexes, memos):
+                if version.package != package:
+                    continue
+                result = check_signature(package, file_label, doc_sig, index, memo)
+                row.statuses[version.label] = result.status
+                if result.issues:
+                    row.issues[version.label] = result.issues
+        rows.append(row)
+
+    if doc_cache is not None:
+        doc_cache.prune()
+    return rows
+
+
+def broken_everywhere(rows: List[MatrixRow]) -> List[MatrixRow]:
+    """Rows whose signature is broken against every version of its package."""
+    return [row for row in rows if row.statuses and all(s == 'broken' for s in row.statuses.values())]
+
+
+def _matrix_cell(status: Optional[str], width: int) -> str:
+    # Status icons are two columns wide in a terminal
+    if status is None:
+        return '-' + ' ' * (width - 1)
+    return STATUS_ICONS[status].rstrip() + ' ' * (width - 2)
+
+
+def print_matrix(versions: List[SourceVersion], rows: List[MatrixRow], verbose: bool = False):
+    """Print the method x version status matrix."""
+    print("\n" + "="*80)
+    print("SIGNATURE VERSION MATRIX")
+    print("="*80 + "\n")
+
+    print("VERSIONS:")
+    for version in versions:
+        print(f"  {version.label}: {version.package} ({version.root})")
+    print()
+
+    widths = [max(len(version.label), 2) + 2 for version in versions]
+    method_width = max([len('Method')] + [len(row.method or '?') for row in rows])
+    header = ''.join(f"{version.label:<{width}}" for version, width in zip(versions, widths))
+    print(f"  {'Method':<{method_width}}  {header}Signature file")
+    for row in rows:
+        cells = ''.join(_matrix_cell(row.statuses.get(version.label), width)
+                        for version, width in zip(versions, widths))
+        print(f"  {row.method or '?':<{method_width}}  {cells}{row.signature_file}")
+
+    print("\nSUMMARY:")
+    for version in versions:
+        statuses = [row.statuses[version.label] for row in rows if version.label in row.statuses]
+        print(f"  {version.label}: ✅ {statuses.count('valid')} valid, "
+              f"⚠️  {statuses.count('minor_diff')} minor, ❌ {statuses.count('broken')} broken, "
+              f"📝 {statuses.count('missing_source')} missing source")
+    print(f"  ❌ {len(broken_everywhere(rows))} of {len(rows)} signature files broken against every version")
+
+    if verbose:
+        for row in rows:
+            for label, issues in row.issues.items():
+                print(f"\n{row.signature_file} @ {label} (method: {row.method})")
+                for issue in issues:
+                    print(f"  - {issue}")
+
+
+def write_matrix_output(versions: List[SourceVersion], rows: List[MatrixRow], as_json: bool, verbose: bool):
+    """Print the matrix as JSON or as the human-readable report."""
+    if as_json:
+        output = {
+            'versions': [
+                {'label': v.label, 'package': v.package, 'root': str(v.root)} for v in versions
+            ],
+            'total': len(rows),
+            'broken_everywhere': len(broken_everywhere(rows)),
+            'rows': [asdict(row) for row in rows],
+        }
+        print(json.dumps(output, indent=2))
+    else:
+        print_matrix(versions, rows, verbose)
+
+
+def write_output(results: List[ValidationResult], as_json: bool):
+    """Print the results as JSON or as the human-readable report."""
+    if as_json:
         # JSON output
         output = {
             'total': len(results),
@@ -484,6 +1041,121 @@ def main():
         # Human-readable report
         print_report(results)
 
+
+def stream_ndjson(results: Iterable[ValidationResult], out: TextIO = sys.stdout) -> Dict[str, int]:
+    """
+    Write one JSON line per result as it arrives, then a summary line.
+
+    Results are not kept, so memory stays flat however many files are
+    validated. Returns the status counts.
+    """
+    counts = {'total': 0, 'valid': 0, 'minor_diff': 0, 'broken': 0, 'missing_source': 0}
+
+    for result in results:
+        counts['total'] += 1
+        counts[result.status] = counts.get(result.status, 0) + 1
+        record = {'type': 'result', **asdict(result)}
+        out.write(json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n')
+        out.flush()
+
+    out.write(json.dumps({'type': 'summary', **counts}, separators=(',', ':')) + '\n')
+    out.flush()
+    return counts
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None):
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog=prog, description="Validate flutter_it documentation signatures")
+    output_format = parser.add_mutually_exclusive_group()
+    output_format.add_argument('--json', action='store_true', help='Output JSON format')
+    output_format.add_argument('--ndjson', action='store_true',
+                               help='Stream one JSON record per file, then a summary record')
+    parser.add_argument('--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('--no-cache', action='store_true', help='Re-parse every file, ignoring the on-disk cache')
+    parser.add_argument('--jobs', type=int, metavar='N',
+                        help='Number of worker processes (0 = one per CPU, default: 1, '
+                             'or one per source version with --source-root)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and re-validate affected signature files on every change')
+    parser.add_argument('--since', metavar='REF',
+                        help='Only validate signature files changed since the git ref REF')
+    parser.add_argument('--source-since', metavar='REF',
+                        help='With --since, also validate files of members changed in the package checkouts since REF')
+    parser.add_argument('--source-root', action='append', metavar='[LABEL=]PATH',
+                        help='Validate against this package version instead of ../<package> (repeatable)')
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    profiling.enable_from_args(args, tool='validate_signatures')
+
+    cpu_count = os.cpu_count() or 1
+    jobs = cpu_count if args.jobs == 0 else (args.jobs or 1)
+    log = functools.partial(print, file=sys.stderr) if args.ndjson else print
+
+    if args.source_since and not args.since:
+        parser.error('--source-since requires --since')
+
+    if args.watch and (args.json or args.ndjson or args.since):
+        parser.error('--watch cannot be combined with --json, --ndjson or --since')
+
+    versions = None
+    if args.source_root:
+        if args.watch or args.ndjson or args.source_since:
+            parser.error('--source-root cannot be combined with --watch, --ndjson or --source-since')
+        try:
+            versions = [parse_source_root(spec) for spec in args.source_root]
+        except ValueError as e:
+            parser.error(str(e))
+        labels = [version.label for version in versions]
+        duplicates = sorted({label for label in labels if labels.count(label) > 1})
+        if duplicates:
+            parser.error(f"duplicate version label {', '.join(duplicates)}; name roots with LABEL=PATH")
+
+    signature_files = None
+    if args.since:
+        try:
+            signature_files = affected_signature_files(args.since, args.source_since, log=log)
+        except GitError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        log(f"Validating {len(signature_files)} of {len(find_signature_files())} signature files "
+            f"affected by changes since {args.since}\n")
+
+    if versions is not None:
+        # Without --jobs, build one version index per CPU
+        index_jobs = cpu_count if args.jobs is None else jobs
+        rows = validate_matrix(versions, use_cache=not args.no_cache, jobs=index_jobs,
+                               signature_files=signature_files)
+        with profiling.phase('report'):
+            write_matrix_output(versions, rows, args.json, args.verbose)
+        # Exit code: 1 if a signature matches no version at all
+        sys.exit(1 if broken_everywhere(rows) else 0)
+
+    if args.watch:
+        try:
+            watch_signatures(verbose=args.verbose, use_cache=not args.no_cache, jobs=jobs)
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    if args.ndjson:
+        # stdout carries only the records; progress messages go to stderr
+        results = iter_validation_results(verbose=args.verbose, use_cache=not args.no_cache,
+                                          jobs=jobs, log=log, signature_files=signature_files)
+        with profiling.phase('report'):
+            counts = stream_ndjson(results)
+        sys.exit(1 if counts['broken'] > 0 else 0)
+
+    # Validate signatures
+    results = validate_signatures(verbose=args.verbose, use_cache=not args.no_cache, jobs=jobs,
+                                  signature_files=signature_files)
+
+    # Output results
+    with profiling.phase('report'):
+        write_output(results, args.json)
+
     # Exit code: 0 if all valid or minor_diff, 1 if any broken
     broken_count = sum(1 for r in results if r.status == 'broken')
     sys.exit(1 if broken_count > 0 else 0)